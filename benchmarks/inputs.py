@@ -0,0 +1,585 @@
+import math
+from array import array
+from fractions import Fraction
+from random import Random
+from typing import (Any,
+                    Callable,
+                    List,
+                    Tuple)
+
+from robust.hints import (Point,
+                          Point3D,
+                          Segment)
+
+SEED = 0
+SIZE = 1000
+
+Coordinate = Callable[[Random], float]
+
+
+def _to_float_coordinate(random: Random) -> float:
+    return random.uniform(-1, 1)
+
+
+def _to_fraction_coordinate(random: Random) -> Fraction:
+    return Fraction(random.randint(-1000, 1000), random.randint(1, 1000))
+
+
+def _to_integer_coordinate(random: Random) -> int:
+    return random.randint(-10 ** 6, 10 ** 6)
+
+
+def _to_mixed_coordinate(random: Random) -> float:
+    if random.random() < 0.25:
+        return float(random.randint(-100, 100))
+    return random.uniform(-1, 1) * 2. ** random.randint(-40, 40)
+
+
+exactly_degenerate = 'exactly-degenerate'
+near_degenerate = 'near-degenerate'
+coordinates = {'floats': _to_float_coordinate,
+               'fractions': _to_fraction_coordinate,
+               'integers': _to_integer_coordinate}
+inputs_kinds = (exactly_degenerate, near_degenerate) + tuple(coordinates)
+
+
+def _to_point(random: Random, coordinate: Coordinate) -> Point:
+    return coordinate(random), coordinate(random)
+
+
+def _to_points_tuples(inputs_kind: str,
+                      points_count: int,
+                      *,
+                      seed: int = SEED,
+                      size: int = SIZE) -> List[Tuple[Point, ...]]:
+    random = Random(seed)
+    coordinate = coordinates[inputs_kind]
+    return [tuple(_to_point(random, coordinate)
+                  for _ in range(points_count))
+            for _ in range(size)]
+
+
+def _to_spatial_points_tuples(inputs_kind: str,
+                              points_count: int,
+                              *,
+                              seed: int = SEED,
+                              size: int = SIZE) -> List[Tuple[Point3D, ...]]:
+    random = Random(seed)
+    coordinate = coordinates[inputs_kind]
+    return [tuple(tuple(coordinate(random) for _ in range(3))
+                  for _ in range(points_count))
+            for _ in range(size)]
+
+
+def _shift_point(point: Point,
+                 direction: Point,
+                 scale: float) -> Point:
+    (x, y), (direction_x, direction_y) = point, direction
+    return x + scale * direction_x, y + scale * direction_y
+
+
+def _to_direction(start: Point, end: Point) -> Point:
+    (start_x, start_y), (end_x, end_y) = start, end
+    return end_x - start_x, end_y - start_y
+
+
+def _to_perpendicular_direction(start: Point, end: Point) -> Point:
+    direction_x, direction_y = _to_direction(start, end)
+    return -direction_y, direction_x
+
+
+def to_near_collinear_points_triplets(*,
+                                      seed: int = SEED,
+                                      size: int = SIZE
+                                      ) -> List[Tuple[Point, Point, Point]]:
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        start = _to_point(random, _to_float_coordinate)
+        end = _to_point(random, _to_float_coordinate)
+        result.append((start, end,
+                       _shift_point(start, _to_direction(start, end),
+                                    random.uniform(-10, 10))))
+    return result
+
+
+def to_near_right_points_triplets(*,
+                                  seed: int = SEED,
+                                  size: int = SIZE
+                                  ) -> List[Tuple[Point, Point, Point]]:
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        vertex = _to_point(random, _to_float_coordinate)
+        ray_point = _to_point(random, _to_float_coordinate)
+        result.append((ray_point, vertex,
+                       _shift_point(vertex,
+                                    _to_perpendicular_direction(vertex,
+                                                                ray_point),
+                                    random.uniform(-10, 10))))
+    return result
+
+
+def to_near_collinear_points_quadruples(*,
+                                        seed: int = SEED,
+                                        size: int = SIZE
+                                        ) -> List[Tuple[Point, Point,
+                                                        Point, Point]]:
+    return [(start, end, start, point)
+            for start, end, point in to_near_collinear_points_triplets(
+                    seed=seed,
+                    size=size)]
+
+
+def to_near_perpendicular_points_quadruples(*,
+                                            seed: int = SEED,
+                                            size: int = SIZE
+                                            ) -> List[Tuple[Point, Point,
+                                                            Point, Point]]:
+    return [(vertex, ray_point, vertex, point)
+            for ray_point, vertex, point in to_near_right_points_triplets(
+                    seed=seed,
+                    size=size)]
+
+
+def to_near_cocircular_points_quadruples(*,
+                                         seed: int = SEED,
+                                         size: int = SIZE
+                                         ) -> List[Tuple[Point, Point,
+                                                         Point, Point]]:
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        center_x, center_y = _to_point(random, _to_float_coordinate)
+        radius = random.uniform(0.1, 10)
+        result.append(tuple((center_x + radius * math.cos(angle),
+                             center_y + radius * math.sin(angle))
+                            for angle in sorted(random.uniform(-math.pi,
+                                                               math.pi)
+                                                for _ in range(4))))
+    return result
+
+
+def to_near_coplanar_points_sextuples(*,
+                                      seed: int = SEED,
+                                      size: int = SIZE
+                                      ) -> List[Tuple[Point3D, ...]]:
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        origin, first_point, second_point = [
+            tuple(_to_float_coordinate(random) for _ in range(3))
+            for _ in range(3)]
+        first_scale, second_scale = (random.uniform(-10, 10),
+                                     random.uniform(-10, 10))
+        point = tuple(origin_coordinate
+                      + first_scale * (first_coordinate - origin_coordinate)
+                      + second_scale * (second_coordinate - origin_coordinate)
+                      for origin_coordinate, first_coordinate,
+                      second_coordinate in zip(origin, first_point,
+                                               second_point))
+        result.append((point, origin, point, first_point, point,
+                       second_point))
+    return result
+
+
+def to_near_cospherical_points_quintuples(*,
+                                          seed: int = SEED,
+                                          size: int = SIZE
+                                          ) -> List[Tuple[Point3D, ...]]:
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        center = tuple(_to_float_coordinate(random) for _ in range(3))
+        radius = random.uniform(0.1, 10)
+        points = []
+        for _ in range(5):
+            direction = [random.gauss(0, 1) for _ in range(3)]
+            scale = radius / math.sqrt(sum(coordinate * coordinate
+                                           for coordinate in direction))
+            points.append(tuple(center_coordinate + scale * coordinate
+                                for center_coordinate, coordinate
+                                in zip(center, direction)))
+        result.append(tuple(points))
+    return result
+
+
+def to_near_collinear_segments_pairs(*,
+                                     seed: int = SEED,
+                                     size: int = SIZE
+                                     ) -> List[Tuple[Segment, Segment]]:
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        start = _to_point(random, _to_float_coordinate)
+        end = _to_point(random, _to_float_coordinate)
+        direction = _to_direction(start, end)
+        result.append(((start, end),
+                       (_shift_point(start, direction, random.uniform(-2, 2)),
+                        _shift_point(start, direction,
+                                     random.uniform(-2, 2)))))
+    return result
+
+
+def to_near_collinear_segments_with_points(*,
+                                           seed: int = SEED,
+                                           size: int = SIZE
+                                           ) -> List[Tuple[Segment, Point]]:
+    return [((start, end), point)
+            for start, end, point in to_near_collinear_points_triplets(
+                    seed=seed,
+                    size=size)]
+
+
+def _to_collinear_point(random: Random, slope: float) -> Point:
+    x = _to_mixed_coordinate(random)
+    return x, slope * x
+
+
+def _to_slope(random: Random) -> float:
+    return random.choice([1., -1., 2., -0.5, 4.])
+
+
+def to_collinear_points_triplets(*,
+                                 seed: int = SEED,
+                                 size: int = SIZE
+                                 ) -> List[Tuple[Point, Point, Point]]:
+    """
+    Returns triplets of points which lie exactly on lines
+    through the origin with power of two slopes,
+    but have coordinates of mixed magnitudes,
+    so their differences are mostly inexact
+    and predicates have to reach the last stage to find zero.
+    """
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        slope = _to_slope(random)
+        result.append(tuple(_to_collinear_point(random, slope)
+                            for _ in range(3)))
+    return result
+
+
+def to_collinear_points_quadruples(*,
+                                   seed: int = SEED,
+                                   size: int = SIZE
+                                   ) -> List[Tuple[Point, Point,
+                                                   Point, Point]]:
+    return [(start, end, start, point)
+            for start, end, point in to_collinear_points_triplets(seed=seed,
+                                                                  size=size)]
+
+
+def to_right_points_triplets(*,
+                             seed: int = SEED,
+                             size: int = SIZE
+                             ) -> List[Tuple[Point, Point, Point]]:
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        vertex_x, vertex_y = (_to_mixed_coordinate(random),
+                              _to_mixed_coordinate(random))
+        result.append(((_to_mixed_coordinate(random), vertex_y),
+                       (vertex_x, vertex_y),
+                       (vertex_x, _to_mixed_coordinate(random))))
+    return result
+
+
+def to_perpendicular_points_quadruples(*,
+                                       seed: int = SEED,
+                                       size: int = SIZE
+                                       ) -> List[Tuple[Point, Point,
+                                                       Point, Point]]:
+    return [(vertex, ray_point, vertex, point)
+            for ray_point, vertex, point in to_right_points_triplets(
+                    seed=seed,
+                    size=size)]
+
+
+def to_cocircular_points_quadruples(*,
+                                    seed: int = SEED,
+                                    size: int = SIZE
+                                    ) -> List[Tuple[Point, Point,
+                                                    Point, Point]]:
+    """
+    Returns corners of axis-aligned rectangles,
+    which lie exactly on their circumcircles,
+    with coordinates of mixed magnitudes.
+    """
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        min_x, max_x = sorted((_to_mixed_coordinate(random),
+                               _to_mixed_coordinate(random)))
+        min_y, max_y = sorted((_to_mixed_coordinate(random),
+                               _to_mixed_coordinate(random)))
+        result.append(((min_x, min_y), (max_x, min_y), (max_x, max_y),
+                       (min_x, max_y)))
+    return result
+
+
+def to_coplanar_points_sextuples(*,
+                                 seed: int = SEED,
+                                 size: int = SIZE
+                                 ) -> List[Tuple[Point3D, ...]]:
+    """
+    Returns points which lie exactly on the plane ``z = x``
+    with coordinates of mixed magnitudes.
+    """
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        point, origin, first_point, second_point = [
+            (x, _to_mixed_coordinate(random), x)
+            for x in (_to_mixed_coordinate(random) for _ in range(4))]
+        result.append((point, origin, point, first_point, point,
+                       second_point))
+    return result
+
+
+def to_cospherical_points_quintuples(*,
+                                     seed: int = SEED,
+                                     size: int = SIZE
+                                     ) -> List[Tuple[Point3D, ...]]:
+    """
+    Returns corners of axis-aligned boxes,
+    which lie exactly on their circumspheres,
+    with coordinates of mixed magnitudes.
+    """
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        xs, ys, zs = [(_to_mixed_coordinate(random),
+                       _to_mixed_coordinate(random))
+                      for _ in range(3)]
+        corners = [(x, y, z) for x in xs for y in ys for z in zs]
+        result.append(tuple(random.sample(corners, 5)))
+    return result
+
+
+def to_collinear_segments_pairs(*,
+                                seed: int = SEED,
+                                size: int = SIZE
+                                ) -> List[Tuple[Segment, Segment]]:
+    random = Random(seed)
+    result = []
+    for _ in range(size):
+        slope = _to_slope(random)
+        result.append(((_to_collinear_point(random, slope),
+                        _to_collinear_point(random, slope)),
+                       (_to_collinear_point(random, slope),
+                        _to_collinear_point(random, slope))))
+    return result
+
+
+def _to_grid(*,
+             seed: int = SEED,
+             size: int = SIZE) -> List[Point]:
+    random = Random(seed)
+    side = max(int(math.sqrt(size)), 2)
+    xs = [_to_mixed_coordinate(random) for _ in range(side)]
+    ys = [_to_mixed_coordinate(random) for _ in range(side)]
+    return [(x, y) for x in xs for y in ys]
+
+
+def _to_segments_pairs(points_tuples: List[Tuple[Point, ...]]
+                       ) -> List[Tuple[Segment, Segment]]:
+    return [(points_tuple[:2], points_tuple[2:])
+            for points_tuple in points_tuples]
+
+
+def _to_segments_with_points(points_tuples: List[Tuple[Point, ...]]
+                             ) -> List[Tuple[Segment, Point]]:
+    return [(points_tuple[:2], points_tuple[2])
+            for points_tuple in points_tuples]
+
+
+def _to_indexed_arguments(points_tuples: List[Tuple[Point, ...]]
+                          ) -> List[Tuple[Any, ...]]:
+    coordinates = [coordinate
+                   for points in points_tuples
+                   for point in points
+                   for coordinate in point]
+    if all(isinstance(coordinate, float) for coordinate in coordinates):
+        coordinates = array('d', coordinates)
+    result = []
+    index = 0
+    for points in points_tuples:
+        result.append((coordinates,) + tuple(range(index,
+                                                   index + len(points))))
+        index += len(points)
+    return result
+
+
+def to_orientation_arguments(inputs_kind: str
+                             ) -> List[Tuple[Point, Point, Point]]:
+    return (to_collinear_points_triplets()
+            if inputs_kind == exactly_degenerate
+            else (to_near_collinear_points_triplets()
+                  if inputs_kind == near_degenerate
+                  else _to_points_tuples(inputs_kind, 3)))
+
+
+def to_orientation_at_arguments(inputs_kind: str) -> List[Tuple[Any, ...]]:
+    return _to_indexed_arguments(to_orientation_arguments(inputs_kind))
+
+
+def to_kind_arguments(inputs_kind: str) -> List[Tuple[Point, Point, Point]]:
+    return (to_right_points_triplets()
+            if inputs_kind == exactly_degenerate
+            else (to_near_right_points_triplets()
+                  if inputs_kind == near_degenerate
+                  else _to_points_tuples(inputs_kind, 3)))
+
+
+def to_signed_area_arguments(inputs_kind: str
+                             ) -> List[Tuple[Point, Point, Point, Point]]:
+    return (to_collinear_points_quadruples()
+            if inputs_kind == exactly_degenerate
+            else (to_near_collinear_points_quadruples()
+                  if inputs_kind == near_degenerate
+                  else _to_points_tuples(inputs_kind, 4)))
+
+
+def to_signed_length_arguments(inputs_kind: str
+                               ) -> List[Tuple[Point, Point, Point, Point]]:
+    return (to_perpendicular_points_quadruples()
+            if inputs_kind == exactly_degenerate
+            else (to_near_perpendicular_points_quadruples()
+                  if inputs_kind == near_degenerate
+                  else _to_points_tuples(inputs_kind, 4)))
+
+
+def to_determinant_arguments(inputs_kind: str
+                             ) -> List[Tuple[Point, Point, Point, Point]]:
+    return (to_cocircular_points_quadruples()
+            if inputs_kind == exactly_degenerate
+            else (to_near_cocircular_points_quadruples()
+                  if inputs_kind == near_degenerate
+                  else _to_points_tuples(inputs_kind, 4)))
+
+
+def to_determinant_at_arguments(inputs_kind: str) -> List[Tuple[Any, ...]]:
+    return _to_indexed_arguments(to_determinant_arguments(inputs_kind))
+
+
+def to_signed_volume_arguments(inputs_kind: str
+                               ) -> List[Tuple[Point3D, ...]]:
+    return (to_coplanar_points_sextuples()
+            if inputs_kind == exactly_degenerate
+            else (to_near_coplanar_points_sextuples()
+                  if inputs_kind == near_degenerate
+                  else _to_spatial_points_tuples(inputs_kind, 6)))
+
+
+def to_spherical_determinant_arguments(inputs_kind: str
+                                       ) -> List[Tuple[Point3D, ...]]:
+    return (to_cospherical_points_quintuples()
+            if inputs_kind == exactly_degenerate
+            else (to_near_cospherical_points_quintuples()
+                  if inputs_kind == near_degenerate
+                  else _to_spatial_points_tuples(inputs_kind, 5)))
+
+
+def to_segments_pairs_arguments(inputs_kind: str
+                                ) -> List[Tuple[Segment, Segment]]:
+    return (to_collinear_segments_pairs()
+            if inputs_kind == exactly_degenerate
+            else (to_near_collinear_segments_pairs()
+                  if inputs_kind == near_degenerate
+                  else _to_segments_pairs(_to_points_tuples(inputs_kind,
+                                                            4))))
+
+
+def to_segment_with_point_arguments(inputs_kind: str
+                                    ) -> List[Tuple[Segment, Point]]:
+    return (_to_segments_with_points(to_collinear_points_triplets())
+            if inputs_kind == exactly_degenerate
+            else (to_near_collinear_segments_with_points()
+                  if inputs_kind == near_degenerate
+                  else _to_segments_with_points(
+                    _to_points_tuples(inputs_kind, 3))))
+
+
+def to_fixed_segment_arguments(inputs_kind: str
+                               ) -> Tuple[Segment, List[Tuple[Segment]]]:
+    segments_pairs = to_segments_pairs_arguments(inputs_kind)
+    segment, _ = segments_pairs[0]
+    return segment, [(other,) for _, other in segments_pairs]
+
+
+def to_fixed_line_arguments(inputs_kind: str
+                            ) -> Tuple[Point, Point, List[Point]]:
+    if inputs_kind == exactly_degenerate:
+        random = Random(SEED)
+        slope = _to_slope(random)
+        start, end = (_to_collinear_point(random, slope),
+                      _to_collinear_point(random, slope))
+        return start, end, [_to_collinear_point(random, slope)
+                            for _ in range(SIZE)]
+    elif inputs_kind == near_degenerate:
+        random = Random(SEED)
+        start = _to_point(random, _to_float_coordinate)
+        end = _to_point(random, _to_float_coordinate)
+        direction = _to_direction(start, end)
+        return start, end, [_shift_point(start, direction,
+                                         random.uniform(-10, 10))
+                            for _ in range(SIZE)]
+    else:
+        points = [point for point, in _to_points_tuples(inputs_kind, 1)]
+        start, end = points[:2]
+        return start, end, points
+
+
+def to_fixed_circle_arguments(inputs_kind: str
+                              ) -> Tuple[Tuple[Point, Point, Point],
+                                         List[Point]]:
+    if inputs_kind == exactly_degenerate:
+        points = _to_grid()
+        side = int(math.sqrt(len(points)))
+        return (points[0], points[side], points[side + 1]), points
+    elif inputs_kind == near_degenerate:
+        random = Random(SEED)
+        center_x, center_y = _to_point(random, _to_float_coordinate)
+        radius = random.uniform(0.1, 10)
+        points = [(center_x + radius * math.cos(angle),
+                   center_y + radius * math.sin(angle))
+                  for angle in (random.uniform(-math.pi, math.pi)
+                                for _ in range(SIZE))]
+    else:
+        points = [point for point, in _to_points_tuples(inputs_kind, 1)]
+    return tuple(points[:3]), points
+
+
+def to_summands(*,
+                seed: int = SEED,
+                size: int = SIZE) -> List[float]:
+    random = Random(seed)
+    result = [random.uniform(-1, 1) * 10 ** random.randint(-20, 20)
+              for _ in range(size // 2)]
+    result += [-value * random.choice([1, 1 + 2 ** -52]) for value in result]
+    random.shuffle(result)
+    return result
+
+
+def to_polygon_arguments(inputs_kind: str) -> List[Point]:
+    if inputs_kind == exactly_degenerate:
+        random = Random(SEED)
+        slope = _to_slope(random)
+        return [_to_collinear_point(random, slope) for _ in range(SIZE)]
+    elif inputs_kind == near_degenerate:
+        random = Random(SEED)
+        start = _to_point(random, _to_float_coordinate)
+        end = _to_point(random, _to_float_coordinate)
+        direction = _to_direction(start, end)
+        return [_shift_point(start, direction, random.uniform(-10, 10))
+                for _ in range(SIZE)]
+    else:
+        return [point for point, in _to_points_tuples(inputs_kind, 1)]
+
+
+def to_triangulation_arguments(inputs_kind: str) -> List[Point]:
+    if inputs_kind == exactly_degenerate:
+        return _to_grid()
+    _, points = to_fixed_circle_arguments(inputs_kind)
+    return points
@@ -0,0 +1,119 @@
+import sys
+from typing import (Callable,
+                    List,
+                    Tuple)
+
+import pytest
+
+from robust import cocircular
+from robust.hints import (Expansion,
+                          Point)
+from robust.parallelogram import (_composed_adjusted_signed_area,
+                                  _inlined_adjusted_signed_area)
+from robust.utils import (_composed_to_cross_product,
+                          _inlined_to_cross_product)
+from . import inputs
+from .utils import apply_all
+
+near_collinear_points_quadruples = (
+    inputs.to_near_collinear_points_quadruples())
+near_cocircular_points_quadruples = (
+    inputs.to_near_cocircular_points_quadruples())
+cocircular_points_quadruples = inputs.to_cocircular_points_quadruples()
+
+
+@pytest.mark.parametrize('implementation',
+                         [_composed_adjusted_signed_area,
+                          _inlined_adjusted_signed_area],
+                         ids=['composed', 'inlined'])
+def test_signed_area(benchmark, implementation: Callable[..., float]) -> None:
+    arguments = [_to_signed_area_arguments(points_quadruple)
+                 for points_quadruple in near_collinear_points_quadruples]
+
+    benchmark(apply_all, implementation, arguments)
+
+
+@pytest.mark.parametrize('cross_product',
+                         [_composed_to_cross_product,
+                          _inlined_to_cross_product],
+                         ids=['composed', 'inlined'])
+def test_determinant(benchmark,
+                     monkeypatch,
+                     cross_product: Callable[..., Tuple[float, ...]]) -> None:
+    monkeypatch.setattr(cocircular, 'to_cross_product', cross_product)
+    arguments = [_to_determinant_arguments(points_quadruple)
+                 for points_quadruple in near_cocircular_points_quadruples]
+
+    benchmark(apply_all, cocircular._adjusted_determinant, arguments)
+
+
+@pytest.mark.benchmark(group='determinant_compression')
+@pytest.mark.parametrize('max_uncompressed_length',
+                         [cocircular.MAX_UNCOMPRESSED_LENGTH, sys.maxsize],
+                         ids=['compressed', 'uncompressed'])
+def test_determinant_compression(benchmark,
+                                 monkeypatch,
+                                 max_uncompressed_length: int) -> None:
+    monkeypatch.setattr(cocircular, 'MAX_UNCOMPRESSED_LENGTH',
+                        max_uncompressed_length)
+    arguments = [_to_determinant_arguments(points_quadruple)
+                 for points_quadruple in cocircular_points_quadruples]
+    lengths = _to_running_lengths(monkeypatch, arguments)
+    benchmark.extra_info['mean_length'] = sum(lengths) / len(lengths)
+    benchmark.extra_info['max_length'] = max(lengths)
+
+    benchmark(apply_all, cocircular._adjusted_determinant, arguments)
+
+
+def _to_running_lengths(monkeypatch,
+                        arguments: List[Tuple[float, ...]]) -> List[int]:
+    result = []
+    sum_expansions = cocircular._sum_expansions_compressed
+
+    def sum_expansions_with_lengths(left: Expansion,
+                                    right: Expansion) -> Expansion:
+        expansion = sum_expansions(left, right)
+        result.append(len(expansion))
+        return expansion
+
+    with monkeypatch.context() as patch:
+        patch.setattr(cocircular, '_sum_expansions_compressed',
+                      sum_expansions_with_lengths)
+        apply_all(cocircular._adjusted_determinant, arguments)
+    return result
+
+
+def _to_determinant_arguments(points_quadruple: Tuple[Point, Point,
+                                                      Point, Point]
+                              ) -> Tuple[float, ...]:
+    first_point, second_point, third_point, fourth_point = points_quadruple
+    (first_x, first_y), (second_x, second_y) = first_point, second_point
+    (third_x, third_y), (fourth_x, fourth_y) = third_point, fourth_point
+    first_dx, first_dy = first_x - fourth_x, first_y - fourth_y
+    second_dx, second_dy = second_x - fourth_x, second_y - fourth_y
+    third_dx, third_dy = third_x - fourth_x, third_y - fourth_y
+    upper_bound = ((first_dx * first_dx + first_dy * first_dy)
+                   * (abs(second_dx * third_dy) + abs(third_dx * second_dy))
+                   + (second_dx * second_dx + second_dy * second_dy)
+                   * (abs(third_dx * first_dy) + abs(first_dx * third_dy))
+                   + (third_dx * third_dx + third_dy * third_dy)
+                   * (abs(first_dx * second_dy) + abs(second_dx * first_dy)))
+    return (first_x, first_y, second_x, second_y, third_x, third_y,
+            fourth_x, fourth_y, upper_bound)
+
+
+def _to_signed_area_arguments(points_quadruple: Tuple[Point, Point,
+                                                      Point, Point]
+                              ) -> Tuple[float, ...]:
+    first_start, first_end, second_start, second_end = points_quadruple
+    (first_start_x, first_start_y), (first_end_x, first_end_y) = (first_start,
+                                                                  first_end)
+    (second_start_x, second_start_y), (second_end_x, second_end_y) = (
+        second_start, second_end)
+    upper_bound = (abs((first_end_x - first_start_x)
+                       * (second_end_y - second_start_y))
+                   + abs((first_end_y - first_start_y)
+                         * (second_end_x - second_start_x)))
+    return (first_start_x, first_start_y, first_end_x, first_end_y,
+            second_start_x, second_start_y, second_end_x, second_end_y,
+            upper_bound)
@@ -0,0 +1,51 @@
+from typing import Callable
+
+import pytest
+
+from robust.angular import (kind,
+                            kind_sign,
+                            orientation,
+                            orientation_at,
+                            orientation_sign)
+from . import inputs
+from .utils import apply_all
+
+
+@pytest.mark.benchmark(group='kind')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+@pytest.mark.parametrize('function', [kind, kind_sign],
+                         ids=['kind', 'kind_sign'])
+def test_kind(benchmark,
+              function: Callable[..., int],
+              inputs_kind: str) -> None:
+    benchmark(apply_all, function, inputs.to_kind_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='orientation')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+@pytest.mark.parametrize('function', [orientation, orientation_sign],
+                         ids=['orientation', 'orientation_sign'])
+def test_orientation(benchmark,
+                     function: Callable[..., int],
+                     inputs_kind: str) -> None:
+    benchmark(apply_all, function,
+              inputs.to_orientation_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='orientation_at')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_orientation_at(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, orientation_at,
+              inputs.to_orientation_at_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='orientation_at')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_materialized_orientation(benchmark, inputs_kind: str) -> None:
+    def materialized_orientation(coordinates, *indices):
+        return orientation(*[(coordinates[2 * index],
+                              coordinates[2 * index + 1])
+                             for index in indices])
+
+    benchmark(apply_all, materialized_orientation,
+              inputs.to_orientation_at_arguments(inputs_kind))
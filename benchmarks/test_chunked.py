@@ -0,0 +1,58 @@
+from types import ModuleType
+
+import numpy as np
+import pytest
+
+from robust import (parallel,
+                    threaded)
+from . import inputs
+
+SIZE = 10000
+BACKENDS = (parallel, threaded)
+WORKERS_COUNTS = (1, 2, 4, 8)
+
+
+def to_points_arrays(points_tuples: list) -> np.ndarray:
+    return np.array(points_tuples,
+                    dtype=np.float64).swapaxes(0, 1)
+
+
+@pytest.mark.benchmark(group='chunked_orientation_many')
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('max_workers', WORKERS_COUNTS)
+def test_orientation_many(benchmark,
+                          backend: ModuleType,
+                          max_workers: int) -> None:
+    benchmark(backend.orientation_many,
+              *to_points_arrays(inputs.to_near_collinear_points_triplets(
+                      size=SIZE)),
+              chunk_size=SIZE // max(WORKERS_COUNTS),
+              max_workers=max_workers)
+
+
+@pytest.mark.benchmark(group='chunked_determinant_many')
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('max_workers', WORKERS_COUNTS)
+def test_determinant_many(benchmark,
+                          backend: ModuleType,
+                          max_workers: int) -> None:
+    benchmark(backend.determinant_many,
+              *to_points_arrays(inputs.to_near_cocircular_points_quadruples(
+                      size=SIZE)),
+              chunk_size=SIZE // max(WORKERS_COUNTS),
+              max_workers=max_workers)
+
+
+@pytest.mark.benchmark(group='chunked_segments_relationship_many')
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('max_workers', WORKERS_COUNTS)
+def test_segments_relationship_many(benchmark,
+                                    backend: ModuleType,
+                                    max_workers: int) -> None:
+    segments_pairs = np.array(
+            inputs.to_near_collinear_segments_pairs(size=SIZE),
+            dtype=np.float64)
+    benchmark(backend.segments_relationship_many,
+              segments_pairs[:, 0], segments_pairs[:, 1],
+              chunk_size=SIZE // max(WORKERS_COUNTS),
+              max_workers=max_workers)
@@ -0,0 +1,58 @@
+from functools import partial
+
+import pytest
+
+from robust.cocircular import (PreparedCircle,
+                               determinant,
+                               determinant_at,
+                               determinant_sign)
+from . import inputs
+from .utils import apply_all
+
+
+@pytest.mark.benchmark(group='determinant')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_determinant(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, determinant,
+              inputs.to_determinant_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='determinant_at')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_determinant_at(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, determinant_at,
+              inputs.to_determinant_at_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='determinant_at')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_materialized_determinant(benchmark, inputs_kind: str) -> None:
+    def materialized_determinant(coordinates, *indices):
+        return determinant(*[(coordinates[2 * index],
+                              coordinates[2 * index + 1])
+                             for index in indices])
+
+    benchmark(apply_all, materialized_determinant,
+              inputs.to_determinant_at_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='determinant_sign')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_determinant_sign(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, determinant_sign,
+              inputs.to_determinant_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='fixed_circle_determinant_sign')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_fixed_circle_determinant_sign(benchmark, inputs_kind: str) -> None:
+    circle_points, points = inputs.to_fixed_circle_arguments(inputs_kind)
+    benchmark(apply_all, partial(determinant_sign, *circle_points),
+              [(point,) for point in points])
+
+
+@pytest.mark.benchmark(group='fixed_circle_determinant_sign')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_prepared_circle_classify(benchmark, inputs_kind: str) -> None:
+    circle_points, points = inputs.to_fixed_circle_arguments(inputs_kind)
+    benchmark(PreparedCircle(*circle_points).classify, points)
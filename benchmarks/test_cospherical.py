@@ -0,0 +1,12 @@
+import pytest
+
+from robust.cospherical import determinant
+from . import inputs
+from .utils import apply_all
+
+
+@pytest.mark.benchmark(group='spherical_determinant')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_determinant(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, determinant,
+              inputs.to_spherical_determinant_arguments(inputs_kind))
@@ -0,0 +1,11 @@
+import pytest
+
+from robust.delaunay import delaunay_triangles
+from . import inputs
+
+
+@pytest.mark.benchmark(group='delaunay_triangles')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_delaunay_triangles(benchmark, inputs_kind: str) -> None:
+    benchmark(delaunay_triangles,
+              inputs.to_triangulation_arguments(inputs_kind))
@@ -0,0 +1,62 @@
+from functools import partial
+
+import pytest
+
+from robust.angular import orientation_sign
+from robust.linear import (PreparedLine,
+                           PreparedSegment,
+                           segment_contains,
+                           segments_intersections,
+                           segments_relationship)
+from . import inputs
+from .utils import apply_all
+
+
+@pytest.mark.benchmark(group='segment_contains')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_segment_contains(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, segment_contains,
+              inputs.to_segment_with_point_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='segments_intersections')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_segments_intersections(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, segments_intersections,
+              inputs.to_segments_pairs_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='segments_relationship')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_segments_relationship(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, segments_relationship,
+              inputs.to_segments_pairs_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='fixed_segment_relationship')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_fixed_segments_relationship(benchmark, inputs_kind: str) -> None:
+    segment, others = inputs.to_fixed_segment_arguments(inputs_kind)
+    benchmark(apply_all, partial(segments_relationship, segment), others)
+
+
+@pytest.mark.benchmark(group='fixed_segment_relationship')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_prepared_segment_relationship(benchmark, inputs_kind: str) -> None:
+    segment, others = inputs.to_fixed_segment_arguments(inputs_kind)
+    benchmark(apply_all, PreparedSegment(segment).relationship, others)
+
+
+@pytest.mark.benchmark(group='fixed_line_orientation')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_fixed_line_orientation(benchmark, inputs_kind: str) -> None:
+    start, end, points = inputs.to_fixed_line_arguments(inputs_kind)
+    benchmark(apply_all, partial(orientation_sign, end, start),
+              [(point,) for point in points])
+
+
+@pytest.mark.benchmark(group='fixed_line_orientation')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_prepared_line_classify(benchmark, inputs_kind: str) -> None:
+    start, end, points = inputs.to_fixed_line_arguments(inputs_kind)
+    benchmark(PreparedLine(start, end).classify, points)
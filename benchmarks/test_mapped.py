@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from robust.mapped import orientation_file
+from . import inputs
+
+SIZE = 1000000
+WINDOWS_SIZES = (1024, 16384, 65536)
+
+
+@pytest.fixture(scope='module')
+def orientation_paths(tmp_path_factory) -> list:
+    directory = tmp_path_factory.mktemp('points')
+    points_arrays = np.array(inputs._to_points_tuples('floats', 3,
+                                                      size=SIZE),
+                             dtype=np.float64).swapaxes(0, 1)
+    result = []
+    for name, points_array in zip(['first', 'vertices', 'second'],
+                                  points_arrays):
+        path = directory / name
+        points_array.tofile(str(path))
+        result.append(path)
+    return result + [directory / 'result.npy']
+
+
+@pytest.mark.benchmark(group='orientation_file')
+@pytest.mark.parametrize('window_size', WINDOWS_SIZES)
+def test_orientation_file(benchmark,
+                          orientation_paths: list,
+                          window_size: int) -> None:
+    benchmark(orientation_file, *orientation_paths,
+              window_size=window_size)
@@ -0,0 +1,12 @@
+import pytest
+
+from robust.parallelepiped import signed_volume
+from . import inputs
+from .utils import apply_all
+
+
+@pytest.mark.benchmark(group='signed_volume')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_signed_volume(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, signed_volume,
+              inputs.to_signed_volume_arguments(inputs_kind))
@@ -0,0 +1,20 @@
+import pytest
+
+from robust.parallelogram import (signed_area,
+                                  signed_area_sign)
+from . import inputs
+from .utils import apply_all
+
+
+@pytest.mark.benchmark(group='signed_area')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_signed_area(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, signed_area,
+              inputs.to_signed_area_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='signed_area_sign')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_signed_area_sign(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, signed_area_sign,
+              inputs.to_signed_area_arguments(inputs_kind))
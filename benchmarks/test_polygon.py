@@ -0,0 +1,17 @@
+import pytest
+
+from robust.polygon import (polygon_orientation,
+                            polygon_signed_area)
+from . import inputs
+
+
+@pytest.mark.benchmark(group='polygon_signed_area')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_polygon_signed_area(benchmark, inputs_kind: str) -> None:
+    benchmark(polygon_signed_area, inputs.to_polygon_arguments(inputs_kind))
+
+
+@pytest.mark.benchmark(group='polygon_orientation')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_polygon_orientation(benchmark, inputs_kind: str) -> None:
+    benchmark(polygon_orientation, inputs.to_polygon_arguments(inputs_kind))
@@ -0,0 +1,12 @@
+import pytest
+
+from robust.projection import signed_length
+from . import inputs
+from .utils import apply_all
+
+
+@pytest.mark.benchmark(group='signed_length')
+@pytest.mark.parametrize('inputs_kind', inputs.inputs_kinds)
+def test_signed_length(benchmark, inputs_kind: str) -> None:
+    benchmark(apply_all, signed_length,
+              inputs.to_signed_length_arguments(inputs_kind))
@@ -0,0 +1,94 @@
+from typing import (Any,
+                    Callable,
+                    Iterable,
+                    List,
+                    Tuple)
+
+import pytest
+
+from robust import profiling
+from robust.angular import orientation_at
+from robust.cocircular import (PreparedCircle,
+                               determinant,
+                               determinant_sign)
+from robust.cospherical import determinant as spherical_determinant
+from robust.linear import PreparedLine
+from robust.parallelepiped import signed_volume
+from robust.parallelogram import (signed_area,
+                                  signed_area_sign)
+from robust.polygon import (polygon_orientation,
+                            polygon_signed_area)
+from robust.profiling import Stage
+from . import inputs
+from .utils import apply_all
+
+
+def _to_fixed_line_calls(inputs_kind: str
+                         ) -> Tuple[Callable[..., Any],
+                                    List[Tuple[Any, ...]]]:
+    start, end, points = inputs.to_fixed_line_arguments(inputs_kind)
+    return PreparedLine(start, end).sign, [(point,) for point in points]
+
+
+def _to_fixed_circle_calls(inputs_kind: str
+                           ) -> Tuple[Callable[..., Any],
+                                      List[Tuple[Any, ...]]]:
+    circle_points, points = inputs.to_fixed_circle_arguments(inputs_kind)
+    return (PreparedCircle(*circle_points).sign,
+            [(point,) for point in points])
+
+
+calls_factories = {
+    'angular.orientation_at':
+        lambda inputs_kind: (orientation_at,
+                             inputs.to_orientation_at_arguments(inputs_kind)),
+    'cocircular.PreparedCircle.sign': _to_fixed_circle_calls,
+    'cocircular.determinant':
+        lambda inputs_kind: (determinant,
+                             inputs.to_determinant_arguments(inputs_kind)),
+    'cocircular.determinant_sign':
+        lambda inputs_kind: (determinant_sign,
+                             inputs.to_determinant_arguments(inputs_kind)),
+    'cospherical.determinant':
+        lambda inputs_kind: (spherical_determinant,
+                             inputs.to_spherical_determinant_arguments(
+                                     inputs_kind)),
+    'linear.PreparedLine.sign': _to_fixed_line_calls,
+    'parallelepiped.signed_volume':
+        lambda inputs_kind: (signed_volume,
+                             inputs.to_signed_volume_arguments(inputs_kind)),
+    'parallelogram.signed_area':
+        lambda inputs_kind: (signed_area,
+                             inputs.to_signed_area_arguments(inputs_kind)),
+    'parallelogram.signed_area_sign':
+        lambda inputs_kind: (signed_area_sign,
+                             inputs.to_signed_area_arguments(inputs_kind)),
+    'polygon.orientation':
+        lambda inputs_kind: (polygon_orientation,
+                             [(inputs.to_polygon_arguments(inputs_kind),)]),
+    'polygon.signed_area':
+        lambda inputs_kind: (polygon_signed_area,
+                             [(inputs.to_polygon_arguments(inputs_kind),)]),
+}
+#: stages which predicates can end at, all of them by default
+stages = {'polygon.orientation': (Stage.FILTER, Stage.EXPANSION),
+          'polygon.signed_area': (Stage.FILTER, Stage.EXPANSION)}
+
+
+@pytest.mark.parametrize('predicate', sorted(calls_factories))
+def test_stages(predicate: str) -> None:
+    profiling.stats.reset()
+
+    profiling.enable()
+    try:
+        for inputs_kind in inputs.inputs_kinds:
+            apply_all(*calls_factories[predicate](inputs_kind))
+    finally:
+        profiling.disable()
+
+    counts = profiling.stats[predicate]
+    assert all(counts[stage] for stage in _to_stages(predicate))
+
+
+def _to_stages(predicate: str) -> Iterable[Stage]:
+    return stages.get(predicate, tuple(Stage))
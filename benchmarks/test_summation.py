@@ -0,0 +1,15 @@
+import pytest
+
+from robust.summation import (ExactAccumulator,
+                              exact_sum)
+from . import inputs
+
+
+@pytest.mark.benchmark(group='exact_sum')
+def test_exact_sum(benchmark) -> None:
+    benchmark(exact_sum, inputs.to_summands())
+
+
+@pytest.mark.benchmark(group='exact_sum')
+def test_exact_accumulator(benchmark) -> None:
+    benchmark(ExactAccumulator, inputs.to_summands())
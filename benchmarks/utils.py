@@ -0,0 +1,10 @@
+from typing import (Any,
+                    Callable,
+                    Iterable,
+                    Tuple)
+
+
+def apply_all(function: Callable[..., Any],
+              arguments: Iterable[Tuple[Any, ...]]) -> None:
+    for arguments_ in arguments:
+        function(*arguments_)
@@ -0,0 +1,446 @@
+/* Accelerated error-free transformations for `robust.utils`.
+ *
+ * Every function here mirrors its pure-Python counterpart
+ * and handles only the case when all arguments are exactly `float`s,
+ * otherwise it defers to the pure-Python implementation
+ * passed to `accelerate` which is stored as function's `__self__`.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <float.h>
+
+#if DBL_MANT_DIG != 53
+#error "IEEE 754 binary64 floating point numbers are required."
+#endif
+
+#ifdef __clang__
+#pragma STDC FP_CONTRACT OFF
+#endif
+
+/* equals to `robust.bounds.splitter` for binary64 */
+static const double SPLITTER = 134217729.0;
+
+static inline void fast_two_sum(double left, double right, double *tail,
+                                double *head) {
+  *head = left + right;
+  double right_virtual = *head - left;
+  *tail = right - right_virtual;
+}
+
+static inline void two_sum(double left, double right, double *tail,
+                           double *head) {
+  *head = left + right;
+  double right_virtual = *head - left;
+  double left_virtual = *head - right_virtual;
+  double right_tail = right - right_virtual;
+  double left_tail = left - left_virtual;
+  *tail = left_tail + right_tail;
+}
+
+static inline void split(double value, double *low, double *high) {
+  double base = SPLITTER * value;
+  *high = base - (base - value);
+  *low = value - *high;
+}
+
+static inline void two_product_presplit(double left, double right,
+                                        double right_low, double right_high,
+                                        double *tail, double *head) {
+  *head = left * right;
+  double left_low, left_high;
+  split(left, &left_low, &left_high);
+  double first_error = *head - left_high * right_high;
+  double second_error = first_error - left_low * right_high;
+  double third_error = second_error - left_high * right_low;
+  *tail = left_low * right_low - third_error;
+}
+
+static inline void two_product(double left, double right, double *tail,
+                               double *head) {
+  double right_low, right_high;
+  split(right, &right_low, &right_high);
+  two_product_presplit(left, right, right_low, right_high, tail, head);
+}
+
+static inline double two_diff_tail(double left, double right, double head) {
+  double right_virtual = left - head;
+  double left_virtual = head + right_virtual;
+  double right_error = right_virtual - right;
+  double left_error = left - left_virtual;
+  return left_error + right_error;
+}
+
+static inline void two_diff(double left, double right, double *tail,
+                            double *head) {
+  *head = left - right;
+  *tail = two_diff_tail(left, right, *head);
+}
+
+static inline void two_one_diff(double left_tail, double left_head,
+                                double right, double *second_tail,
+                                double *first_tail, double *head) {
+  double mid_head;
+  two_diff(left_tail, right, second_tail, &mid_head);
+  two_sum(left_head, mid_head, first_tail, head);
+}
+
+static PyObject *to_floats_tuple(Py_ssize_t size, const double *values) {
+  PyObject *result = PyTuple_New(size);
+  if (!result) return NULL;
+  for (Py_ssize_t index = 0; index < size; ++index) {
+    PyObject *element = PyFloat_FromDouble(values[index]);
+    if (!element) {
+      Py_DECREF(result);
+      return NULL;
+    }
+    PyTuple_SET_ITEM(result, index, element);
+  }
+  return result;
+}
+
+static PyObject *to_floats_list(Py_ssize_t size, const double *values) {
+  PyObject *result = PyList_New(size);
+  if (!result) return NULL;
+  for (Py_ssize_t index = 0; index < size; ++index) {
+    PyObject *element = PyFloat_FromDouble(values[index]);
+    if (!element) {
+      Py_DECREF(result);
+      return NULL;
+    }
+    PyList_SET_ITEM(result, index, element);
+  }
+  return result;
+}
+
+static int are_floats(PyObject *const *args, Py_ssize_t nargs) {
+  for (Py_ssize_t index = 0; index < nargs; ++index)
+    if (!PyFloat_CheckExact(args[index])) return 0;
+  return 1;
+}
+
+/* Returns new buffer with elements of given sequence
+ * if it is a non-empty `list`/`tuple` of `float`s, `NULL` otherwise. */
+static double *to_floats_buffer(PyObject *sequence, Py_ssize_t *size) {
+  if (!PyList_CheckExact(sequence) && !PyTuple_CheckExact(sequence))
+    return NULL;
+  *size = PySequence_Fast_GET_SIZE(sequence);
+  if (!*size) return NULL;
+  PyObject **items = PySequence_Fast_ITEMS(sequence);
+  if (!are_floats(items, *size)) return NULL;
+  double *result = PyMem_New(double, *size);
+  if (!result) {
+    PyErr_NoMemory();
+    return NULL;
+  }
+  for (Py_ssize_t index = 0; index < *size; ++index)
+    result[index] = PyFloat_AS_DOUBLE(items[index]);
+  return result;
+}
+
+static PyObject *call_fallback(PyObject *fallback, PyObject *const *args,
+                               Py_ssize_t nargs, PyObject *kwnames) {
+  PyObject *positional = PyTuple_New(nargs);
+  if (!positional) return NULL;
+  for (Py_ssize_t index = 0; index < nargs; ++index) {
+    Py_INCREF(args[index]);
+    PyTuple_SET_ITEM(positional, index, args[index]);
+  }
+  PyObject *keywords = NULL;
+  if (kwnames) {
+    keywords = PyDict_New();
+    if (!keywords) {
+      Py_DECREF(positional);
+      return NULL;
+    }
+    for (Py_ssize_t index = 0; index < PyTuple_GET_SIZE(kwnames); ++index)
+      if (PyDict_SetItem(keywords, PyTuple_GET_ITEM(kwnames, index),
+                         args[nargs + index]) < 0) {
+        Py_DECREF(keywords);
+        Py_DECREF(positional);
+        return NULL;
+      }
+  }
+  PyObject *result = PyObject_Call(fallback, positional, keywords);
+  Py_XDECREF(keywords);
+  Py_DECREF(positional);
+  return result;
+}
+
+static PyObject *two_sum_(PyObject *fallback, PyObject *const *args,
+                          Py_ssize_t nargs, PyObject *kwnames) {
+  if (kwnames || nargs != 2 || !are_floats(args, nargs))
+    return call_fallback(fallback, args, nargs, kwnames);
+  double result[2];
+  two_sum(PyFloat_AS_DOUBLE(args[0]), PyFloat_AS_DOUBLE(args[1]), &result[0],
+          &result[1]);
+  return to_floats_tuple(2, result);
+}
+
+static PyObject *split_(PyObject *fallback, PyObject *const *args,
+                        Py_ssize_t nargs, PyObject *kwnames) {
+  if (kwnames || nargs != 1 || !are_floats(args, nargs))
+    return call_fallback(fallback, args, nargs, kwnames);
+  double result[2];
+  split(PyFloat_AS_DOUBLE(args[0]), &result[0], &result[1]);
+  return to_floats_tuple(2, result);
+}
+
+static PyObject *two_product_(PyObject *fallback, PyObject *const *args,
+                              Py_ssize_t nargs, PyObject *kwnames) {
+  if (kwnames || nargs != 2 || !are_floats(args, nargs))
+    return call_fallback(fallback, args, nargs, kwnames);
+  double result[2];
+  two_product(PyFloat_AS_DOUBLE(args[0]), PyFloat_AS_DOUBLE(args[1]),
+              &result[0], &result[1]);
+  return to_floats_tuple(2, result);
+}
+
+static PyObject *two_product_presplit_(PyObject *fallback,
+                                       PyObject *const *args,
+                                       Py_ssize_t nargs, PyObject *kwnames) {
+  if (kwnames || nargs != 4 || !are_floats(args, nargs))
+    return call_fallback(fallback, args, nargs, kwnames);
+  double result[2];
+  two_product_presplit(PyFloat_AS_DOUBLE(args[0]), PyFloat_AS_DOUBLE(args[1]),
+                       PyFloat_AS_DOUBLE(args[2]), PyFloat_AS_DOUBLE(args[3]),
+                       &result[0], &result[1]);
+  return to_floats_tuple(2, result);
+}
+
+static PyObject *two_two_diff_(PyObject *fallback, PyObject *const *args,
+                               Py_ssize_t nargs, PyObject *kwnames) {
+  if (kwnames || nargs != 4 || !are_floats(args, nargs))
+    return call_fallback(fallback, args, nargs, kwnames);
+  double mid_tail, mid_head, result[4];
+  two_one_diff(PyFloat_AS_DOUBLE(args[0]), PyFloat_AS_DOUBLE(args[1]),
+               PyFloat_AS_DOUBLE(args[2]), &result[0], &mid_tail, &mid_head);
+  two_one_diff(mid_tail, mid_head, PyFloat_AS_DOUBLE(args[3]), &result[1],
+               &result[2], &result[3]);
+  return to_floats_tuple(4, result);
+}
+
+static PyObject *sum_expansions_(PyObject *fallback, PyObject *const *args,
+                                 Py_ssize_t nargs, PyObject *kwnames) {
+  if (kwnames || nargs != 2)
+    return call_fallback(fallback, args, nargs, kwnames);
+  Py_ssize_t left_length, right_length;
+  double *left = to_floats_buffer(args[0], &left_length);
+  if (!left) {
+    if (PyErr_Occurred()) return NULL;
+    return call_fallback(fallback, args, nargs, kwnames);
+  }
+  double *right = to_floats_buffer(args[1], &right_length);
+  if (!right) {
+    PyMem_Free(left);
+    if (PyErr_Occurred()) return NULL;
+    return call_fallback(fallback, args, nargs, kwnames);
+  }
+  double *result = PyMem_New(double, left_length + right_length);
+  if (!result) {
+    PyMem_Free(right);
+    PyMem_Free(left);
+    return PyErr_NoMemory();
+  }
+  Py_ssize_t left_index = 0, right_index = 0, result_length = 0;
+  double left_element = left[0], right_element = right[0], accumulator,
+         tail;
+  if ((right_element > left_element) == (right_element > -left_element)) {
+    accumulator = left_element;
+    ++left_index;
+  } else {
+    accumulator = right_element;
+    ++right_index;
+  }
+  if (left_index < left_length && right_index < right_length) {
+    left_element = left[left_index];
+    right_element = right[right_index];
+    if ((right_element > left_element) == (right_element > -left_element)) {
+      fast_two_sum(left_element, accumulator, &tail, &accumulator);
+      ++left_index;
+    } else {
+      fast_two_sum(right_element, accumulator, &tail, &accumulator);
+      ++right_index;
+    }
+    if (tail) result[result_length++] = tail;
+    while (left_index < left_length && right_index < right_length) {
+      left_element = left[left_index];
+      right_element = right[right_index];
+      if ((right_element > left_element) ==
+          (right_element > -left_element)) {
+        two_sum(accumulator, left_element, &tail, &accumulator);
+        ++left_index;
+      } else {
+        two_sum(accumulator, right_element, &tail, &accumulator);
+        ++right_index;
+      }
+      if (tail) result[result_length++] = tail;
+    }
+  }
+  for (; left_index < left_length; ++left_index) {
+    two_sum(accumulator, left[left_index], &tail, &accumulator);
+    if (tail) result[result_length++] = tail;
+  }
+  for (; right_index < right_length; ++right_index) {
+    two_sum(accumulator, right[right_index], &tail, &accumulator);
+    if (tail) result[result_length++] = tail;
+  }
+  if (accumulator || !result_length) result[result_length++] = accumulator;
+  PyObject *result_list = to_floats_list(result_length, result);
+  PyMem_Free(result);
+  PyMem_Free(right);
+  PyMem_Free(left);
+  return result_list;
+}
+
+static PyObject *compress_expansion_(PyObject *fallback,
+                                     PyObject *const *args, Py_ssize_t nargs,
+                                     PyObject *kwnames) {
+  if (kwnames || nargs != 1)
+    return call_fallback(fallback, args, nargs, kwnames);
+  Py_ssize_t length;
+  double *result = to_floats_buffer(args[0], &length);
+  if (!result) {
+    if (PyErr_Occurred()) return NULL;
+    return call_fallback(fallback, args, nargs, kwnames);
+  }
+  Py_ssize_t bottom = length - 1;
+  double accumulator = result[bottom], tail;
+  for (Py_ssize_t index = bottom - 1; index >= 0; --index) {
+    double head;
+    fast_two_sum(accumulator, result[index], &tail, &head);
+    if (tail) {
+      result[bottom--] = head;
+      accumulator = tail;
+    } else
+      accumulator = head;
+  }
+  Py_ssize_t top = 0;
+  for (Py_ssize_t index = bottom + 1; index < length; ++index) {
+    fast_two_sum(result[index], accumulator, &tail, &accumulator);
+    if (tail) result[top++] = tail;
+  }
+  result[top] = accumulator;
+  PyObject *result_list = to_floats_list(top + 1, result);
+  PyMem_Free(result);
+  return result_list;
+}
+
+/* Returns new list with given expansion multiplied by presplit scalar
+ * or `NULL` without exception set if expansion is not a non-empty
+ * `list`/`tuple` of `float`s. */
+static PyObject *to_scaled_expansion(PyObject *sequence, double scalar,
+                                     double scalar_low, double scalar_high) {
+  Py_ssize_t length;
+  double *expansion = to_floats_buffer(sequence, &length);
+  if (!expansion) return NULL;
+  double *result = PyMem_New(double, 2 * length);
+  if (!result) {
+    PyMem_Free(expansion);
+    return PyErr_NoMemory();
+  }
+  double accumulator, tail;
+  two_product_presplit(expansion[0], scalar, scalar_low, scalar_high, &tail,
+                       &accumulator);
+  Py_ssize_t result_length = 0;
+  if (tail) result[result_length++] = tail;
+  for (Py_ssize_t index = 1; index < length; ++index) {
+    double product_tail, product, interim;
+    two_product_presplit(expansion[index], scalar, scalar_low, scalar_high,
+                         &product_tail, &product);
+    two_sum(accumulator, product_tail, &tail, &interim);
+    if (tail) result[result_length++] = tail;
+    fast_two_sum(product, interim, &tail, &accumulator);
+    if (tail) result[result_length++] = tail;
+  }
+  if (accumulator || !result_length) result[result_length++] = accumulator;
+  PyObject *result_list = to_floats_list(result_length, result);
+  PyMem_Free(result);
+  PyMem_Free(expansion);
+  return result_list;
+}
+
+static PyObject *scale_expansion_(PyObject *fallback, PyObject *const *args,
+                                  Py_ssize_t nargs, PyObject *kwnames) {
+  if (kwnames || nargs != 2 || !PyFloat_CheckExact(args[1]))
+    return call_fallback(fallback, args, nargs, kwnames);
+  double scalar = PyFloat_AS_DOUBLE(args[1]), scalar_low, scalar_high;
+  split(scalar, &scalar_low, &scalar_high);
+  PyObject *result =
+      to_scaled_expansion(args[0], scalar, scalar_low, scalar_high);
+  if (!result && !PyErr_Occurred())
+    return call_fallback(fallback, args, nargs, kwnames);
+  return result;
+}
+
+static PyMethodDef accelerated_functions[] = {
+    {"compress_expansion", (PyCFunction)(void (*)(void))compress_expansion_,
+     METH_FASTCALL | METH_KEYWORDS,
+     "Compresses an expansion into an equal one\n"
+     "with possibly fewer and non-adjacent components."},
+    {"scale_expansion", (PyCFunction)(void (*)(void))scale_expansion_,
+     METH_FASTCALL | METH_KEYWORDS,
+     "Multiplies an expansion by a scalar with zero components "
+     "elimination."},
+    {"split", (PyCFunction)(void (*)(void))split_,
+     METH_FASTCALL | METH_KEYWORDS,
+     "Splits a value into non-overlapping low and high halves."},
+    {"sum_expansions", (PyCFunction)(void (*)(void))sum_expansions_,
+     METH_FASTCALL | METH_KEYWORDS,
+     "Sums two expansions with zero components elimination."},
+    {"two_product", (PyCFunction)(void (*)(void))two_product_,
+     METH_FASTCALL | METH_KEYWORDS,
+     "Returns error-free product of two values as (tail, head)."},
+    {"two_product_presplit",
+     (PyCFunction)(void (*)(void))two_product_presplit_,
+     METH_FASTCALL | METH_KEYWORDS,
+     "Same as `two_product`, but with right value's halves "
+     "precomputed."},
+    {"two_sum", (PyCFunction)(void (*)(void))two_sum_,
+     METH_FASTCALL | METH_KEYWORDS,
+     "Returns error-free sum of two values as (tail, head)."},
+    {"two_two_diff", (PyCFunction)(void (*)(void))two_two_diff_,
+     METH_FASTCALL | METH_KEYWORDS,
+     "Returns error-free difference of two-component expansions "
+     "as four components."},
+    {NULL, NULL, 0, NULL}};
+
+static PyObject *accelerate(PyObject *module, PyObject *function) {
+  PyObject *name = PyObject_GetAttrString(function, "__name__");
+  if (!name) return NULL;
+  const char *raw_name = PyUnicode_AsUTF8(name);
+  if (!raw_name) {
+    Py_DECREF(name);
+    return NULL;
+  }
+  for (PyMethodDef *definition = accelerated_functions; definition->ml_name;
+       ++definition)
+    if (!strcmp(definition->ml_name, raw_name)) {
+      Py_DECREF(name);
+      PyObject *module_name = PyObject_GetAttrString(function, "__module__");
+      if (!module_name) return NULL;
+      PyObject *result = PyCFunction_NewEx(definition, function, module_name);
+      Py_DECREF(module_name);
+      return result;
+    }
+  PyErr_Format(PyExc_ValueError, "No accelerated version for %R.", name);
+  Py_DECREF(name);
+  return NULL;
+}
+
+static PyMethodDef module_methods[] = {
+    {"accelerate", accelerate, METH_O,
+     "Returns accelerated version of given pure-Python function "
+     "which falls back to it for non-`float` arguments."},
+    {NULL, NULL, 0, NULL}};
+
+static struct PyModuleDef module_definition = {
+    PyModuleDef_HEAD_INIT, "_cutils",
+    "Accelerated error-free transformations.", -1, module_methods};
+
+PyMODINIT_FUNC PyInit__cutils(void) {
+  PyObject *module = PyModule_Create(&module_definition);
+#ifdef Py_GIL_DISABLED
+  if (module) PyUnstable_Module_SetGIL(module, Py_MOD_GIL_NOT_USED);
+#endif
+  return module;
+}
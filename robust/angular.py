@@ -1,8 +1,12 @@
 from enum import (IntEnum,
                   unique)
+from numbers import Real
+from typing import Sequence
 
+from . import profiling
 from .hints import Point
-from .parallelogram import signed_area
+from .parallelogram import (_signed_area,
+                            signed_area_sign)
 from .projection import signed_length
 from .utils import to_sign
 
@@ -51,6 +55,24 @@ def kind(first_ray_point: Point,
                                       vertex, second_ray_point)))
 
 
+def kind_sign(first_ray_point: Point,
+              vertex: Point,
+              second_ray_point: Point) -> int:
+    """
+    Returns kind of angle built on given points as a plain ``int``
+    equal to the value of corresponding ``Kind`` member.
+
+    >>> kind_sign((1, 0), (0, 0), (1, 0)) == Kind.ACUTE
+    True
+    >>> kind_sign((1, 0), (0, 0), (0, 1)) == Kind.RIGHT
+    True
+    >>> kind_sign((1, 0), (0, 0), (-1, 0)) == Kind.OBTUSE
+    True
+    """
+    result = signed_length(vertex, first_ray_point, vertex, second_ray_point)
+    return (1 if result > 0 else -1) if result else 0
+
+
 def orientation(first_ray_point: Point,
                 vertex: Point,
                 second_ray_point: Point) -> Orientation:
@@ -64,5 +86,57 @@ def orientation(first_ray_point: Point,
     >>> orientation((0, 1), (0, 0), (1, 0)) is Orientation.CLOCKWISE
     True
     """
-    return Orientation(to_sign(signed_area(vertex, first_ray_point,
-                                           vertex, second_ray_point)))
+    return Orientation(signed_area_sign(vertex, first_ray_point,
+                                        vertex, second_ray_point))
+
+
+def orientation_sign(first_ray_point: Point,
+                     vertex: Point,
+                     second_ray_point: Point) -> int:
+    """
+    Returns orientation of angle built on given points as a plain ``int``
+    equal to the value of corresponding ``Orientation`` member.
+
+    >>> orientation_sign((1, 0), (0, 0), (1, 0)) == Orientation.COLLINEAR
+    True
+    >>> (orientation_sign((1, 0), (0, 0), (0, 1))
+    ...  == Orientation.COUNTERCLOCKWISE)
+    True
+    >>> orientation_sign((0, 1), (0, 0), (1, 0)) == Orientation.CLOCKWISE
+    True
+    """
+    return signed_area_sign(vertex, first_ray_point, vertex, second_ray_point)
+
+
+def orientation_at(coordinates: Sequence[Real],
+                   first_ray_index: int,
+                   vertex_index: int,
+                   second_ray_index: int) -> Orientation:
+    """
+    Returns orientation of angle built on points
+    with given indices in flat coordinates' buffer
+    (e.g. ``array('d')`` or ``memoryview`` of ``numpy`` array
+    with point ``i`` stored as ``coordinates[2 * i], coordinates[2 * i + 1]``)
+    without building points.
+
+    Same as ``orientation(first_ray_point, vertex, second_ray_point)``.
+
+    >>> from array import array
+    >>> coordinates = array('d', [0., 0., 1., 0., 0., 1.])
+    >>> orientation_at(coordinates, 1, 0, 1) is Orientation.COLLINEAR
+    True
+    >>> orientation_at(coordinates, 1, 0, 2) is Orientation.COUNTERCLOCKWISE
+    True
+    >>> orientation_at(coordinates, 2, 0, 1) is Orientation.CLOCKWISE
+    True
+    """
+    vertex_x = coordinates[2 * vertex_index]
+    vertex_y = coordinates[2 * vertex_index + 1]
+    return Orientation(to_sign(_signed_area(
+            vertex_x, vertex_y, coordinates[2 * first_ray_index],
+            coordinates[2 * first_ray_index + 1], vertex_x, vertex_y,
+            coordinates[2 * second_ray_index],
+            coordinates[2 * second_ray_index + 1], True)))
+
+
+profiling.register('angular.orientation_at', orientation_at)
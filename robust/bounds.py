@@ -1,3 +1,4 @@
+import sys
 from numbers import Real
 from typing import Tuple
 
@@ -20,6 +21,8 @@ def _to_epsilon_and_splitter() -> Tuple[Real, Real]:
 
 
 epsilon, splitter = _to_epsilon_and_splitter()
+#: smallest positive subnormal floating point number
+min_subnormal = 2 * epsilon * sys.float_info.min
 
 
 def to_determinant_error(determinant: Real) -> Real:
@@ -48,3 +51,45 @@ def to_cocircular_second_error(upper_bound: Real) -> Real:
 
 def to_cocircular_third_error(upper_bound: Real) -> Real:
     return epsilon * epsilon * (44 + 576 * epsilon) * upper_bound
+
+
+def to_prepared_cocircular_error(upper_bound: Real) -> Real:
+    return (12 + 128 * epsilon) * epsilon * upper_bound
+
+
+def to_polygon_signed_area_error(upper_bound: Real,
+                                 vertices_count: int) -> Real:
+    return (4 * vertices_count + 4) * (epsilon * upper_bound + min_subnormal)
+
+
+def to_signed_volume_first_error(upper_bound: Real) -> Real:
+    return (7 + 56 * epsilon) * epsilon * upper_bound
+
+
+def to_signed_volume_second_error(upper_bound: Real) -> Real:
+    return (3 + 28 * epsilon) * epsilon * upper_bound
+
+
+def to_signed_volume_third_error(upper_bound: Real) -> Real:
+    return (26 + 288 * epsilon) * epsilon * epsilon * upper_bound
+
+
+def to_cospherical_first_error(upper_bound: Real) -> Real:
+    return (16 + 224 * epsilon) * epsilon * upper_bound
+
+
+def to_cospherical_second_error(upper_bound: Real) -> Real:
+    return (5 + 72 * epsilon) * epsilon * upper_bound
+
+
+def to_cospherical_third_error(upper_bound: Real) -> Real:
+    return (71 + 1408 * epsilon) * epsilon * epsilon * upper_bound
+
+
+def to_cocircular_higher_order_bound(heads_upper_bound: Real,
+                                     tails_upper_bound: Real) -> Real:
+    squared_tails_upper_bound = tails_upper_bound * tails_upper_bound
+    return ((12 + 96 * epsilon) * squared_tails_upper_bound
+            * (6 * heads_upper_bound * heads_upper_bound
+               + 4 * heads_upper_bound * tails_upper_bound
+               + squared_tails_upper_bound))
@@ -0,0 +1,158 @@
+"""
+Batched versions of predicates evaluated by chunks of rows
+with a strategy of evaluating chunks (e.g. by a pool of threads or processes)
+which ``robust.threaded`` and ``robust.parallel`` are built on.
+
+Each chunk is evaluated with the serial batched predicate,
+so results are identical to the serial call.
+
+Requires ``numpy`` to be installed, e.g. with ``robust[vectorized]`` extra.
+"""
+from typing import (Callable,
+                    Optional,
+                    Tuple)
+
+import numpy as np
+
+from .vectorized import (PointsArray,
+                         SegmentsArray,
+                         SignsArray,
+                         ValuesArray,
+                         _segments_relationship_many,
+                         _to_points_arrays,
+                         _to_segments_array,
+                         determinant_many as _serial_determinant_many,
+                         orientation_many as _serial_orientation_many)
+
+#: evaluates batched function on chunks of given size of points arrays' rows
+#: with at most given number of workers (``None`` for the strategy's default)
+#: and returns array of results with given type
+ChunksEvaluator = Callable[[Callable[..., np.ndarray],
+                            Tuple[PointsArray, ...], np.dtype, int,
+                            Optional[int]],
+                           np.ndarray]
+
+
+class ChunkedPredicates:
+    """
+    Represents batched predicates which split rows in chunks
+    evaluated with given strategy.
+    """
+    __slots__ = '_chunk_size', '_evaluate_chunks'
+
+    def __init__(self,
+                 evaluate_chunks: ChunksEvaluator,
+                 chunk_size: int) -> None:
+        self._chunk_size, self._evaluate_chunks = chunk_size, evaluate_chunks
+
+    def determinant_many(self,
+                         first_points: PointsArray,
+                         second_points: PointsArray,
+                         third_points: PointsArray,
+                         fourth_points: PointsArray,
+                         *,
+                         chunk_size: Optional[int] = None,
+                         max_workers: Optional[int] = None) -> ValuesArray:
+        """
+        Calculates determinants for checking if points lie on the same circle
+        for given ``(N, 2)`` arrays of points
+        splitting them in chunks of ``chunk_size`` rows
+        (``CHUNK_SIZE`` of the backend module by default)
+        between at most ``max_workers`` workers.
+
+        Same as ``robust.vectorized.determinant_many``.
+
+        >>> from robust import threaded
+        >>> threaded.determinant_many(np.array([[0., 0.], [0., 0.], [0., 0.]]),
+        ...                           np.array([[2., 0.], [2., 0.], [2., 0.]]),
+        ...                           np.array([[2., 2.], [2., 2.], [2., 2.]]),
+        ...                           np.array([[0., 2.], [0., 3.], [0., 1.]]),
+        ...                           chunk_size=2, max_workers=2)
+        array([  0., -12.,   4.])
+        """
+        return self._evaluate(_serial_determinant_many,
+                              (first_points, second_points, third_points,
+                               fourth_points),
+                              np.float64, chunk_size, max_workers)
+
+    def orientation_many(self,
+                         first_ray_points: PointsArray,
+                         vertices: PointsArray,
+                         second_ray_points: PointsArray,
+                         *,
+                         chunk_size: Optional[int] = None,
+                         max_workers: Optional[int] = None) -> SignsArray:
+        """
+        Returns orientations of angles built on given ``(N, 2)`` arrays
+        of points as an array of signs with the same meaning as values of
+        ``robust.angular.Orientation``
+        splitting them in chunks of ``chunk_size`` rows
+        (``CHUNK_SIZE`` of the backend module by default)
+        between at most ``max_workers`` workers.
+
+        Same as ``robust.vectorized.orientation_many``.
+
+        >>> from robust import threaded
+        >>> threaded.orientation_many(np.array([[1., 0.], [1., 0.], [0., 1.]]),
+        ...                           np.zeros((3, 2)),
+        ...                           np.array([[1., 0.], [0., 1.], [1., 0.]]),
+        ...                           chunk_size=2, max_workers=2)
+        array([ 0,  1, -1], dtype=int8)
+        """
+        return self._evaluate(_serial_orientation_many,
+                              (first_ray_points, vertices, second_ray_points),
+                              np.int8, chunk_size, max_workers)
+
+    def segments_relationship_many(self,
+                                   left_segments: SegmentsArray,
+                                   right_segments: SegmentsArray,
+                                   *,
+                                   chunk_size: Optional[int] = None,
+                                   max_workers: Optional[int] = None
+                                   ) -> SignsArray:
+        """
+        Finds relationships between segments
+        given by ``(N, 2, 2)`` arrays of their endpoints
+        as an array of values of ``robust.linear.SegmentsRelationship``
+        splitting them in chunks of ``chunk_size`` rows
+        (``CHUNK_SIZE`` of the backend module by default)
+        between at most ``max_workers`` workers.
+
+        Same as evaluating ``robust.linear.segments_relationship``
+        for each pair of segments.
+
+        >>> from robust import threaded
+        >>> threaded.segments_relationship_many(
+        ...     np.array([[[0., 0.], [2., 0.]], [[0., 0.], [2., 0.]],
+        ...               [[0., 0.], [2., 2.]]]),
+        ...     np.array([[[3., 0.], [4., 0.]], [[1., 0.], [1., 1.]],
+        ...               [[0., 2.], [2., 0.]]]),
+        ...     chunk_size=2, max_workers=2)
+        array([0, 1, 2], dtype=int8)
+        """
+        left_segments = _to_segments_array(left_segments)
+        right_segments = _to_segments_array(right_segments)
+        return self._evaluate(_segments_relationship_many,
+                              (left_segments[:, 0], left_segments[:, 1],
+                               right_segments[:, 0], right_segments[:, 1]),
+                              np.int8, chunk_size, max_workers)
+
+    def _evaluate(self,
+                  function: Callable[..., np.ndarray],
+                  points_arrays: Tuple[PointsArray, ...],
+                  result_dtype: np.dtype,
+                  chunk_size: Optional[int],
+                  max_workers: Optional[int]) -> np.ndarray:
+        if chunk_size is None:
+            chunk_size = self._chunk_size
+        elif chunk_size < 1:
+            raise ValueError('Chunk size should be positive, '
+                             'but found: {chunk_size}.'
+                             .format(chunk_size=chunk_size))
+        points_arrays = _to_points_arrays(*points_arrays)
+        rows_count = len(points_arrays[0])
+        if rows_count <= chunk_size or max_workers == 1:
+            return function(*points_arrays)
+        return self._evaluate_chunks(function, points_arrays,
+                                     np.dtype(result_dtype), chunk_size,
+                                     max_workers)
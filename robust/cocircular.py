@@ -1,20 +1,38 @@
+import sys
+from fractions import Fraction
 from functools import reduce
+from itertools import islice
+from math import fsum
 from numbers import Real
 from typing import (Iterable,
+                    Iterator,
+                    Sequence,
                     Tuple)
 
-from . import bounds
+from . import (bounds,
+               profiling)
 from .hints import (Expansion,
                     Point)
-from .utils import (scale_expansion,
+from .profiling import Stage
+from .utils import (compress_expansion,
+                    dominates,
+                    multiply_expansions,
+                    scale_expansion,
                     square,
                     sum_expansions,
                     to_cross_product,
-                    two_diff_tail,
+                    to_exact,
+                    to_rational_differences,
+                    to_sign,
+                    two_diff,
                     two_product,
                     two_two_diff,
                     two_two_sum)
 
+#: length of running expansions of the last stage
+#: above which they are compressed
+MAX_UNCOMPRESSED_LENGTH = 8
+
 
 def determinant(first_point: Point,
                 second_point: Point,
@@ -39,9 +57,244 @@ def determinant(first_point: Point,
     second_x, second_y = second_point
     third_x, third_y = third_point
     fourth_x, fourth_y = fourth_point
+    return _determinant(first_x, first_y, second_x, second_y, third_x,
+                        third_y, fourth_x, fourth_y, False)
+
+
+def determinant_sign(first_point: Point,
+                     second_point: Point,
+                     third_point: Point,
+                     fourth_point: Point) -> int:
+    """
+    Calculates sign of determinant of linear equations' system
+    for checking if four points lie on the same circle.
+
+    Same as ``to_sign(determinant(...))``,
+    but stops exact evaluation as soon as the sign is known.
+
+    >>> determinant_sign((0, 0), (2, 0), (2, 2), (0, 2))
+    0
+    >>> determinant_sign((0, 0), (2, 0), (2, 2), (0, 3))
+    -1
+    >>> determinant_sign((0, 0), (2, 0), (2, 2), (0, 1))
+    1
+    """
+    first_x, first_y = first_point
+    second_x, second_y = second_point
+    third_x, third_y = third_point
+    fourth_x, fourth_y = fourth_point
+    return to_sign(_determinant(first_x, first_y, second_x, second_y,
+                                third_x, third_y, fourth_x, fourth_y, True))
+
+
+def determinant_at(coordinates: Sequence[Real],
+                   first_index: int,
+                   second_index: int,
+                   third_index: int,
+                   fourth_index: int) -> Real:
+    """
+    Calculates determinant of linear equations' system
+    for checking if four points with given indices
+    in flat coordinates' buffer lie on the same circle
+    (e.g. ``array('d')`` or ``memoryview`` of ``numpy`` array
+    with point ``i`` stored as ``coordinates[2 * i], coordinates[2 * i + 1]``)
+    without building points.
+
+    Same as ``determinant(first_point, second_point, third_point,
+    fourth_point)``.
+
+    >>> from array import array
+    >>> coordinates = array('d', [0., 0., 2., 0., 2., 2., 0., 2., 0., 3.])
+    >>> determinant_at(coordinates, 0, 1, 2, 3)
+    0.0
+    >>> determinant_at(coordinates, 0, 1, 2, 4)
+    -12.0
+    """
+    return _determinant(
+            coordinates[2 * first_index], coordinates[2 * first_index + 1],
+            coordinates[2 * second_index], coordinates[2 * second_index + 1],
+            coordinates[2 * third_index], coordinates[2 * third_index + 1],
+            coordinates[2 * fourth_index], coordinates[2 * fourth_index + 1],
+            False)
+
+
+class PreparedCircle:
+    """
+    Represents circle through three points with cached data
+    for checking many points against it.
+
+    >>> circle = PreparedCircle((0, 0), (2, 0), (2, 2))
+    >>> circle.sign((1, 1))
+    1
+    >>> circle.classify([(1, 1), (0, 2), (3, 3)])
+    [1, 0, -1]
+    """
+    __slots__ = ('_first_point', '_second_point', '_third_point',
+                 '_origin_x', '_origin_y', '_x_coefficient', '_y_coefficient',
+                 '_squared_distance_coefficient', '_exact')
+
+    def __init__(self,
+                 first_point: Point,
+                 second_point: Point,
+                 third_point: Point) -> None:
+        self._first_point, self._second_point, self._third_point = (
+            first_point, second_point, third_point)
+        first_x, first_y = first_point
+        second_x, second_y = second_point
+        third_x, third_y = third_point
+        coordinates = (first_x, first_y, second_x, second_y, third_x,
+                       third_y)
+        exact_coordinates = to_exact(*coordinates)
+        self._exact = exact_coordinates is not None
+        if self._exact:
+            coordinates = exact_coordinates
+            coefficients = _to_lifted_coefficients(*coordinates)
+        elif all(type(coordinate) is float for coordinate in coordinates):
+            coefficients = map(fsum,
+                               _to_lifted_coefficients_expansions(
+                                       *coordinates))
+        else:
+            coefficients = map(float,
+                               _to_lifted_coefficients(*map(Fraction,
+                                                            coordinates)))
+        self._origin_x, self._origin_y = coordinates[:2]
+        (self._x_coefficient, self._y_coefficient,
+         self._squared_distance_coefficient) = coefficients
+
+    @property
+    def coefficients(self) -> Tuple[Real, Real, Real]:
+        """
+        Returns coefficients of the determinant as a polynomial
+        of point's coordinates differences with the origin
+        for ``x``, ``y`` and squared distance terms respectively.
+
+        >>> PreparedCircle((0, 0), (2, 0), (2, 2)).coefficients
+        (8, 8, -4)
+        """
+        return (self._x_coefficient, self._y_coefficient,
+                self._squared_distance_coefficient)
+
+    @property
+    def origin(self) -> Point:
+        """
+        Returns point which coordinates differences are taken with.
+
+        >>> PreparedCircle((0, 0), (2, 0), (2, 2)).origin
+        (0, 0)
+        """
+        return self._origin_x, self._origin_y
+
+    @property
+    def points(self) -> Tuple[Point, Point, Point]:
+        """
+        Returns points which define the circle.
+
+        >>> (PreparedCircle((0, 0), (2, 0), (2, 2)).points
+        ...  == ((0, 0), (2, 0), (2, 2)))
+        True
+        """
+        return self._first_point, self._second_point, self._third_point
+
+    def classify(self, points: Iterable[Point]) -> Sequence[int]:
+        """
+        Returns signs of determinants for checking if given points
+        lie on the circle.
+
+        Points can be given as an iterable
+        (then signs are returned as a ``list``)
+        or as ``(N, 2)`` ``numpy`` array
+        (then signs are returned as ``numpy`` array of ``int8``s
+        and only rows ambiguous for floating point filter
+        are evaluated exactly).
+
+        >>> circle = PreparedCircle((0, 0), (2, 0), (2, 2))
+        >>> circle.classify(iter([(1, 2), (0, 0), (1, -2)]))
+        [1, 0, -1]
+        """
+        numpy = sys.modules.get('numpy')
+        if numpy is not None and isinstance(points, numpy.ndarray):
+            from .vectorized import _to_circle_signs
+            return _to_circle_signs(self, points)
+        return [self.sign(point) for point in points]
+
+    def sign(self, point: Point) -> int:
+        """
+        Returns sign of determinant for checking if given point
+        lies on the circle.
+
+        Same as ``determinant_sign(*self.points, point)``,
+        but with terms which depend only on the circle precomputed.
+
+        >>> circle = PreparedCircle((0, 0), (2, 0), (2, 2))
+        >>> circle.sign((1, 1))
+        1
+        >>> circle.sign((0, 2))
+        0
+        >>> circle.sign((3, 3))
+        -1
+        """
+        point_x, point_y = point
+        dx, dy = point_x - self._origin_x, point_y - self._origin_y
+        if self._exact and type(dx) is not float:
+            differences = to_rational_differences((dx, dy), point_x,
+                                                  self._origin_x, point_y,
+                                                  self._origin_y)
+            if differences is not None:
+                dx, dy = differences
+                return to_sign(self._x_coefficient * dx
+                               + self._y_coefficient * dy
+                               + self._squared_distance_coefficient
+                               * (dx * dx + dy * dy))
+        x_term = self._x_coefficient * dx
+        y_term = self._y_coefficient * dy
+        squared_distance_term = (self._squared_distance_coefficient
+                                 * (dx * dx + dy * dy))
+        result = x_term + y_term + squared_distance_term
+        upper_bound = abs(x_term) + abs(y_term) + abs(squared_distance_term)
+        error_bound = bounds.to_prepared_cocircular_error(upper_bound)
+        if result > error_bound or -result > error_bound:
+            return to_sign(result)
+        return determinant_sign(self._first_point, self._second_point,
+                                self._third_point, point)
+
+
+def _exact_determinant(first_dx: Real,
+                       first_dy: Real,
+                       second_dx: Real,
+                       second_dy: Real,
+                       third_dx: Real,
+                       third_dy: Real) -> Real:
+    # third point's lifted term is eliminated with the identity
+    # ``(b x c) * a + (c x a) * b + (a x b) * c == 0`` for vectors,
+    # so 10 multiplications are needed instead of 15
+    return ((second_dx * third_dy - third_dx * second_dy)
+            * (first_dx * (first_dx - third_dx)
+               + first_dy * (first_dy - third_dy))
+            + (third_dx * first_dy - first_dx * third_dy)
+            * (second_dx * (second_dx - third_dx)
+               + second_dy * (second_dy - third_dy)))
+
+
+def _determinant(first_x: Real,
+                 first_y: Real,
+                 second_x: Real,
+                 second_y: Real,
+                 third_x: Real,
+                 third_y: Real,
+                 fourth_x: Real,
+                 fourth_y: Real,
+                 sign_only: bool) -> Real:
     first_dx, first_dy = first_x - fourth_x, first_y - fourth_y
     second_dx, second_dy = second_x - fourth_x, second_y - fourth_y
     third_dx, third_dy = third_x - fourth_x, third_y - fourth_y
+    if type(first_dx) is not float:
+        differences = to_rational_differences(
+                (first_dx, first_dy, second_dx, second_dy, third_dx,
+                 third_dy), first_x, fourth_x, first_y, fourth_y, second_x,
+                fourth_x, second_y, fourth_y, third_x, fourth_x, third_y,
+                fourth_y)
+        if differences is not None:
+            return _exact_determinant(*differences)
     first_squared_distance = first_dx * first_dx + first_dy * first_dy
     second_squared_distance = second_dx * second_dx + second_dy * second_dy
     third_squared_distance = third_dx * third_dx + third_dy * third_dy
@@ -67,7 +320,8 @@ def determinant(first_point: Point,
     if result > error_bound or -result > error_bound:
         return result
     return _adjusted_determinant(first_x, first_y, second_x, second_y, third_x,
-                                 third_y, fourth_x, fourth_y, upper_bound)
+                                 third_y, fourth_x, fourth_y, upper_bound,
+                                 sign_only)
 
 
 def _adjusted_determinant(first_x: Real,
@@ -78,7 +332,15 @@ def _adjusted_determinant(first_x: Real,
                           third_y: Real,
                           fourth_x: Real,
                           fourth_y: Real,
-                          upper_bound: Real) -> Real:
+                          upper_bound: Real,
+                          sign_only: bool = False) -> Real:
+    """
+    Evaluates determinant with adaptive stages after the filter.
+
+    With ``sign_only`` flag the last stage stops
+    as soon as the sign of the result is known,
+    so only the sign of returned value is guaranteed to be exact.
+    """
     first_dx_head, first_dy_head = first_x - fourth_x, first_y - fourth_y
     second_dx_head, second_dy_head = second_x - fourth_x, second_y - fourth_y
     third_dx_head, third_dy_head = third_x - fourth_x, third_y - fourth_y
@@ -103,16 +365,38 @@ def _adjusted_determinant(first_x: Real,
     result = sum(result_expansion)
     error_bound = bounds.to_cocircular_second_error(upper_bound)
     if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('cocircular.determinant', Stage.SECOND_BOUND)
         return result
-    first_dx_tail = two_diff_tail(first_x, fourth_x, first_dx_head)
-    first_dy_tail = two_diff_tail(first_y, fourth_y, first_dy_head)
-    second_dx_tail = two_diff_tail(second_x, fourth_x, second_dx_head)
-    second_dy_tail = two_diff_tail(second_y, fourth_y, second_dy_head)
-    third_dx_tail = two_diff_tail(third_x, fourth_x, third_dx_head)
-    third_dy_tail = two_diff_tail(third_y, fourth_y, third_dy_head)
+    right_virtual = first_x - first_dx_head
+    left_virtual = first_dx_head + right_virtual
+    first_dx_tail = ((first_x - left_virtual)
+                     + (right_virtual - fourth_x))
+    right_virtual = first_y - first_dy_head
+    left_virtual = first_dy_head + right_virtual
+    first_dy_tail = ((first_y - left_virtual)
+                     + (right_virtual - fourth_y))
+    right_virtual = second_x - second_dx_head
+    left_virtual = second_dx_head + right_virtual
+    second_dx_tail = ((second_x - left_virtual)
+                      + (right_virtual - fourth_x))
+    right_virtual = second_y - second_dy_head
+    left_virtual = second_dy_head + right_virtual
+    second_dy_tail = ((second_y - left_virtual)
+                      + (right_virtual - fourth_y))
+    right_virtual = third_x - third_dx_head
+    left_virtual = third_dx_head + right_virtual
+    third_dx_tail = ((third_x - left_virtual)
+                     + (right_virtual - fourth_x))
+    right_virtual = third_y - third_dy_head
+    left_virtual = third_dy_head + right_virtual
+    third_dy_tail = ((third_y - left_virtual)
+                     + (right_virtual - fourth_y))
     if (not first_dx_tail and not first_dy_tail
             and not second_dx_tail and not second_dy_tail
             and not third_dx_tail and not third_dy_tail):
+        if profiling.enabled:
+            profiling.record_exit('cocircular.determinant', Stage.TAIL_FREE)
         return result
     error_bound = (bounds.to_cocircular_third_error(upper_bound)
                    + bounds.to_determinant_error(result))
@@ -129,7 +413,57 @@ def _adjusted_determinant(first_x: Real,
                             first_dy_head, first_dy_tail, second_dx_head,
                             second_dx_tail, second_dy_head, second_dy_tail))
     if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('cocircular.determinant', Stage.THIRD_BOUND)
         return result
+    if profiling.enabled:
+        profiling.record_exit('cocircular.determinant', Stage.EXPANSION)
+    tails_addends = _to_tails_addends(first_dx_head, first_dx_tail,
+                                      first_dy_head, first_dy_tail,
+                                      second_dx_head, second_dx_tail,
+                                      second_dy_head, second_dy_tail,
+                                      third_dx_head, third_dx_tail,
+                                      third_dy_head, third_dy_tail,
+                                      second_third_cross_product,
+                                      third_first_cross_product,
+                                      first_second_cross_product)
+    if sign_only:
+        tails = (first_dx_tail, first_dy_tail, second_dx_tail, second_dy_tail,
+                 third_dx_tail, third_dy_tail)
+        result_expansion = reduce(_sum_expansions_compressed,
+                                  islice(tails_addends, sum(map(bool, tails))),
+                                  result_expansion)
+        higher_order_upper_bound = bounds.to_cocircular_higher_order_bound(
+                max(map(abs, (first_dx_head, first_dy_head, second_dx_head,
+                              second_dy_head, third_dx_head, third_dy_head))),
+                max(map(abs, tails)))
+        if dominates(result_expansion, higher_order_upper_bound):
+            return result_expansion[-1]
+    result_expansion = reduce(_sum_expansions_compressed, tails_addends,
+                              result_expansion)
+    return result_expansion[-1]
+
+
+def _to_tails_addends(first_dx_head: Real,
+                      first_dx_tail: Real,
+                      first_dy_head: Real,
+                      first_dy_tail: Real,
+                      second_dx_head: Real,
+                      second_dx_tail: Real,
+                      second_dy_head: Real,
+                      second_dy_tail: Real,
+                      third_dx_head: Real,
+                      third_dx_tail: Real,
+                      third_dy_head: Real,
+                      third_dy_tail: Real,
+                      second_third_cross_product: Expansion,
+                      third_first_cross_product: Expansion,
+                      first_second_cross_product: Expansion
+                      ) -> Iterator[Expansion]:
+    """
+    Yields addends of the determinant with coordinates' tails,
+    starting with one first order addend for each non-zero tail.
+    """
     first_squared_length = (_to_squared_length(first_dx_head, first_dy_head)
                             if (second_dx_tail or second_dy_tail
                                 or third_dx_tail or third_dy_tail)
@@ -145,57 +479,45 @@ def _adjusted_determinant(first_x: Real,
     if first_dx_tail:
         first_dx_tail_second_third_cross_product = scale_expansion(
                 second_third_cross_product, first_dx_tail)
-        result_expansion = sum_expansions(
-                result_expansion,
-                _to_extra(first_dx_tail_second_third_cross_product,
-                          first_dx_head, first_dx_tail, second_dy_head,
-                          second_squared_length, third_dy_head,
-                          third_squared_length))
+        yield _to_extra(first_dx_tail_second_third_cross_product,
+                        first_dx_head, first_dx_tail, second_dy_head,
+                        second_squared_length, third_dy_head,
+                        third_squared_length)
     if first_dy_tail:
         first_dy_tail_second_third_cross_product = scale_expansion(
                 second_third_cross_product, first_dy_tail)
-        result_expansion = sum_expansions(
-                result_expansion,
-                _to_extra(first_dy_tail_second_third_cross_product,
-                          first_dy_head, first_dy_tail, third_dx_head,
-                          third_squared_length, second_dx_head,
-                          second_squared_length))
+        yield _to_extra(first_dy_tail_second_third_cross_product,
+                        first_dy_head, first_dy_tail, third_dx_head,
+                        third_squared_length, second_dx_head,
+                        second_squared_length)
     if second_dx_tail:
         second_dx_tail_third_first_cross_product = scale_expansion(
                 third_first_cross_product, second_dx_tail)
-        result_expansion = sum_expansions(
-                result_expansion,
-                _to_extra(second_dx_tail_third_first_cross_product,
-                          second_dx_head, second_dx_tail, third_dy_head,
-                          third_squared_length, first_dy_head,
-                          first_squared_length))
+        yield _to_extra(second_dx_tail_third_first_cross_product,
+                        second_dx_head, second_dx_tail, third_dy_head,
+                        third_squared_length, first_dy_head,
+                        first_squared_length)
     if second_dy_tail:
         second_dy_tail_third_first_cross_product = scale_expansion(
                 third_first_cross_product, second_dy_tail)
-        result_expansion = sum_expansions(
-                result_expansion,
-                _to_extra(second_dy_tail_third_first_cross_product,
-                          second_dy_head, second_dy_tail,
-                          first_dx_head, first_squared_length,
-                          third_dx_head, third_squared_length))
+        yield _to_extra(second_dy_tail_third_first_cross_product,
+                        second_dy_head, second_dy_tail,
+                        first_dx_head, first_squared_length,
+                        third_dx_head, third_squared_length)
     if third_dx_tail:
         third_dx_tail_first_second_cross_product = scale_expansion(
                 first_second_cross_product, third_dx_tail)
-        result_expansion = sum_expansions(
-                result_expansion,
-                _to_extra(third_dx_tail_first_second_cross_product,
-                          third_dx_head, third_dx_tail, first_dy_head,
-                          first_squared_length, second_dy_head,
-                          second_squared_length))
+        yield _to_extra(third_dx_tail_first_second_cross_product,
+                        third_dx_head, third_dx_tail, first_dy_head,
+                        first_squared_length, second_dy_head,
+                        second_squared_length)
     if third_dy_tail:
         third_dy_tail_first_second_cross_product = scale_expansion(
                 first_second_cross_product, third_dy_tail)
-        result_expansion = sum_expansions(
-                result_expansion,
-                _to_extra(third_dy_tail_first_second_cross_product,
-                          third_dy_head, third_dy_tail, second_dx_head,
-                          second_squared_length, first_dx_head,
-                          first_squared_length))
+        yield _to_extra(third_dy_tail_first_second_cross_product,
+                        third_dy_head, third_dy_tail, second_dx_head,
+                        second_squared_length, first_dx_head,
+                        first_squared_length)
     if first_dx_tail or first_dy_tail:
         if second_dx_tail or second_dy_tail or third_dx_tail or third_dy_tail:
             second_third_crossed_tails_tail, second_third_crossed_tails = (
@@ -206,23 +528,18 @@ def _adjusted_determinant(first_x: Real,
         else:
             second_third_crossed_tails_tail = second_third_crossed_tails = (0,)
         if first_dx_tail:
-            result_expansion = reduce(
-                    sum_expansions,
-                    _to_dx_extras(first_dx_tail_second_third_cross_product,
-                                  first_dx_head, first_dx_tail, second_dy_tail,
-                                  second_squared_length, third_dy_tail,
-                                  third_squared_length,
-                                  second_third_crossed_tails,
-                                  second_third_crossed_tails_tail),
-                    result_expansion)
+            yield from _to_dx_extras(first_dx_tail_second_third_cross_product,
+                                     first_dx_head, first_dx_tail,
+                                     second_dy_tail, second_squared_length,
+                                     third_dy_tail,
+                                     third_squared_length,
+                                     second_third_crossed_tails,
+                                     second_third_crossed_tails_tail)
         if first_dy_tail:
-            result_expansion = reduce(
-                    sum_expansions,
-                    _to_dy_extras(first_dy_tail_second_third_cross_product,
-                                  first_dy_head, first_dy_tail,
-                                  second_third_crossed_tails,
-                                  second_third_crossed_tails_tail),
-                    result_expansion)
+            yield from _to_dy_extras(first_dy_tail_second_third_cross_product,
+                                     first_dy_head, first_dy_tail,
+                                     second_third_crossed_tails,
+                                     second_third_crossed_tails_tail)
     if second_dx_tail or second_dy_tail:
         if first_dx_tail or first_dy_tail or third_dx_tail or third_dy_tail:
             third_first_crossed_tails_tail, third_first_crossed_tails = (
@@ -232,23 +549,17 @@ def _adjusted_determinant(first_x: Real,
         else:
             third_first_crossed_tails_tail = third_first_crossed_tails = (0,)
         if second_dx_tail:
-            result_expansion = reduce(
-                    sum_expansions,
-                    _to_dx_extras(second_dx_tail_third_first_cross_product,
-                                  second_dx_head, second_dx_tail,
-                                  third_dy_tail, third_squared_length,
-                                  first_dy_tail, first_squared_length,
-                                  third_first_crossed_tails,
-                                  third_first_crossed_tails_tail),
-                    result_expansion)
+            yield from _to_dx_extras(second_dx_tail_third_first_cross_product,
+                                     second_dx_head, second_dx_tail,
+                                     third_dy_tail, third_squared_length,
+                                     first_dy_tail, first_squared_length,
+                                     third_first_crossed_tails,
+                                     third_first_crossed_tails_tail)
         if second_dy_tail:
-            result_expansion = reduce(
-                    sum_expansions,
-                    _to_dy_extras(second_dy_tail_third_first_cross_product,
-                                  second_dy_head, second_dy_tail,
-                                  third_first_crossed_tails,
-                                  third_first_crossed_tails_tail),
-                    result_expansion)
+            yield from _to_dy_extras(second_dy_tail_third_first_cross_product,
+                                     second_dy_head, second_dy_tail,
+                                     third_first_crossed_tails,
+                                     third_first_crossed_tails_tail)
     if third_dx_tail or third_dy_tail:
         if first_dx_tail or first_dy_tail or second_dx_tail or second_dy_tail:
             first_second_crossed_tails_tail, first_second_crossed_tails = (
@@ -259,24 +570,18 @@ def _adjusted_determinant(first_x: Real,
         else:
             first_second_crossed_tails_tail = first_second_crossed_tails = (0,)
         if third_dx_tail:
-            result_expansion = reduce(
-                    sum_expansions,
-                    _to_dx_extras(third_dx_tail_first_second_cross_product,
-                                  third_dx_head, third_dx_tail, first_dy_tail,
-                                  first_squared_length, second_dy_tail,
-                                  second_squared_length,
-                                  first_second_crossed_tails,
-                                  first_second_crossed_tails_tail),
-                    result_expansion)
+            yield from _to_dx_extras(third_dx_tail_first_second_cross_product,
+                                     third_dx_head, third_dx_tail,
+                                     first_dy_tail, first_squared_length,
+                                     second_dy_tail,
+                                     second_squared_length,
+                                     first_second_crossed_tails,
+                                     first_second_crossed_tails_tail)
         if third_dy_tail:
-            result_expansion = reduce(
-                    sum_expansions,
-                    _to_dy_extras(third_dy_tail_first_second_cross_product,
-                                  third_dy_head, third_dy_tail,
-                                  first_second_crossed_tails,
-                                  first_second_crossed_tails_tail),
-                    result_expansion)
-    return result_expansion[-1]
+            yield from _to_dy_extras(third_dy_tail_first_second_cross_product,
+                                     third_dy_head, third_dy_tail,
+                                     first_second_crossed_tails,
+                                     first_second_crossed_tails_tail)
 
 
 def _to_dx_extras(head: Expansion,
@@ -329,6 +634,17 @@ def _to_dy_extras(expansion: Expansion,
     yield sum_expansions(first_addend, second_addend)
 
 
+def _sum_expansions_compressed(left: Expansion,
+                               right: Expansion) -> Expansion:
+    """
+    Same as ``sum_expansions``, but compresses long results.
+    """
+    result = sum_expansions(left, right)
+    return (compress_expansion(result)
+            if len(result) > MAX_UNCOMPRESSED_LENGTH
+            else result)
+
+
 def _to_extra(head: Expansion,
               coordinate: Real,
               coordinate_tail: Real,
@@ -401,3 +717,57 @@ def _to_squared_length(dx_head: Real, dy_head: Real) -> Expansion:
     dy_squared_tail, dy_squared = square(dy_head)
     return two_two_sum(dx_squared_tail, dx_squared, dy_squared_tail,
                        dy_squared)
+
+
+def _to_lifted_coefficients(first_x: Real,
+                            first_y: Real,
+                            second_x: Real,
+                            second_y: Real,
+                            third_x: Real,
+                            third_y: Real) -> Tuple[Real, Real, Real]:
+    second_dx, second_dy = second_x - first_x, second_y - first_y
+    third_dx, third_dy = third_x - first_x, third_y - first_y
+    second_squared_distance = second_dx * second_dx + second_dy * second_dy
+    third_squared_distance = third_dx * third_dx + third_dy * third_dy
+    return (second_squared_distance * third_dy
+            - third_squared_distance * second_dy,
+            third_squared_distance * second_dx
+            - second_squared_distance * third_dx,
+            second_dy * third_dx - second_dx * third_dy)
+
+
+def _to_lifted_coefficients_expansions(first_x: Real,
+                                       first_y: Real,
+                                       second_x: Real,
+                                       second_y: Real,
+                                       third_x: Real,
+                                       third_y: Real
+                                       ) -> Tuple[Expansion, Expansion,
+                                                  Expansion]:
+    second_dx, second_dy = (two_diff(second_x, first_x),
+                            two_diff(second_y, first_y))
+    third_dx, third_dy = (two_diff(third_x, first_x),
+                          two_diff(third_y, first_y))
+    second_squared_distance = sum_expansions(
+            multiply_expansions(second_dx, second_dx),
+            multiply_expansions(second_dy, second_dy))
+    third_squared_distance = sum_expansions(
+            multiply_expansions(third_dx, third_dx),
+            multiply_expansions(third_dy, third_dy))
+    return (sum_expansions(
+                    multiply_expansions(second_squared_distance, third_dy),
+                    multiply_expansions(third_squared_distance,
+                                        two_diff(first_y, second_y))),
+            sum_expansions(
+                    multiply_expansions(third_squared_distance, second_dx),
+                    multiply_expansions(second_squared_distance,
+                                        two_diff(first_x, third_x))),
+            sum_expansions(multiply_expansions(second_dy, third_dx),
+                           multiply_expansions(second_dx,
+                                               two_diff(first_y, third_y))))
+
+
+profiling.register('cocircular.determinant', determinant)
+profiling.register('cocircular.determinant_sign', determinant_sign)
+profiling.register('cocircular.determinant_at', determinant_at)
+profiling.register('cocircular.PreparedCircle.sign', PreparedCircle.sign)
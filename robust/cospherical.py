@@ -0,0 +1,513 @@
+from numbers import Real
+
+from . import (bounds,
+               profiling)
+from .hints import (Expansion,
+                    Point3D)
+from .profiling import Stage
+from .utils import (multiply_expansions,
+                    scale_expansion,
+                    sum_expansions,
+                    to_cross_product,
+                    to_cross_product_with_tails,
+                    to_rational_differences)
+
+
+def determinant(first_point: Point3D,
+                second_point: Point3D,
+                third_point: Point3D,
+                fourth_point: Point3D,
+                fifth_point: Point3D) -> Real:
+    """
+    Calculates determinant of linear equations' system
+    for checking if five points lie on the same sphere.
+
+    Positive sign of result means that point lies inside,
+    negative -- outside,
+    zero -- on a sphere defined by other points
+    given that their signed volume
+    ``robust.parallelepiped.signed_volume(fourth_point, first_point,
+    fourth_point, second_point, fourth_point, third_point)`` is positive.
+
+    >>> determinant((2, 0, 0), (0, 2, 0), (0, 0, 2), (0, 0, 0), (2, 2, 2))
+    0
+    >>> determinant((2, 0, 0), (0, 2, 0), (0, 0, 2), (0, 0, 0), (3, 3, 3))
+    -72
+    >>> determinant((2, 0, 0), (0, 2, 0), (0, 0, 2), (0, 0, 0), (1, 1, 1))
+    24
+    """
+    first_x, first_y, first_z = first_point
+    second_x, second_y, second_z = second_point
+    third_x, third_y, third_z = third_point
+    fourth_x, fourth_y, fourth_z = fourth_point
+    fifth_x, fifth_y, fifth_z = fifth_point
+    first_dx, first_dy, first_dz = (first_x - fifth_x, first_y - fifth_y,
+                                    first_z - fifth_z)
+    second_dx, second_dy, second_dz = (second_x - fifth_x, second_y - fifth_y,
+                                       second_z - fifth_z)
+    third_dx, third_dy, third_dz = (third_x - fifth_x, third_y - fifth_y,
+                                    third_z - fifth_z)
+    fourth_dx, fourth_dy, fourth_dz = (fourth_x - fifth_x, fourth_y - fifth_y,
+                                       fourth_z - fifth_z)
+    differences = to_rational_differences(
+            (first_dx, first_dy, first_dz, second_dx, second_dy, second_dz,
+             third_dx, third_dy, third_dz, fourth_dx, fourth_dy, fourth_dz),
+            first_x, fifth_x, first_y, fifth_y, first_z, fifth_z, second_x,
+            fifth_x, second_y, fifth_y, second_z, fifth_z, third_x, fifth_x,
+            third_y, fifth_y, third_z, fifth_z, fourth_x, fifth_x, fourth_y,
+            fifth_y, fourth_z, fifth_z)
+    if differences is not None:
+        (first_dx, first_dy, first_dz, second_dx, second_dy, second_dz,
+         third_dx, third_dy, third_dz, fourth_dx, fourth_dy,
+         fourth_dz) = differences
+    first_dx_second_dy = first_dx * second_dy
+    second_dx_first_dy = second_dx * first_dy
+    second_dx_third_dy = second_dx * third_dy
+    third_dx_second_dy = third_dx * second_dy
+    third_dx_fourth_dy = third_dx * fourth_dy
+    fourth_dx_third_dy = fourth_dx * third_dy
+    fourth_dx_first_dy = fourth_dx * first_dy
+    first_dx_fourth_dy = first_dx * fourth_dy
+    first_dx_third_dy = first_dx * third_dy
+    third_dx_first_dy = third_dx * first_dy
+    second_dx_fourth_dy = second_dx * fourth_dy
+    fourth_dx_second_dy = fourth_dx * second_dy
+    first_second_cross_product = first_dx_second_dy - second_dx_first_dy
+    second_third_cross_product = second_dx_third_dy - third_dx_second_dy
+    third_fourth_cross_product = third_dx_fourth_dy - fourth_dx_third_dy
+    fourth_first_cross_product = fourth_dx_first_dy - first_dx_fourth_dy
+    first_third_cross_product = first_dx_third_dy - third_dx_first_dy
+    second_fourth_cross_product = second_dx_fourth_dy - fourth_dx_second_dy
+    first_second_third_volume = (first_dz * second_third_cross_product
+                                 - second_dz * first_third_cross_product
+                                 + third_dz * first_second_cross_product)
+    second_third_fourth_volume = (second_dz * third_fourth_cross_product
+                                  - third_dz * second_fourth_cross_product
+                                  + fourth_dz * second_third_cross_product)
+    third_fourth_first_volume = (third_dz * fourth_first_cross_product
+                                 + fourth_dz * first_third_cross_product
+                                 + first_dz * third_fourth_cross_product)
+    fourth_first_second_volume = (fourth_dz * first_second_cross_product
+                                  + first_dz * second_fourth_cross_product
+                                  + second_dz * fourth_first_cross_product)
+    first_squared_distance = (first_dx * first_dx + first_dy * first_dy
+                              + first_dz * first_dz)
+    second_squared_distance = (second_dx * second_dx + second_dy * second_dy
+                               + second_dz * second_dz)
+    third_squared_distance = (third_dx * third_dx + third_dy * third_dy
+                              + third_dz * third_dz)
+    fourth_squared_distance = (fourth_dx * fourth_dx + fourth_dy * fourth_dy
+                               + fourth_dz * fourth_dz)
+    result = ((fourth_squared_distance * first_second_third_volume
+               - third_squared_distance * fourth_first_second_volume)
+              + (second_squared_distance * third_fourth_first_volume
+                 - first_squared_distance * second_third_fourth_volume))
+    if differences is not None:
+        return result
+    first_second_permanent = (abs(first_dx_second_dy)
+                              + abs(second_dx_first_dy))
+    second_third_permanent = (abs(second_dx_third_dy)
+                              + abs(third_dx_second_dy))
+    third_fourth_permanent = (abs(third_dx_fourth_dy)
+                              + abs(fourth_dx_third_dy))
+    fourth_first_permanent = (abs(fourth_dx_first_dy)
+                              + abs(first_dx_fourth_dy))
+    first_third_permanent = abs(first_dx_third_dy) + abs(third_dx_first_dy)
+    second_fourth_permanent = (abs(second_dx_fourth_dy)
+                               + abs(fourth_dx_second_dy))
+    upper_bound = ((third_fourth_permanent * abs(second_dz)
+                    + second_fourth_permanent * abs(third_dz)
+                    + second_third_permanent * abs(fourth_dz))
+                   * first_squared_distance
+                   + (fourth_first_permanent * abs(third_dz)
+                      + first_third_permanent * abs(fourth_dz)
+                      + third_fourth_permanent * abs(first_dz))
+                   * second_squared_distance
+                   + (first_second_permanent * abs(fourth_dz)
+                      + second_fourth_permanent * abs(first_dz)
+                      + fourth_first_permanent * abs(second_dz))
+                   * third_squared_distance
+                   + (second_third_permanent * abs(first_dz)
+                      + first_third_permanent * abs(second_dz)
+                      + first_second_permanent * abs(third_dz))
+                   * fourth_squared_distance)
+    error_bound = bounds.to_cospherical_first_error(upper_bound)
+    if result > error_bound or -result > error_bound:
+        return result
+    return _adjusted_determinant(first_x, first_y, first_z, second_x,
+                                 second_y, second_z, third_x, third_y,
+                                 third_z, fourth_x, fourth_y, fourth_z,
+                                 fifth_x, fifth_y, fifth_z, upper_bound)
+
+
+def _adjusted_determinant(first_x: Real,
+                          first_y: Real,
+                          first_z: Real,
+                          second_x: Real,
+                          second_y: Real,
+                          second_z: Real,
+                          third_x: Real,
+                          third_y: Real,
+                          third_z: Real,
+                          fourth_x: Real,
+                          fourth_y: Real,
+                          fourth_z: Real,
+                          fifth_x: Real,
+                          fifth_y: Real,
+                          fifth_z: Real,
+                          upper_bound: Real) -> Real:
+    first_dx_head, first_dy_head, first_dz_head = (
+        first_x - fifth_x, first_y - fifth_y, first_z - fifth_z)
+    second_dx_head, second_dy_head, second_dz_head = (
+        second_x - fifth_x, second_y - fifth_y, second_z - fifth_z)
+    third_dx_head, third_dy_head, third_dz_head = (
+        third_x - fifth_x, third_y - fifth_y, third_z - fifth_z)
+    fourth_dx_head, fourth_dy_head, fourth_dz_head = (
+        fourth_x - fifth_x, fourth_y - fifth_y, fourth_z - fifth_z)
+    first_second_cross_product = to_cross_product(
+            first_dx_head, second_dy_head, second_dx_head, first_dy_head)
+    second_third_cross_product = to_cross_product(
+            second_dx_head, third_dy_head, third_dx_head, second_dy_head)
+    third_fourth_cross_product = to_cross_product(
+            third_dx_head, fourth_dy_head, fourth_dx_head, third_dy_head)
+    fourth_first_cross_product = to_cross_product(
+            fourth_dx_head, first_dy_head, first_dx_head, fourth_dy_head)
+    first_third_cross_product = to_cross_product(
+            first_dx_head, third_dy_head, third_dx_head, first_dy_head)
+    second_fourth_cross_product = to_cross_product(
+            second_dx_head, fourth_dy_head, fourth_dx_head, second_dy_head)
+    result_expansion = sum_expansions(
+            sum_expansions(
+                    _multiply_by_squared_length(
+                            _to_volume(second_third_cross_product,
+                                       first_dz_head,
+                                       first_third_cross_product,
+                                       -second_dz_head,
+                                       first_second_cross_product,
+                                       third_dz_head),
+                            fourth_dx_head, fourth_dy_head, fourth_dz_head),
+                    _multiply_by_squared_length(
+                            _to_volume(first_second_cross_product,
+                                       -fourth_dz_head,
+                                       second_fourth_cross_product,
+                                       -first_dz_head,
+                                       fourth_first_cross_product,
+                                       -second_dz_head),
+                            third_dx_head, third_dy_head, third_dz_head)),
+            sum_expansions(
+                    _multiply_by_squared_length(
+                            _to_volume(fourth_first_cross_product,
+                                       third_dz_head,
+                                       first_third_cross_product,
+                                       fourth_dz_head,
+                                       third_fourth_cross_product,
+                                       first_dz_head),
+                            second_dx_head, second_dy_head, second_dz_head),
+                    _multiply_by_squared_length(
+                            _to_volume(third_fourth_cross_product,
+                                       -second_dz_head,
+                                       second_fourth_cross_product,
+                                       third_dz_head,
+                                       second_third_cross_product,
+                                       -fourth_dz_head),
+                            first_dx_head, first_dy_head, first_dz_head)))
+    result = sum(result_expansion)
+    error_bound = bounds.to_cospherical_second_error(upper_bound)
+    if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('cospherical.determinant',
+                                  Stage.SECOND_BOUND)
+        return result
+    right_virtual = first_x - first_dx_head
+    left_virtual = first_dx_head + right_virtual
+    first_dx_tail = (first_x - left_virtual) + (right_virtual - fifth_x)
+    right_virtual = first_y - first_dy_head
+    left_virtual = first_dy_head + right_virtual
+    first_dy_tail = (first_y - left_virtual) + (right_virtual - fifth_y)
+    right_virtual = first_z - first_dz_head
+    left_virtual = first_dz_head + right_virtual
+    first_dz_tail = (first_z - left_virtual) + (right_virtual - fifth_z)
+    right_virtual = second_x - second_dx_head
+    left_virtual = second_dx_head + right_virtual
+    second_dx_tail = (second_x - left_virtual) + (right_virtual - fifth_x)
+    right_virtual = second_y - second_dy_head
+    left_virtual = second_dy_head + right_virtual
+    second_dy_tail = (second_y - left_virtual) + (right_virtual - fifth_y)
+    right_virtual = second_z - second_dz_head
+    left_virtual = second_dz_head + right_virtual
+    second_dz_tail = (second_z - left_virtual) + (right_virtual - fifth_z)
+    right_virtual = third_x - third_dx_head
+    left_virtual = third_dx_head + right_virtual
+    third_dx_tail = (third_x - left_virtual) + (right_virtual - fifth_x)
+    right_virtual = third_y - third_dy_head
+    left_virtual = third_dy_head + right_virtual
+    third_dy_tail = (third_y - left_virtual) + (right_virtual - fifth_y)
+    right_virtual = third_z - third_dz_head
+    left_virtual = third_dz_head + right_virtual
+    third_dz_tail = (third_z - left_virtual) + (right_virtual - fifth_z)
+    right_virtual = fourth_x - fourth_dx_head
+    left_virtual = fourth_dx_head + right_virtual
+    fourth_dx_tail = (fourth_x - left_virtual) + (right_virtual - fifth_x)
+    right_virtual = fourth_y - fourth_dy_head
+    left_virtual = fourth_dy_head + right_virtual
+    fourth_dy_tail = (fourth_y - left_virtual) + (right_virtual - fifth_y)
+    right_virtual = fourth_z - fourth_dz_head
+    left_virtual = fourth_dz_head + right_virtual
+    fourth_dz_tail = (fourth_z - left_virtual) + (right_virtual - fifth_z)
+    if (not first_dx_tail and not first_dy_tail and not first_dz_tail
+            and not second_dx_tail and not second_dy_tail
+            and not second_dz_tail
+            and not third_dx_tail and not third_dy_tail
+            and not third_dz_tail
+            and not fourth_dx_tail and not fourth_dy_tail
+            and not fourth_dz_tail):
+        if profiling.enabled:
+            profiling.record_exit('cospherical.determinant',
+                                  Stage.TAIL_FREE)
+        return result
+    first_second_cross_product_head = first_second_cross_product[-1]
+    second_third_cross_product_head = second_third_cross_product[-1]
+    third_fourth_cross_product_head = third_fourth_cross_product[-1]
+    fourth_first_cross_product_head = fourth_first_cross_product[-1]
+    first_third_cross_product_head = first_third_cross_product[-1]
+    second_fourth_cross_product_head = second_fourth_cross_product[-1]
+    first_second_cross_product_tail = _to_cross_product_tail(
+            first_dx_head, first_dx_tail, second_dy_head, second_dy_tail,
+            second_dx_head, second_dx_tail, first_dy_head, first_dy_tail)
+    second_third_cross_product_tail = _to_cross_product_tail(
+            second_dx_head, second_dx_tail, third_dy_head, third_dy_tail,
+            third_dx_head, third_dx_tail, second_dy_head, second_dy_tail)
+    third_fourth_cross_product_tail = _to_cross_product_tail(
+            third_dx_head, third_dx_tail, fourth_dy_head, fourth_dy_tail,
+            fourth_dx_head, fourth_dx_tail, third_dy_head, third_dy_tail)
+    fourth_first_cross_product_tail = _to_cross_product_tail(
+            fourth_dx_head, fourth_dx_tail, first_dy_head, first_dy_tail,
+            first_dx_head, first_dx_tail, fourth_dy_head, fourth_dy_tail)
+    first_third_cross_product_tail = _to_cross_product_tail(
+            first_dx_head, first_dx_tail, third_dy_head, third_dy_tail,
+            third_dx_head, third_dx_tail, first_dy_head, first_dy_tail)
+    second_fourth_cross_product_tail = _to_cross_product_tail(
+            second_dx_head, second_dx_tail, fourth_dy_head, fourth_dy_tail,
+            fourth_dx_head, fourth_dx_tail, second_dy_head, second_dy_tail)
+    error_bound = (bounds.to_cospherical_third_error(upper_bound)
+                   + bounds.to_determinant_error(result))
+    result += (_to_addend(fourth_dx_head, fourth_dx_tail, fourth_dy_head,
+                          fourth_dy_tail, fourth_dz_head, fourth_dz_tail,
+                          second_third_cross_product_head,
+                          second_third_cross_product_tail,
+                          first_dz_head, first_dz_tail,
+                          first_third_cross_product_head,
+                          first_third_cross_product_tail,
+                          -second_dz_head, -second_dz_tail,
+                          first_second_cross_product_head,
+                          first_second_cross_product_tail,
+                          third_dz_head, third_dz_tail)
+               + _to_addend(third_dx_head, third_dx_tail, third_dy_head,
+                            third_dy_tail, third_dz_head, third_dz_tail,
+                            first_second_cross_product_head,
+                            first_second_cross_product_tail,
+                            -fourth_dz_head, -fourth_dz_tail,
+                            second_fourth_cross_product_head,
+                            second_fourth_cross_product_tail,
+                            -first_dz_head, -first_dz_tail,
+                            fourth_first_cross_product_head,
+                            fourth_first_cross_product_tail,
+                            -second_dz_head, -second_dz_tail)
+               + _to_addend(second_dx_head, second_dx_tail, second_dy_head,
+                            second_dy_tail, second_dz_head, second_dz_tail,
+                            fourth_first_cross_product_head,
+                            fourth_first_cross_product_tail,
+                            third_dz_head, third_dz_tail,
+                            first_third_cross_product_head,
+                            first_third_cross_product_tail,
+                            fourth_dz_head, fourth_dz_tail,
+                            third_fourth_cross_product_head,
+                            third_fourth_cross_product_tail,
+                            first_dz_head, first_dz_tail)
+               + _to_addend(first_dx_head, first_dx_tail, first_dy_head,
+                            first_dy_tail, first_dz_head, first_dz_tail,
+                            third_fourth_cross_product_head,
+                            third_fourth_cross_product_tail,
+                            -second_dz_head, -second_dz_tail,
+                            second_fourth_cross_product_head,
+                            second_fourth_cross_product_tail,
+                            third_dz_head, third_dz_tail,
+                            second_third_cross_product_head,
+                            second_third_cross_product_tail,
+                            -fourth_dz_head, -fourth_dz_tail))
+    if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('cospherical.determinant',
+                                  Stage.THIRD_BOUND)
+        return result
+    first_second_cross_product = to_cross_product_with_tails(
+            first_dx_head, first_dx_tail, second_dy_head, second_dy_tail,
+            second_dx_head, second_dx_tail, first_dy_head, first_dy_tail)
+    second_third_cross_product = to_cross_product_with_tails(
+            second_dx_head, second_dx_tail, third_dy_head, third_dy_tail,
+            third_dx_head, third_dx_tail, second_dy_head, second_dy_tail)
+    third_fourth_cross_product = to_cross_product_with_tails(
+            third_dx_head, third_dx_tail, fourth_dy_head, fourth_dy_tail,
+            fourth_dx_head, fourth_dx_tail, third_dy_head, third_dy_tail)
+    fourth_first_cross_product = to_cross_product_with_tails(
+            fourth_dx_head, fourth_dx_tail, first_dy_head, first_dy_tail,
+            first_dx_head, first_dx_tail, fourth_dy_head, fourth_dy_tail)
+    first_third_cross_product = to_cross_product_with_tails(
+            first_dx_head, first_dx_tail, third_dy_head, third_dy_tail,
+            third_dx_head, third_dx_tail, first_dy_head, first_dy_tail)
+    second_fourth_cross_product = to_cross_product_with_tails(
+            second_dx_head, second_dx_tail, fourth_dy_head, fourth_dy_tail,
+            fourth_dx_head, fourth_dx_tail, second_dy_head, second_dy_tail)
+    result_expansion = sum_expansions(
+            sum_expansions(
+                    multiply_expansions(
+                            _to_squared_length(fourth_dx_head, fourth_dx_tail,
+                                               fourth_dy_head, fourth_dy_tail,
+                                               fourth_dz_head, fourth_dz_tail),
+                            _to_exact_volume(second_third_cross_product,
+                                             first_dz_head, first_dz_tail,
+                                             first_third_cross_product,
+                                             -second_dz_head, -second_dz_tail,
+                                             first_second_cross_product,
+                                             third_dz_head, third_dz_tail)),
+                    multiply_expansions(
+                            _to_squared_length(third_dx_head, third_dx_tail,
+                                               third_dy_head, third_dy_tail,
+                                               third_dz_head, third_dz_tail),
+                            _to_exact_volume(first_second_cross_product,
+                                             -fourth_dz_head, -fourth_dz_tail,
+                                             second_fourth_cross_product,
+                                             -first_dz_head, -first_dz_tail,
+                                             fourth_first_cross_product,
+                                             -second_dz_head,
+                                             -second_dz_tail))),
+            sum_expansions(
+                    multiply_expansions(
+                            _to_squared_length(second_dx_head, second_dx_tail,
+                                               second_dy_head, second_dy_tail,
+                                               second_dz_head, second_dz_tail),
+                            _to_exact_volume(fourth_first_cross_product,
+                                             third_dz_head, third_dz_tail,
+                                             first_third_cross_product,
+                                             fourth_dz_head, fourth_dz_tail,
+                                             third_fourth_cross_product,
+                                             first_dz_head, first_dz_tail)),
+                    multiply_expansions(
+                            _to_squared_length(first_dx_head, first_dx_tail,
+                                               first_dy_head, first_dy_tail,
+                                               first_dz_head, first_dz_tail),
+                            _to_exact_volume(third_fourth_cross_product,
+                                             -second_dz_head, -second_dz_tail,
+                                             second_fourth_cross_product,
+                                             third_dz_head, third_dz_tail,
+                                             second_third_cross_product,
+                                             -fourth_dz_head,
+                                             -fourth_dz_tail))))
+    if profiling.enabled:
+        profiling.record_exit('cospherical.determinant', Stage.EXPANSION)
+    return result_expansion[-1]
+
+
+def _multiply_by_squared_length(head: Expansion,
+                                dx_head: Real,
+                                dy_head: Real,
+                                dz_head: Real) -> Expansion:
+    return sum_expansions(
+            sum_expansions(scale_expansion(scale_expansion(head, dx_head),
+                                           dx_head),
+                           scale_expansion(scale_expansion(head, dy_head),
+                                           dy_head)),
+            scale_expansion(scale_expansion(head, dz_head), dz_head))
+
+
+def _to_addend(dx_head: Real,
+               dx_tail: Real,
+               dy_head: Real,
+               dy_tail: Real,
+               dz_head: Real,
+               dz_tail: Real,
+               first_cross_product_head: Real,
+               first_cross_product_tail: Real,
+               first_dz_head: Real,
+               first_dz_tail: Real,
+               second_cross_product_head: Real,
+               second_cross_product_tail: Real,
+               second_dz_head: Real,
+               second_dz_tail: Real,
+               third_cross_product_head: Real,
+               third_cross_product_tail: Real,
+               third_dz_head: Real,
+               third_dz_tail: Real) -> Real:
+    return ((dx_head * dx_head + dy_head * dy_head + dz_head * dz_head)
+            * ((first_dz_head * first_cross_product_tail
+                + second_dz_head * second_cross_product_tail
+                + third_dz_head * third_cross_product_tail)
+               + (first_dz_tail * first_cross_product_head
+                  + second_dz_tail * second_cross_product_head
+                  + third_dz_tail * third_cross_product_head))
+            + 2 * (dx_head * dx_tail + dy_head * dy_tail + dz_head * dz_tail)
+            * (first_dz_head * first_cross_product_head
+               + second_dz_head * second_cross_product_head
+               + third_dz_head * third_cross_product_head))
+
+
+def _to_cross_product_tail(minuend_multiplier_x_head: Real,
+                           minuend_multiplier_x_tail: Real,
+                           minuend_multiplier_y_head: Real,
+                           minuend_multiplier_y_tail: Real,
+                           subtrahend_multiplier_x_head: Real,
+                           subtrahend_multiplier_x_tail: Real,
+                           subtrahend_multiplier_y_head: Real,
+                           subtrahend_multiplier_y_tail: Real) -> Real:
+    return ((minuend_multiplier_x_head * minuend_multiplier_y_tail
+             + minuend_multiplier_y_head * minuend_multiplier_x_tail)
+            - (subtrahend_multiplier_x_head * subtrahend_multiplier_y_tail
+               + subtrahend_multiplier_y_head * subtrahend_multiplier_x_tail))
+
+
+def _to_exact_volume(first_cross_product: Expansion,
+                     first_dz_head: Real,
+                     first_dz_tail: Real,
+                     second_cross_product: Expansion,
+                     second_dz_head: Real,
+                     second_dz_tail: Real,
+                     third_cross_product: Expansion,
+                     third_dz_head: Real,
+                     third_dz_tail: Real) -> Expansion:
+    return sum_expansions(
+            sum_expansions(multiply_expansions(first_cross_product,
+                                               (first_dz_tail, first_dz_head)),
+                           multiply_expansions(second_cross_product,
+                                               (second_dz_tail,
+                                                second_dz_head))),
+            multiply_expansions(third_cross_product,
+                                (third_dz_tail, third_dz_head)))
+
+
+def _to_squared_length(dx_head: Real,
+                       dx_tail: Real,
+                       dy_head: Real,
+                       dy_tail: Real,
+                       dz_head: Real,
+                       dz_tail: Real) -> Expansion:
+    return sum_expansions(
+            sum_expansions(multiply_expansions((dx_tail, dx_head),
+                                               (dx_tail, dx_head)),
+                           multiply_expansions((dy_tail, dy_head),
+                                               (dy_tail, dy_head))),
+            multiply_expansions((dz_tail, dz_head), (dz_tail, dz_head)))
+
+
+def _to_volume(first_cross_product: Expansion,
+               first_dz: Real,
+               second_cross_product: Expansion,
+               second_dz: Real,
+               third_cross_product: Expansion,
+               third_dz: Real) -> Expansion:
+    return sum_expansions(
+            sum_expansions(scale_expansion(first_cross_product, first_dz),
+                           scale_expansion(second_cross_product, second_dz)),
+            scale_expansion(third_cross_product, third_dz))
+
+
+profiling.register('cospherical.determinant', determinant)
@@ -0,0 +1,335 @@
+from math import inf
+from array import array
+from random import Random
+from typing import (List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
+from .angular import orientation_sign
+from .cocircular import determinant_sign
+from .hints import Point
+
+#: index of the vertex at infinity shared by all ghost triangles,
+#: which close the triangulation outside of the convex hull
+GHOST = -1
+#: seed of insertion order randomization, fixed for reproducible output
+SEED = 0
+#: maximal order of Hilbert curve used for sorting insertion rounds
+MAX_HILBERT_ORDER = 16
+
+Triangle = Tuple[int, int, int]
+
+
+def delaunay_triangles(points: Sequence[Point]) -> List[Triangle]:
+    """
+    Returns Delaunay triangulation of given points
+    (e.g. a sequence of pairs or ``numpy`` array with shape ``(N, 2)``)
+    as a list of triangles given by indices of their vertices
+    in counterclockwise order.
+
+    Same as ``Triangulation(points).triangles``.
+
+    >>> delaunay_triangles([(0, 0), (2, 0), (1, 1)])
+    [(0, 1, 2)]
+    >>> sorted(map(sorted, delaunay_triangles([(0, 0), (3, 0), (3, 1),
+    ...                                        (0, 1)])))
+    [[0, 1, 2], [0, 2, 3]]
+    >>> delaunay_triangles([(0, 0), (1, 1), (2, 2)])
+    []
+    """
+    return Triangulation(points).triangles
+
+
+class Triangulation:
+    """
+    Delaunay triangulation of points.
+
+    Points are inserted incrementally in biased randomized order
+    with rounds sorted along Hilbert curve,
+    each point is located by a visibility walk
+    from the last created triangle
+    and its conflicting triangles are replaced with a star of new ones.
+    Triangles are stored in flat arrays of vertices and opposite half-edges
+    with each predicate evaluated at most once per triangle and insertion.
+
+    Duplicate points are represented by the index of one of them,
+    collinear points have no triangles.
+
+    Expected time complexity:
+        ``O(n * log n)``
+    Memory complexity:
+        ``O(n)``
+
+    where ``n`` is the number of points.
+
+    >>> triangulation = Triangulation([(0, 0), (2, 0), (2, 2), (0, 2),
+    ...                                (1, 1)])
+    >>> len(triangulation.triangles)
+    4
+    >>> sorted(triangulation.locate((1, 0)))
+    [0, 1, 4]
+    >>> triangulation.locate((3, 3)) is None
+    True
+    """
+    __slots__ = '_halfedges', '_last', '_points', '_triangles'
+
+    def __init__(self, points: Sequence[Point]) -> None:
+        if hasattr(points, 'tolist'):
+            points = points.tolist()
+        self._points = points = [tuple(point) for point in points]
+        self._triangles = self._halfedges = array('q')
+        self._last = None
+        order = _to_insertion_order(points, Random(SEED))
+        initial = _to_initial_triangle(points, order)
+        if initial is None:
+            return
+        first_index, second_index, third_index = initial
+        self._triangles = triangles = array(
+                'q', [first_index, second_index, third_index,
+                      second_index, first_index, GHOST,
+                      third_index, second_index, GHOST,
+                      first_index, third_index, GHOST])
+        self._halfedges = halfedges = array('q', [3, 6, 9, 0, 11, 7, 1, 5,
+                                                  10, 2, 8, 4])
+        last = 0
+        for index in order:
+            last = _insert(points, triangles, halfedges, last, index)
+        self._last = last
+
+    @property
+    def points(self) -> List[Point]:
+        """
+        Returns triangulated points.
+
+        >>> Triangulation([(0, 0), (1, 0), (0, 1)]).points
+        [(0, 0), (1, 0), (0, 1)]
+        """
+        return self._points[:]
+
+    @property
+    def triangles(self) -> List[Triangle]:
+        """
+        Returns triangles as triplets of vertices' indices
+        in counterclockwise order.
+
+        >>> Triangulation([(0, 0), (1, 0), (0, 1)]).triangles
+        [(0, 1, 2)]
+        """
+        triangles = self._triangles
+        return [vertices
+                for vertices in zip(triangles[::3], triangles[1::3],
+                                    triangles[2::3])
+                if GHOST not in vertices]
+
+    def locate(self, point: Point) -> Optional[Triangle]:
+        """
+        Returns triangle which contains given point
+        (possibly on its boundary)
+        or ``None`` if point lies outside of the convex hull.
+
+        >>> triangulation = Triangulation([(0, 0), (2, 0), (0, 2)])
+        >>> triangulation.locate((1, 1))
+        (0, 1, 2)
+        >>> triangulation.locate((2, 2)) is None
+        True
+        """
+        if self._last is None:
+            return None
+        triangle = _locate(self._points, self._triangles, self._halfedges,
+                           self._last, point)
+        triangles = self._triangles
+        vertices = tuple(triangles[3 * triangle:3 * triangle + 3])
+        return None if GHOST in vertices else vertices
+
+
+def _insert(points: List[Point],
+            triangles: array,
+            halfedges: array,
+            last: int,
+            index: int) -> int:
+    point = points[index]
+    located = _locate(points, triangles, halfedges, last, point)
+    base = 3 * located
+    for vertex in triangles[base:base + 3]:
+        if vertex != GHOST and points[vertex] == point:
+            return last
+    cavity = [located]
+    conflicts = {located: True}
+    boundary = []
+    edges = [base, base + 1, base + 2]
+    while edges:
+        edge = edges.pop()
+        opposite = halfedges[edge]
+        neighbour = opposite // 3
+        in_conflict = conflicts.get(neighbour)
+        if in_conflict is None:
+            in_conflict = conflicts[neighbour] = _in_conflict(
+                    points, triangles, neighbour, point)
+            if in_conflict:
+                cavity.append(neighbour)
+                neighbour_base = 3 * neighbour
+                edges += [neighbour_edge
+                          for neighbour_edge in (neighbour_base,
+                                                 neighbour_base + 1,
+                                                 neighbour_base + 2)
+                          if neighbour_edge != opposite]
+        if not in_conflict:
+            boundary.append(edge)
+    boundary = [(triangles[edge], triangles[_to_next_edge(edge)],
+                 halfedges[edge])
+                for edge in boundary]
+    slots = cavity
+    slots.append(len(triangles) // 3)
+    slots.append(len(triangles) // 3 + 1)
+    triangles.extend((GHOST, GHOST, GHOST, GHOST, GHOST, GHOST))
+    halfedges.extend((-1, -1, -1, -1, -1, -1))
+    slots_by_start = {}
+    for slot, (start, end, outer) in zip(slots, boundary):
+        base = 3 * slot
+        triangles[base], triangles[base + 1], triangles[base + 2] = (
+            start, end, index)
+        halfedges[base], halfedges[outer] = outer, base
+        slots_by_start[start] = slot
+        if start != GHOST and end != GHOST:
+            last = slot
+    for slot, (_, end, _) in zip(slots, boundary):
+        next_edge = 3 * slots_by_start[end] + 2
+        halfedges[3 * slot + 1], halfedges[next_edge] = next_edge, 3 * slot + 1
+    return last
+
+
+def _in_conflict(points: List[Point],
+                 triangles: array,
+                 triangle: int,
+                 point: Point) -> bool:
+    base = 3 * triangle
+    first_vertex, second_vertex, third_vertex = triangles[base:base + 3]
+    if third_vertex == GHOST:
+        start, end = first_vertex, second_vertex
+    elif first_vertex == GHOST:
+        start, end = second_vertex, third_vertex
+    elif second_vertex == GHOST:
+        start, end = third_vertex, first_vertex
+    else:
+        return determinant_sign(points[first_vertex], points[second_vertex],
+                                points[third_vertex], point) > 0
+    start_point, end_point = points[start], points[end]
+    orientation = orientation_sign(end_point, start_point, point)
+    return orientation > 0 or (not orientation
+                               and start_point != point != end_point
+                               and _in_bounding_box(start_point, end_point,
+                                                    point))
+
+
+def _in_bounding_box(start: Point, end: Point, point: Point) -> bool:
+    (start_x, start_y), (end_x, end_y), (x, y) = start, end, point
+    return ((start_x <= x <= end_x or end_x <= x <= start_x)
+            and (start_y <= y <= end_y or end_y <= y <= start_y))
+
+
+def _locate(points: List[Point],
+            triangles: array,
+            halfedges: array,
+            triangle: int,
+            point: Point) -> int:
+    entered = -1
+    while True:
+        base = 3 * triangle
+        for edge in (base, base + 1, base + 2):
+            if edge == entered:
+                continue
+            if orientation_sign(points[triangles[_to_next_edge(edge)]],
+                                points[triangles[edge]], point) < 0:
+                entered = halfedges[edge]
+                triangle = entered // 3
+                if triangles[_to_previous_edge(entered)] == GHOST:
+                    return triangle
+                break
+        else:
+            return triangle
+
+
+def _to_next_edge(edge: int) -> int:
+    return edge - 2 if edge % 3 == 2 else edge + 1
+
+
+def _to_previous_edge(edge: int) -> int:
+    return edge + 2 if edge % 3 == 0 else edge - 1
+
+
+def _to_initial_triangle(points: List[Point],
+                         order: List[int]) -> Optional[Triangle]:
+    if not order:
+        return None
+    first_point = points[order[0]]
+    second_position = next((position
+                            for position in range(1, len(order))
+                            if points[order[position]] != first_point),
+                           None)
+    if second_position is None:
+        return None
+    second_point = points[order[second_position]]
+    for third_position in range(second_position + 1, len(order)):
+        orientation = orientation_sign(second_point, first_point,
+                                       points[order[third_position]])
+        if orientation:
+            break
+    else:
+        return None
+    first_index = order[0]
+    second_index = order.pop(third_position)
+    third_index = order.pop(second_position)
+    del order[0]
+    return ((first_index, third_index, second_index)
+            if orientation > 0
+            else (first_index, second_index, third_index))
+
+
+def _to_insertion_order(points: List[Point], random: Random) -> List[int]:
+    points_count = len(points)
+    indices = list(range(points_count))
+    if points_count < 2:
+        return indices
+    random.shuffle(indices)
+    xs, ys = zip(*points)
+    min_x, min_y = min(xs), min(ys)
+    span = max(max(xs) - min_x, max(ys) - min_y)
+    if span == inf:
+        # differences of finite floats can overflow, of halved ones cannot
+        xs, ys = [x / 2 for x in xs], [y / 2 for y in ys]
+        min_x, min_y = min_x / 2, min_y / 2
+        span = max(max(xs) - min_x, max(ys) - min_y)
+    order = min(max((points_count.bit_length() + 1) // 2, 1),
+                MAX_HILBERT_ORDER)
+    side = 1 << order
+    if span:
+        def to_key(index: int) -> int:
+            return _to_hilbert_index(
+                    int((xs[index] - min_x) / span * (side - 1)),
+                    int((ys[index] - min_y) / span * (side - 1)),
+                    side)
+    else:
+        def to_key(index: int) -> int:
+            return 0
+    result = []
+    round_start = 0
+    for shift in range(points_count.bit_length() - 1, -1, -1):
+        round_end = points_count >> shift
+        result.extend(sorted(indices[round_start:round_end], key=to_key))
+        round_start = round_end
+    return result
+
+
+def _to_hilbert_index(x: int, y: int, side: int) -> int:
+    result = 0
+    step = side >> 1
+    while step:
+        x_bit, y_bit = bool(x & step), bool(y & step)
+        result += step * step * ((3 * x_bit) ^ y_bit)
+        if not y_bit:
+            if x_bit:
+                x, y = side - 1 - x, side - 1 - y
+            x, y = y, x
+        step >>= 1
+    return result
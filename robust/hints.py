@@ -3,5 +3,6 @@ from typing import (Sequence,
                     Tuple)
 
 Point = Tuple[Real, Real]
+Point3D = Tuple[Real, Real, Real]
 Segment = Tuple[Point, Point]
 Expansion = Sequence[Real]
@@ -0,0 +1,49 @@
+from typing import (Iterable,
+                    List,
+                    Sequence)
+
+from .angular import orientation_sign
+from .hints import Point
+
+
+def convex_hull(points: Iterable[Point]) -> List[Point]:
+    """
+    Returns convex hull of given points
+    (e.g. a sequence of pairs or ``numpy`` array with shape ``(N, 2)``)
+    as a list of vertices in counterclockwise order
+    starting from the lexicographically smallest one
+    without collinear points.
+
+    Based on Andrew's monotone chain algorithm.
+
+    Time complexity:
+        ``O(n * log n)``
+    Memory complexity:
+        ``O(n)``
+
+    where ``n`` is the number of points.
+
+    >>> convex_hull([(0, 0), (2, 0), (1, 1), (2, 2), (0, 2), (1, 0)])
+    [(0, 0), (2, 0), (2, 2), (0, 2)]
+    >>> convex_hull([(0, 0), (1, 1), (2, 2)])
+    [(0, 0), (2, 2)]
+    >>> convex_hull([(1, 1), (1, 1)])
+    [(1, 1)]
+    """
+    if hasattr(points, 'tolist'):
+        points = points.tolist()
+    points = sorted(set(map(tuple, points)))
+    if len(points) < 3:
+        return points
+    lower, upper = _to_half_hull(points), _to_half_hull(reversed(points))
+    return lower[:-1] + upper[:-1]
+
+
+def _to_half_hull(points: Iterable[Point]) -> Sequence[Point]:
+    result = []
+    for point in points:
+        while (len(result) >= 2
+               and orientation_sign(result[-1], result[-2], point) <= 0):
+            del result[-1]
+        result.append(point)
+    return result
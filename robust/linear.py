@@ -1,13 +1,43 @@
+import sys
 from enum import (IntEnum,
                   unique)
 from fractions import Fraction
-from typing import Tuple
+from functools import cmp_to_key
+from heapq import (heapify,
+                   heappop,
+                   heappush)
+from itertools import (chain,
+                       combinations)
+from math import isfinite
+from numbers import Real
+from random import Random
+from typing import (Callable,
+                    Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
 
-from .angular import (Orientation,
-                      orientation)
+from . import (bounds,
+               profiling)
+from .angular import orientation_sign
 from .hints import (Point,
                     Segment)
-from .parallelogram import signed_area
+from .parallelogram import (_adjusted_prepared_signed_area_sign,
+                            _adjusted_signed_area,
+                            signed_area,
+                            signed_area_sign)
+from .utils import (split,
+                    to_exact,
+                    to_rational_differences,
+                    to_sign,
+                    two_diff_tail)
+
+#: seed of sweep line status priorities, fixed for reproducible output
+SEED = 0
+#: half-size of floating point box around crossing relative to its coordinates
+BOX_RELATIVE_SIZE = 2. ** -51
 
 
 @unique
@@ -60,10 +90,11 @@ def segments_relationship(left: Segment,
         left_start, left_end = left_end, left_start
     if right_start > right_end:
         right_start, right_end = right_end, right_start
-    left_start_orientation = orientation(right_start, right_end, left_start)
-    left_end_orientation = orientation(right_start, right_end, left_end)
-    if left_start_orientation is left_end_orientation:
-        if left_start_orientation is Orientation.COLLINEAR:
+    left_start_orientation = orientation_sign(right_start, right_end,
+                                              left_start)
+    left_end_orientation = orientation_sign(right_start, right_end, left_end)
+    if left_start_orientation == left_end_orientation:
+        if not left_start_orientation:
             if left_start == right_start:
                 return SegmentsRelationship.OVERLAP
             elif left_end == right_end:
@@ -78,25 +109,26 @@ def segments_relationship(left: Segment,
                 return SegmentsRelationship.NONE
         else:
             return SegmentsRelationship.NONE
-    elif left_start_orientation is Orientation.COLLINEAR:
+    elif not left_start_orientation:
         return (SegmentsRelationship.TOUCH
                 if right_start <= left_start <= right_end
                 else SegmentsRelationship.NONE)
-    elif left_end_orientation is Orientation.COLLINEAR:
+    elif not left_end_orientation:
         return (SegmentsRelationship.TOUCH
                 if right_start <= left_end <= right_end
                 else SegmentsRelationship.NONE)
     else:
-        right_start_orientation = orientation(left_end, left_start,
-                                              right_start)
-        right_end_orientation = orientation(left_end, left_start, right_end)
-        if right_start_orientation is right_end_orientation:
+        right_start_orientation = orientation_sign(left_end, left_start,
+                                                   right_start)
+        right_end_orientation = orientation_sign(left_end, left_start,
+                                                 right_end)
+        if right_start_orientation == right_end_orientation:
             return SegmentsRelationship.NONE
-        elif right_start_orientation is Orientation.COLLINEAR:
+        elif not right_start_orientation:
             return (SegmentsRelationship.TOUCH
                     if left_start < right_start < left_end
                     else SegmentsRelationship.NONE)
-        elif right_end_orientation is Orientation.COLLINEAR:
+        elif not right_end_orientation:
             return (SegmentsRelationship.TOUCH
                     if left_start < right_end < left_end
                     else SegmentsRelationship.NONE)
@@ -126,7 +158,14 @@ def segments_intersections(left: Segment, right: Segment) -> Tuple[Point, ...]:
     >>> segments_intersections(((0, 0), (2, 0)), ((3, 0), (4, 0))) == ()
     True
     """
-    relationship = segments_relationship(left, right)
+    return _to_intersections(left, right,
+                             segments_relationship(left, right))
+
+
+def _to_intersections(left: Segment,
+                      right: Segment,
+                      relationship: SegmentsRelationship
+                      ) -> Tuple[Point, ...]:
     if relationship is SegmentsRelationship.NONE:
         return ()
     elif relationship is SegmentsRelationship.OVERLAP:
@@ -136,6 +175,67 @@ def segments_intersections(left: Segment, right: Segment) -> Tuple[Point, ...]:
         return segments_intersection(left, right),
 
 
+def segments_relationships(segments: Sequence[Segment]
+                           ) -> Dict[Tuple[int, int], SegmentsRelationship]:
+    """
+    Finds relationships between all pairs of intersecting segments.
+
+    Returns mapping from pairs of indices of intersecting segments
+    (with the first index less than the second one)
+    to their relationship.
+
+    Segments passing through the same point are found
+    with Bentley-Ottmann sweep line based on exact orientations
+    and only them are checked with ``segments_relationship``.
+
+    Time complexity:
+        ``O((n + k) * log n)``
+    Memory complexity:
+        ``O(n + k)``
+
+    where ``n`` is the number of segments,
+    ``k`` -- the number of intersecting pairs.
+
+    >>> (segments_relationships([((0, 0), (2, 0)), ((1, -1), (1, 1)),
+    ...                          ((2, 0), (3, 0)), ((5, 5), (6, 6))])
+    ...  == {(0, 1): SegmentsRelationship.CROSS,
+    ...      (0, 2): SegmentsRelationship.TOUCH})
+    True
+    """
+    result = {}
+    for indices in _to_intersecting_segments_indices(segments):
+        for first_index, second_index in combinations(sorted(indices), 2):
+            if (first_index, second_index) in result:
+                continue
+            relationship = segments_relationship(segments[first_index],
+                                                 segments[second_index])
+            if relationship is not SegmentsRelationship.NONE:
+                result[first_index, second_index] = relationship
+    return result
+
+
+def all_intersections(segments: Sequence[Segment]
+                      ) -> Dict[Tuple[int, int], Tuple[Point, ...]]:
+    """
+    Finds intersections of all pairs of intersecting segments.
+
+    Returns mapping from pairs of indices of intersecting segments
+    (with the first index less than the second one)
+    to their intersections.
+
+    >>> (all_intersections([((0, 0), (2, 0)), ((1, -1), (1, 1)),
+    ...                     ((1, 0), (3, 0)), ((5, 5), (6, 6))])
+    ...  == {(0, 1): ((1, 0),), (0, 2): ((1, 0), (2, 0)), (1, 2): ((1, 0),)})
+    True
+    """
+    result = {}
+    for ((first_index, second_index),
+         relationship) in segments_relationships(segments).items():
+        result[first_index, second_index] = _to_intersections(
+                segments[first_index], segments[second_index], relationship)
+    return result
+
+
 def segments_intersection(left: Segment, right: Segment) -> Point:
     """
     Finds intersection point of segments that known to have only one.
@@ -158,38 +258,44 @@ def segments_intersection(left: Segment, right: Segment) -> Point:
     elif segment_contains(right, left_end):
         return left_end
     else:
-        denominator = signed_area(left_start, left_end, right_start, right_end)
-        left_base_numerator = signed_area(left_start, right_start,
-                                          right_start, right_end)
-        right_base_numerator = signed_area(left_start, right_start,
-                                           left_start, left_end)
-        left_start_x, left_start_y = left_start
-        left_end_x, left_end_y = left_end
-        right_start_x, right_start_y = right_start
-        right_end_x, right_end_y = right_end
-        left_x_addend = (left_end_x - left_start_x) * left_base_numerator
-        left_y_addend = (left_end_y - left_start_y) * left_base_numerator
-        right_x_addend = (right_end_x - right_start_x) * right_base_numerator
-        right_y_addend = (right_end_y - right_start_y) * right_base_numerator
-        delta_x, delta_y = (abs(right_x_addend) - abs(left_x_addend),
-                            abs(right_y_addend) - abs(left_y_addend))
-        denominator_inv = (Fraction(1, denominator)
-                           if isinstance(denominator, int)
-                           else 1 / denominator)
-        return (left_start_x + left_x_addend * denominator_inv
-                if delta_x > 0
-                else (right_start_x + right_x_addend * denominator_inv
-                      if delta_x < 0
-                      else (left_start_x + right_start_x
-                            + (left_x_addend + right_x_addend)
-                            * denominator_inv) / 2),
-                left_start_y + left_y_addend * denominator_inv
-                if delta_y > 0
-                else (right_start_y + right_y_addend * denominator_inv
-                      if delta_y < 0
-                      else (left_start_y + right_start_y
-                            + (left_y_addend + right_y_addend)
-                            * denominator_inv) / 2))
+        return _to_cross_point(left, right)
+
+
+def _to_cross_point(left: Segment, right: Segment) -> Point:
+    left_start, left_end = left
+    right_start, right_end = right
+    denominator = signed_area(left_start, left_end, right_start, right_end)
+    left_base_numerator = signed_area(left_start, right_start,
+                                      right_start, right_end)
+    right_base_numerator = signed_area(left_start, right_start,
+                                       left_start, left_end)
+    left_start_x, left_start_y = left_start
+    left_end_x, left_end_y = left_end
+    right_start_x, right_start_y = right_start
+    right_end_x, right_end_y = right_end
+    left_x_addend = (left_end_x - left_start_x) * left_base_numerator
+    left_y_addend = (left_end_y - left_start_y) * left_base_numerator
+    right_x_addend = (right_end_x - right_start_x) * right_base_numerator
+    right_y_addend = (right_end_y - right_start_y) * right_base_numerator
+    delta_x, delta_y = (abs(right_x_addend) - abs(left_x_addend),
+                        abs(right_y_addend) - abs(left_y_addend))
+    denominator_inv = (Fraction(1, denominator)
+                       if isinstance(denominator, int)
+                       else 1 / denominator)
+    return (left_start_x + left_x_addend * denominator_inv
+            if delta_x > 0
+            else (right_start_x + right_x_addend * denominator_inv
+                  if delta_x < 0
+                  else (left_start_x + right_start_x
+                        + (left_x_addend + right_x_addend)
+                        * denominator_inv) / 2),
+            left_start_y + left_y_addend * denominator_inv
+            if delta_y > 0
+            else (right_start_y + right_y_addend * denominator_inv
+                  if delta_y < 0
+                  else (left_start_y + right_start_y
+                        + (left_y_addend + right_y_addend)
+                        * denominator_inv) / 2))
 
 
 def segment_contains(segment: Segment, point: Point) -> bool:
@@ -212,7 +318,328 @@ def segment_contains(segment: Segment, point: Point) -> bool:
     start, end = segment
     return (point == start or point == end
             or (_bounding_box_contains(segment, point)
-                and orientation(end, start, point) is Orientation.COLLINEAR))
+                and not orientation_sign(end, start, point)))
+
+
+class PreparedLine:
+    """
+    Represents line through two points with cached data
+    for classifying many points against it.
+
+    >>> line = PreparedLine((0, 0), (2, 0))
+    >>> line.sign((1, 1))
+    1
+    >>> line.classify([(1, 1), (3, 0), (1, -1)])
+    [1, 0, -1]
+    """
+    __slots__ = ('_start', '_end', '_start_x', '_start_y', '_end_x', '_end_y',
+                 '_delta_x', '_delta_x_tail', '_delta_x_low', '_delta_x_high',
+                 '_delta_y', '_delta_y_tail', '_delta_y_low', '_delta_y_high',
+                 '_exact')
+
+    def __init__(self, start: Point, end: Point) -> None:
+        self._start, self._end = start, end
+        (self._start_x, self._start_y), (self._end_x, self._end_y) = start, end
+        coordinates = to_exact(self._start_x, self._start_y, self._end_x,
+                               self._end_y)
+        self._exact = coordinates is not None
+        if self._exact:
+            self._start_x, self._start_y, self._end_x, self._end_y = (
+                coordinates)
+        delta_x = self._delta_x = self._end_x - self._start_x
+        delta_y = self._delta_y = self._end_y - self._start_y
+        if type(delta_x) is float and type(delta_y) is float:
+            self._delta_x_tail = two_diff_tail(self._end_x, self._start_x,
+                                               delta_x)
+            self._delta_y_tail = two_diff_tail(self._end_y, self._start_y,
+                                               delta_y)
+            self._delta_x_low, self._delta_x_high = split(delta_x)
+            self._delta_y_low, self._delta_y_high = split(delta_y)
+        else:
+            self._delta_x_tail = self._delta_y_tail = None
+            self._delta_x_low = self._delta_x_high = None
+            self._delta_y_low = self._delta_y_high = None
+
+    @property
+    def start(self) -> Point:
+        """
+        Returns start of the line.
+
+        >>> PreparedLine((0, 0), (2, 0)).start == (0, 0)
+        True
+        """
+        return self._start
+
+    @property
+    def end(self) -> Point:
+        """
+        Returns end of the line.
+
+        >>> PreparedLine((0, 0), (2, 0)).end == (2, 0)
+        True
+        """
+        return self._end
+
+    def classify(self, points: Iterable[Point]) -> Sequence[int]:
+        """
+        Returns signs of given points' positions relative to the line.
+
+        Points can be given as an iterable
+        (then signs are returned as a ``list``)
+        or as ``(N, 2)`` ``numpy`` array
+        (then signs are returned as ``numpy`` array of ``int8``s
+        and only rows ambiguous for floating point filter
+        are evaluated exactly).
+
+        >>> line = PreparedLine((0, 0), (2, 0))
+        >>> line.classify(iter([(0, 1), (-1, 0), (0, -1)]))
+        [1, 0, -1]
+        """
+        numpy = sys.modules.get('numpy')
+        if numpy is not None and isinstance(points, numpy.ndarray):
+            from .vectorized import _to_line_signs
+            return _to_line_signs(self, points)
+        return [self.sign(point) for point in points]
+
+    def sign(self, point: Point) -> int:
+        """
+        Returns sign of given point's position relative to the line:
+        positive if point lies to the left (counterclockwise),
+        negative if it lies to the right (clockwise),
+        zero if it lies on the line.
+
+        Same as ``orientation_sign(self.end, self.start, point)``.
+
+        >>> line = PreparedLine((0, 0), (2, 0))
+        >>> line.sign((1, 1))
+        1
+        >>> line.sign((3, 0))
+        0
+        >>> line.sign((1, -1))
+        -1
+        """
+        point_x, point_y = point
+        start_x, start_y = self._start_x, self._start_y
+        point_dx, point_dy = point_x - start_x, point_y - start_y
+        if self._exact and type(point_dx) is not float:
+            differences = to_rational_differences((point_dx, point_dy),
+                                                  point_x, start_x, point_y,
+                                                  start_y)
+            if differences is not None:
+                point_dx, point_dy = differences
+                return to_sign(self._delta_x * point_dy
+                               - self._delta_y * point_dx)
+        minuend = self._delta_x * point_dy
+        subtrahend = self._delta_y * point_dx
+        if minuend > 0:
+            if subtrahend <= 0:
+                return 1
+            else:
+                upper_bound = minuend + subtrahend
+        elif minuend < 0:
+            if subtrahend >= 0:
+                return -1
+            else:
+                upper_bound = -minuend - subtrahend
+        else:
+            return to_sign(-subtrahend)
+        result = minuend - subtrahend
+        error_bound = bounds.to_signed_measure_first_error(upper_bound)
+        if result >= error_bound or -result >= error_bound:
+            return to_sign(result)
+        return self._adjusted_sign(point_x, point_y, upper_bound)
+
+    def _adjusted_sign(self,
+                       point_x: Real,
+                       point_y: Real,
+                       upper_bound: Real) -> int:
+        start_x, start_y = self._start_x, self._start_y
+        if self._delta_x_tail is None:
+            return to_sign(_adjusted_signed_area(
+                    start_x, start_y, self._end_x, self._end_y, start_x,
+                    start_y, point_x, point_y, upper_bound, True))
+        else:
+            return _adjusted_prepared_signed_area_sign(
+                    start_x, start_y, self._delta_x, self._delta_x_tail,
+                    self._delta_x_low, self._delta_x_high, self._delta_y,
+                    self._delta_y_tail, self._delta_y_low,
+                    self._delta_y_high, point_x, point_y, upper_bound)
+
+
+class PreparedSegment:
+    """
+    Represents segment with cached data
+    for repeated queries against other segments.
+
+    >>> segment = PreparedSegment(((0, 0), (2, 0)))
+    >>> segment.relationship(((1, -1), (1, 1))) is SegmentsRelationship.CROSS
+    True
+    >>> segment.relationship(((3, 0), (4, 0))) is SegmentsRelationship.NONE
+    True
+    >>> segment.intersections(((1, 0), (3, 0))) == ((1, 0), (2, 0))
+    True
+    >>> segment.contains((1, 0))
+    True
+    """
+    __slots__ = ('_segment', '_start', '_end', '_line',
+                 '_min_x', '_max_x', '_min_y', '_max_y')
+
+    def __init__(self, segment: Segment) -> None:
+        start, end = segment
+        if start > end:
+            start, end = end, start
+        self._segment, self._start, self._end = segment, start, end
+        self._line = PreparedLine(start, end)
+        (self._min_x, start_y), (self._max_x, end_y) = start, end
+        self._min_y, self._max_y = ((start_y, end_y)
+                                    if start_y < end_y
+                                    else (end_y, start_y))
+
+    @property
+    def segment(self) -> Segment:
+        """
+        Returns prepared segment.
+
+        >>> PreparedSegment(((0, 0), (2, 0))).segment == ((0, 0), (2, 0))
+        True
+        """
+        return self._segment
+
+    def contains(self, point: Point) -> bool:
+        """
+        Checks if the segment contains point.
+
+        Same as ``segment_contains(self.segment, point)``.
+
+        >>> segment = PreparedSegment(((0, 0), (2, 0)))
+        >>> segment.contains((2, 0))
+        True
+        >>> segment.contains((1, 1))
+        False
+        >>> segment.contains((3, 0))
+        False
+        """
+        return (point == self._start or point == self._end
+                or (_bounding_box_contains(self._segment, point)
+                    and not self._line.sign(point)))
+
+    def intersections(self, other: Segment) -> Tuple[Point, ...]:
+        """
+        Finds intersections of the segment with other one.
+
+        Same as ``segments_intersections(self.segment, other)``.
+
+        >>> segment = PreparedSegment(((0, 0), (2, 0)))
+        >>> segment.intersections(((0, 0), (2, 0))) == ((0, 0), (2, 0))
+        True
+        >>> segment.intersections(((1, 0), (1, 1))) == ((1, 0),)
+        True
+        >>> segment.intersections(((1, -1), (1, 1))) == ((1, 0),)
+        True
+        >>> segment.intersections(((3, 0), (4, 0))) == ()
+        True
+        """
+        relationship = self.relationship(other)
+        if relationship is SegmentsRelationship.NONE:
+            return ()
+        elif relationship is SegmentsRelationship.OVERLAP:
+            _, first_intersection, second_intersection, _ = sorted(
+                    self._segment + other)
+            return first_intersection, second_intersection
+        elif relationship is SegmentsRelationship.TOUCH:
+            other_start, other_end = other
+            if self.contains(other_start):
+                return other_start,
+            elif self.contains(other_end):
+                return other_end,
+            elif segment_contains(other, self._segment[0]):
+                return self._segment[0],
+            else:
+                return self._segment[1],
+        else:
+            return _to_cross_point(self._segment, other),
+
+    def relationship(self, other: Segment) -> SegmentsRelationship:
+        """
+        Finds relationship of the segment with other one.
+
+        Same as ``segments_relationship(self.segment, other)``,
+        but segments with disjoint bounding boxes are rejected
+        before evaluation of any orientation.
+
+        >>> segment = PreparedSegment(((0, 0), (2, 0)))
+        >>> (segment.relationship(((2, 0), (0, 0)))
+        ...  is SegmentsRelationship.OVERLAP)
+        True
+        >>> (segment.relationship(((0, 0), (0, 2)))
+        ...  is SegmentsRelationship.TOUCH)
+        True
+        >>> (segment.relationship(((1, -1), (1, 1)))
+        ...  is SegmentsRelationship.CROSS)
+        True
+        >>> (segment.relationship(((3, -1), (3, 1)))
+        ...  is SegmentsRelationship.NONE)
+        True
+        """
+        other_start, other_end = other
+        (other_start_x, other_start_y), (other_end_x, other_end_y) = other
+        if other_start_x < other_end_x:
+            if other_end_x < self._min_x or self._max_x < other_start_x:
+                return SegmentsRelationship.NONE
+        elif other_start_x < self._min_x or self._max_x < other_end_x:
+            return SegmentsRelationship.NONE
+        if other_start_y < other_end_y:
+            if other_end_y < self._min_y or self._max_y < other_start_y:
+                return SegmentsRelationship.NONE
+        elif other_start_y < self._min_y or self._max_y < other_end_y:
+            return SegmentsRelationship.NONE
+        if other_start > other_end:
+            other_start, other_end = other_end, other_start
+        start, end = self._start, self._end
+        if other_start == start and other_end == end:
+            return SegmentsRelationship.OVERLAP
+        other_start_orientation = self._line.sign(other_start)
+        other_end_orientation = self._line.sign(other_end)
+        if other_start_orientation == other_end_orientation:
+            if not other_start_orientation:
+                if other_start == start:
+                    return SegmentsRelationship.OVERLAP
+                elif other_end == end:
+                    return SegmentsRelationship.OVERLAP
+                elif other_start == end or other_end == start:
+                    return SegmentsRelationship.TOUCH
+                elif start < other_start < end:
+                    return SegmentsRelationship.OVERLAP
+                elif other_start < start < other_end:
+                    return SegmentsRelationship.OVERLAP
+                else:
+                    return SegmentsRelationship.NONE
+            else:
+                return SegmentsRelationship.NONE
+        elif not other_start_orientation:
+            return (SegmentsRelationship.TOUCH
+                    if start <= other_start <= end
+                    else SegmentsRelationship.NONE)
+        elif not other_end_orientation:
+            return (SegmentsRelationship.TOUCH
+                    if start <= other_end <= end
+                    else SegmentsRelationship.NONE)
+        else:
+            start_orientation = orientation_sign(other_end, other_start,
+                                                 start)
+            end_orientation = orientation_sign(other_end, other_start, end)
+            if start_orientation == end_orientation:
+                return SegmentsRelationship.NONE
+            elif not start_orientation:
+                return (SegmentsRelationship.TOUCH
+                        if other_start < start < other_end
+                        else SegmentsRelationship.NONE)
+            elif not end_orientation:
+                return (SegmentsRelationship.TOUCH
+                        if other_start < end < other_end
+                        else SegmentsRelationship.NONE)
+            else:
+                return SegmentsRelationship.CROSS
 
 
 def _bounding_box_contains(segment: Segment, point: Point) -> bool:
@@ -225,3 +652,256 @@ def _bounding_box_contains(segment: Segment, point: Point) -> bool:
                        else (end_y, start_y))
     point_x, point_y = point
     return left_x <= point_x <= right_x and bottom_y <= point_y <= top_y
+
+
+def _to_intersecting_segments_indices(
+        segments: Sequence[Segment]) -> Iterable[List[int]]:
+    """
+    Yields indices of segments passing through each event point
+    shared by more than one segment.
+
+    Sweeps vertical line from left to right over endpoints and crossings
+    (calculated exactly as fractions)
+    keeping segments which intersect it ordered from bottom to top
+    with exact orientations.
+    """
+    normalized = [(start, end) if start < end else (end, start)
+                  for start, end in segments]
+    floating = all(type(coordinate) is float
+                   for segment in normalized
+                   for point in segment
+                   for coordinate in point)
+    endpoints = {}
+    for index, (start, end) in enumerate(normalized):
+        endpoints.setdefault(start, []).append(index)
+        endpoints.setdefault(end, [])
+    queue = ([_to_floating_event(point) for point in endpoints]
+             if floating
+             else list(endpoints))
+    heapify(queue)
+    crossings = {}
+    exact_segments = {}
+    random = Random(SEED).random
+    status = None
+
+    def to_exact_segment(index: int) -> Segment:
+        try:
+            return exact_segments[index]
+        except KeyError:
+            result = exact_segments[index] = _to_exact_segment(
+                    normalized[index])
+            return result
+
+    def compare(left_index: int, right_index: int) -> int:
+        left_start, left_end = normalized[left_index]
+        right_start, right_end = normalized[right_index]
+        return -signed_area_sign(left_start, left_end, right_start, right_end)
+
+    while queue:
+        event = heappop(queue)
+        point = (event[1], event[3]) if floating else event
+        starts = endpoints.pop(point, None)
+        if starts is None:
+            crossing_indices = crossings.pop(point)
+            box = _to_box(point) if floating else None
+
+            def to_orientation(index: int) -> int:
+                if index in crossing_indices:
+                    return 0
+                elif box is not None:
+                    start, end = normalized[index]
+                    result = _to_box_orientation(start, end, box)
+                    if result is not None:
+                        return result
+                start, end = to_exact_segment(index)
+                return orientation_sign(end, start, point)
+        else:
+            def to_orientation(index: int) -> int:
+                start, end = normalized[index]
+                return orientation_sign(end, start, point)
+
+        def is_below(index: int) -> bool:
+            return to_orientation(index) > 0
+
+        def contains(index: int) -> bool:
+            return not to_orientation(index)
+
+        below, rest = _split(status, is_below)
+        if rest is not None and contains(_to_leftmost(rest)):
+            containing, above = _split(rest, contains)
+            passing = _to_indices(containing)
+        else:
+            above, passing = rest, []
+        if starts is None:
+            starts, middle = [], passing
+        else:
+            middle = [index
+                      for index in chain(starts, passing)
+                      if normalized[index][1] != point]
+        if len(starts) + len(passing) > 1:
+            yield starts + passing
+        middle.sort(key=cmp_to_key(compare))
+        lower, upper = _to_rightmost(below), _to_leftmost(above)
+        for lower_index, upper_index in ([(lower, middle[0]),
+                                          (middle[-1], upper)]
+                                         if middle
+                                         else [(lower, upper)]):
+            if lower_index is None or upper_index is None:
+                continue
+            lower_start, lower_end = lower_segment = normalized[lower_index]
+            upper_start, upper_end = upper_segment = normalized[upper_index]
+            # crossing of diverging segments is already swept
+            if (signed_area_sign(lower_start, lower_end, upper_start,
+                                 upper_end) >= 0
+                    or (segments_relationship(lower_segment, upper_segment)
+                        is not SegmentsRelationship.CROSS)):
+                continue
+            cross_point = _to_exact_cross_point(
+                    to_exact_segment(lower_index),
+                    to_exact_segment(upper_index))
+            if cross_point in endpoints:
+                continue
+            cross_point_indices = crossings.get(cross_point)
+            if cross_point_indices is None:
+                cross_point_indices = crossings[cross_point] = set()
+                heappush(queue, (_to_floating_event(cross_point)
+                                 if floating
+                                 else cross_point))
+            cross_point_indices.update((lower_index, upper_index))
+        middle_tree = None
+        for index in middle:
+            middle_tree = _merge(middle_tree, _Node(index, random()))
+        status = _merge(_merge(below, middle_tree), above)
+
+
+def _to_box(point: Point) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Returns bounds of floating point box which contains given exact point
+    or ``None`` if some of them overflow.
+    """
+    point_x, point_y = point
+    approximate_x, approximate_y = float(point_x), float(point_y)
+    delta_x = abs(approximate_x) * BOX_RELATIVE_SIZE + sys.float_info.min
+    delta_y = abs(approximate_y) * BOX_RELATIVE_SIZE + sys.float_info.min
+    result = (approximate_x - delta_x, approximate_x + delta_x,
+              approximate_y - delta_y, approximate_y + delta_y)
+    return result if all(map(isfinite, result)) else None
+
+
+def _to_box_orientation(start: Point,
+                        end: Point,
+                        box: Tuple[float, float, float, float]
+                        ) -> Optional[int]:
+    """
+    Returns orientation of every point of the box
+    relative to the segment with the start less than the end
+    or ``None`` if it differs.
+    """
+    min_x, max_x, min_y, max_y = box
+    (_, start_y), (_, end_y) = start, end
+    lowest, highest = (((min_x, min_y), (max_x, max_y))
+                       if start_y > end_y
+                       else ((max_x, min_y), (min_x, max_y)))
+    lowest_orientation = orientation_sign(end, start, lowest)
+    return (lowest_orientation
+            if lowest_orientation == orientation_sign(end, start, highest)
+            else None)
+
+
+def _to_exact_cross_point(left: Segment, right: Segment) -> Point:
+    (left_start_x, left_start_y), (left_end_x, left_end_y) = left
+    (right_start_x, right_start_y), (right_end_x, right_end_y) = right
+    left_dx, left_dy = left_end_x - left_start_x, left_end_y - left_start_y
+    right_dx, right_dy = (right_end_x - right_start_x,
+                          right_end_y - right_start_y)
+    parameter = (((right_start_x - left_start_x) * right_dy
+                  - (right_start_y - left_start_y) * right_dx)
+                 / (left_dx * right_dy - left_dy * right_dx))
+    return (left_start_x + left_dx * parameter,
+            left_start_y + left_dy * parameter)
+
+
+def _to_floating_event(point: Point) -> Tuple[float, Real, float, Real]:
+    """
+    Returns key of event point with coordinates
+    preceded by their floating point approximations,
+    which orders events exactly for floating point endpoints
+    and compares approximations of crossings first.
+    """
+    point_x, point_y = point
+    return float(point_x), point_x, float(point_y), point_y
+
+
+def _to_exact_segment(segment: Segment) -> Segment:
+    (start_x, start_y), (end_x, end_y) = segment
+    return ((Fraction(start_x), Fraction(start_y)),
+            (Fraction(end_x), Fraction(end_y)))
+
+
+class _Node:
+    """
+    Node of treap with segments' indices in sweep line order.
+    """
+    __slots__ = 'index', 'priority', 'left', 'right'
+
+    def __init__(self, index: int, priority: float) -> None:
+        self.index, self.priority = index, priority
+        self.left = self.right = None
+
+
+def _split(node: Optional[_Node],
+           predicate: Callable[[int], bool]
+           ) -> Tuple[Optional[_Node], Optional[_Node]]:
+    if node is None:
+        return None, None
+    elif predicate(node.index):
+        node.right, right = _split(node.right, predicate)
+        return node, right
+    else:
+        left, node.left = _split(node.left, predicate)
+        return left, node
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    if left is None:
+        return right
+    elif right is None:
+        return left
+    elif left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return left
+    else:
+        right.left = _merge(left, right.left)
+        return right
+
+
+def _to_indices(node: Optional[_Node]) -> List[int]:
+    result, stack = [], []
+    while stack or node is not None:
+        if node is None:
+            node = stack.pop()
+            result.append(node.index)
+            node = node.right
+        else:
+            stack.append(node)
+            node = node.left
+    return result
+
+
+def _to_leftmost(node: Optional[_Node]) -> Optional[int]:
+    if node is None:
+        return None
+    while node.left is not None:
+        node = node.left
+    return node.index
+
+
+def _to_rightmost(node: Optional[_Node]) -> Optional[int]:
+    if node is None:
+        return None
+    while node.right is not None:
+        node = node.right
+    return node.index
+
+
+profiling.register('linear.PreparedLine.sign', PreparedLine.sign)
@@ -0,0 +1,242 @@
+"""
+Batched predicates over memory-mapped files of points.
+
+Points are read from ``.npy`` files of ``float64`` values
+with shape ``(N, 2)`` or from raw files of native ``float64`` values
+with interleaved coordinates, results are written to an output file
+(``.npy`` if its path has such suffix, raw otherwise).
+Files are processed in windows of ``window_size`` rows,
+so memory usage does not depend on files' sizes.
+
+Requires ``numpy`` to be installed, e.g. with ``robust[vectorized]`` extra.
+"""
+import os
+from pathlib import PurePath
+from typing import (Callable,
+                    Sequence,
+                    Tuple,
+                    Union)
+
+import numpy as np
+
+from .vectorized import (PointsArray,
+                         SegmentsArray,
+                         SignsArray,
+                         ValuesArray,
+                         _segments_relationship_many,
+                         determinant_many,
+                         orientation_many)
+
+#: default number of rows evaluated at once
+WINDOW_SIZE = 65536
+NPY_SUFFIX = '.npy'
+
+Path = Union[str, PurePath]
+
+
+def map_points(path: Path) -> PointsArray:
+    """
+    Returns read-only memory-mapped ``(N, 2)`` array of points
+    stored in the file.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     path = os.path.join(directory, 'points.npy')
+    ...     np.save(path, np.array([[0., 0.], [1., 0.], [0., 1.]]))
+    ...     map_points(path).tolist()
+    [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]]
+    """
+    return _map_rows(path, (2,))
+
+
+def map_segments(path: Path) -> SegmentsArray:
+    """
+    Returns read-only memory-mapped ``(N, 2, 2)`` array of segments
+    stored in the file as pairs of consecutive endpoints.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     path = os.path.join(directory, 'segments')
+    ...     np.array([0., 0., 2., 0., 1., 0., 1., 1.]).tofile(path)
+    ...     map_segments(path).tolist()
+    [[[0.0, 0.0], [2.0, 0.0]], [[1.0, 0.0], [1.0, 1.0]]]
+    """
+    return _map_rows(path, (2, 2))
+
+
+def determinant_file(first_points_path: Path,
+                     second_points_path: Path,
+                     third_points_path: Path,
+                     fourth_points_path: Path,
+                     output_path: Path,
+                     *,
+                     window_size: int = WINDOW_SIZE) -> ValuesArray:
+    """
+    Calculates determinants for checking if points lie on the same circle
+    for points stored in given files
+    and writes them to the output file as ``float64`` values.
+
+    Same as ``robust.vectorized.determinant_many``.
+
+    Returns memory-mapped output.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     paths = [os.path.join(directory, name)
+    ...              for name in ['first.npy', 'second.npy', 'third.npy',
+    ...                           'fourth.npy', 'result.npy']]
+    ...     for path, points in zip(paths, [[[0., 0.], [0., 0.]],
+    ...                                     [[2., 0.], [2., 0.]],
+    ...                                     [[2., 2.], [2., 2.]],
+    ...                                     [[0., 2.], [0., 1.]]]):
+    ...         np.save(path, np.array(points))
+    ...     determinant_file(*paths).tolist()
+    [0.0, 4.0]
+    """
+    return _evaluate(determinant_many,
+                     [map_points(first_points_path),
+                      map_points(second_points_path),
+                      map_points(third_points_path),
+                      map_points(fourth_points_path)],
+                     output_path, np.float64, window_size)
+
+
+def orientation_file(first_ray_points_path: Path,
+                     vertices_path: Path,
+                     second_ray_points_path: Path,
+                     output_path: Path,
+                     *,
+                     window_size: int = WINDOW_SIZE) -> SignsArray:
+    """
+    Calculates orientations of angles built on points stored in given files
+    and writes them to the output file as ``int8`` values
+    with the same meaning as values of ``robust.angular.Orientation``.
+
+    Same as ``robust.vectorized.orientation_many``.
+
+    Returns memory-mapped output.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     paths = [os.path.join(directory, name)
+    ...              for name in ['first', 'vertices', 'second', 'result']]
+    ...     for path, points in zip(paths, [[1., 0., 1., 0., 0., 1.],
+    ...                                     [0., 0., 0., 0., 0., 0.],
+    ...                                     [1., 0., 0., 1., 1., 0.]]):
+    ...         np.array(points).tofile(path)
+    ...     orientation_file(*paths, window_size=2).tolist()
+    [0, 1, -1]
+    """
+    return _evaluate(orientation_many,
+                     [map_points(first_ray_points_path),
+                      map_points(vertices_path),
+                      map_points(second_ray_points_path)],
+                     output_path, np.int8, window_size)
+
+
+def segments_relationship_file(left_segments_path: Path,
+                               right_segments_path: Path,
+                               output_path: Path,
+                               *,
+                               window_size: int = WINDOW_SIZE) -> SignsArray:
+    """
+    Finds relationships between segments stored in given files
+    and writes them to the output file as ``int8`` values
+    of ``robust.linear.SegmentsRelationship``.
+
+    Same as evaluating ``robust.linear.segments_relationship``
+    for each pair of segments.
+
+    Returns memory-mapped output.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     paths = [os.path.join(directory, name)
+    ...              for name in ['left', 'right', 'result.npy']]
+    ...     np.array([0., 0., 2., 0., 0., 0., 2., 2.]).tofile(paths[0])
+    ...     np.array([1., 0., 1., 1., 0., 2., 2., 0.]).tofile(paths[1])
+    ...     segments_relationship_file(*paths).tolist()
+    [1, 2]
+    """
+    left_segments = map_segments(left_segments_path)
+    right_segments = map_segments(right_segments_path)
+    return _evaluate(_segments_relationship_many,
+                     [left_segments[:, 0], left_segments[:, 1],
+                      right_segments[:, 0], right_segments[:, 1]],
+                     output_path, np.int8, window_size)
+
+
+def _evaluate(function: Callable[..., np.ndarray],
+              points_arrays: Sequence[PointsArray],
+              output_path: Path,
+              result_dtype: np.dtype,
+              window_size: int) -> np.ndarray:
+    if window_size < 1:
+        raise ValueError('Window size should be positive, '
+                         'but found: {window_size}.'
+                         .format(window_size=window_size))
+    rows_count = len(points_arrays[0])
+    if any(len(points_array) != rows_count
+           for points_array in points_arrays):
+        raise ValueError('Files should contain the same number of rows, '
+                         'but found: {counts}.'
+                         .format(counts=[len(points_array)
+                                         for points_array in points_arrays]))
+    result = _open_output(output_path, result_dtype, rows_count)
+    for start in range(0, rows_count, window_size):
+        stop = start + window_size
+        result[start:stop] = function(*[points_array[start:stop]
+                                        for points_array in points_arrays])
+    if isinstance(result, np.memmap):
+        result.flush()
+    return result
+
+
+def _open_output(path: Path,
+                 dtype: np.dtype,
+                 rows_count: int) -> np.ndarray:
+    if str(path).endswith(NPY_SUFFIX):
+        return np.lib.format.open_memmap(path,
+                                         mode='w+',
+                                         dtype=dtype,
+                                         shape=(rows_count,))
+    elif rows_count:
+        return np.memmap(path,
+                         dtype=dtype,
+                         mode='w+',
+                         shape=(rows_count,))
+    else:
+        open(path, 'wb').close()
+        return np.empty(0,
+                        dtype=dtype)
+
+
+def _map_rows(path: Path, row_shape: Tuple[int, ...]) -> np.ndarray:
+    if str(path).endswith(NPY_SUFFIX):
+        result = np.load(path,
+                         mmap_mode='r')
+        if result.dtype != np.float64:
+            raise ValueError('Values should be stored as float64, '
+                             'but found: {dtype}.'.format(dtype=result.dtype))
+        if result.shape[1:] != row_shape:
+            raise ValueError('Array should have shape {shape}, '
+                             'but found: {actual}.'
+                             .format(shape=('N',) + row_shape,
+                                     actual=result.shape))
+        return result
+    row_size = np.dtype(np.float64).itemsize * int(np.prod(row_shape))
+    size = os.path.getsize(path)
+    if size % row_size:
+        raise ValueError('File size should be a multiple of {row_size} bytes '
+                         '(rows of {count} float64 values), '
+                         'but found: {size}.'
+                         .format(row_size=row_size,
+                                 count=int(np.prod(row_shape)),
+                                 size=size))
+    return (np.memmap(path,
+                      dtype=np.float64,
+                      mode='r',
+                      shape=(size // row_size,) + row_shape)
+            if size
+            else np.empty((0,) + row_shape,
+                          dtype=np.float64))
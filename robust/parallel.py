@@ -0,0 +1,115 @@
+"""
+Batched versions of predicates evaluated in parallel by a pool of processes.
+
+Inputs are passed to workers through ``multiprocessing.shared_memory``
+instead of pickling, each worker evaluates a chunk of rows
+with the serial batched predicate and writes results into shared output,
+so results are identical to the serial call.
+
+Requires Python 3.8+ and ``numpy`` to be installed,
+e.g. with ``robust[vectorized]`` extra.
+
+Calls of predicates made by workers are not counted by ``robust.profiling``.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import (Callable,
+                    Optional,
+                    Tuple)
+
+import numpy as np
+
+from .chunked import ChunkedPredicates
+from .vectorized import PointsArray
+
+#: default number of rows evaluated by a worker at once
+CHUNK_SIZE = 65536
+
+
+def _evaluate_chunks(function: Callable[..., np.ndarray],
+                     points_arrays: Tuple[PointsArray, ...],
+                     result_dtype: np.dtype,
+                     chunk_size: int,
+                     max_workers: Optional[int]) -> np.ndarray:
+    rows_count = len(points_arrays[0])
+    inputs_shape = (len(points_arrays), rows_count, 2)
+    inputs_memory = SharedMemory(create=True,
+                                 size=(np.dtype(np.float64).itemsize
+                                       * int(np.prod(inputs_shape))))
+    try:
+        output_memory = SharedMemory(create=True,
+                                     size=result_dtype.itemsize * rows_count)
+        try:
+            inputs = np.ndarray(inputs_shape,
+                                dtype=np.float64,
+                                buffer=inputs_memory.buf)
+            for index, points_array in enumerate(points_arrays):
+                inputs[index] = points_array
+            del inputs
+            with ProcessPoolExecutor(max_workers) as executor:
+                for future in [executor.submit(_evaluate_chunk, function,
+                                               inputs_memory.name,
+                                               inputs_shape,
+                                               output_memory.name,
+                                               result_dtype.str, start,
+                                               start + chunk_size)
+                               for start in range(0, rows_count,
+                                                  chunk_size)]:
+                    future.result()
+            result = np.ndarray((rows_count,),
+                                dtype=result_dtype,
+                                buffer=output_memory.buf).copy()
+        finally:
+            output_memory.close()
+            output_memory.unlink()
+    finally:
+        inputs_memory.close()
+        inputs_memory.unlink()
+    return result
+
+
+def _evaluate_chunk(function: Callable[..., np.ndarray],
+                    inputs_name: str,
+                    inputs_shape: Tuple[int, int, int],
+                    output_name: str,
+                    output_dtype: str,
+                    start: int,
+                    stop: int) -> None:
+    inputs_memory = SharedMemory(inputs_name)
+    try:
+        output_memory = SharedMemory(output_name)
+        try:
+            _write_chunk(function, inputs_memory, inputs_shape,
+                         output_memory, output_dtype, start, stop)
+        finally:
+            output_memory.close()
+    finally:
+        inputs_memory.close()
+
+
+def _write_chunk(function: Callable[..., np.ndarray],
+                 inputs_memory: SharedMemory,
+                 inputs_shape: Tuple[int, int, int],
+                 output_memory: SharedMemory,
+                 output_dtype: str,
+                 start: int,
+                 stop: int) -> None:
+    inputs = np.ndarray(inputs_shape,
+                        dtype=np.float64,
+                        buffer=inputs_memory.buf)
+    output = np.ndarray((inputs_shape[1],),
+                        dtype=output_dtype,
+                        buffer=output_memory.buf)
+    output[start:stop] = function(*inputs[:, start:stop])
+
+
+_predicates = ChunkedPredicates(_evaluate_chunks, CHUNK_SIZE)
+#: same as ``robust.chunked.ChunkedPredicates.determinant_many``
+#: with processes as workers (number of processors by default)
+determinant_many = _predicates.determinant_many
+#: same as ``robust.chunked.ChunkedPredicates.orientation_many``
+#: with processes as workers (number of processors by default)
+orientation_many = _predicates.orientation_many
+#: same as ``robust.chunked.ChunkedPredicates.segments_relationship_many``
+#: with processes as workers (number of processors by default)
+segments_relationship_many = _predicates.segments_relationship_many
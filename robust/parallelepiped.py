@@ -0,0 +1,238 @@
+from numbers import Real
+
+from . import (bounds,
+               profiling)
+from .hints import Point3D
+from .profiling import Stage
+from .utils import (multiply_expansions,
+                    scale_expansion,
+                    sum_expansions,
+                    to_cross_product,
+                    to_cross_product_with_tails,
+                    to_rational_differences)
+
+
+def signed_volume(first_start: Point3D,
+                  first_end: Point3D,
+                  second_start: Point3D,
+                  second_end: Point3D,
+                  third_start: Point3D,
+                  third_end: Point3D) -> Real:
+    """
+    Calculates signed volume of parallelepiped built on segments' vectors.
+
+    Positive sign of result means that vectors form right-handed triple,
+    negative -- left-handed,
+    zero -- vectors are coplanar.
+
+    Orientation of point ``d`` relative to the plane through points
+    ``a``, ``b``, ``c`` is the sign of ``signed_volume(d, a, d, b, d, c)``.
+
+    >>> signed_volume((0, 0, 0), (1, 0, 0), (0, 0, 0), (0, 1, 0),
+    ...               (0, 0, 0), (0, 0, 1))
+    1
+    >>> signed_volume((0, 0, 0), (0, 1, 0), (0, 0, 0), (1, 0, 0),
+    ...               (0, 0, 0), (0, 0, 1))
+    -1
+    >>> signed_volume((0, 0, 0), (1, 0, 0), (0, 0, 0), (0, 1, 0),
+    ...               (0, 0, 0), (1, 1, 0))
+    0
+    """
+    first_start_x, first_start_y, first_start_z = first_start
+    first_end_x, first_end_y, first_end_z = first_end
+    second_start_x, second_start_y, second_start_z = second_start
+    second_end_x, second_end_y, second_end_z = second_end
+    third_start_x, third_start_y, third_start_z = third_start
+    third_end_x, third_end_y, third_end_z = third_end
+    first_dx = first_end_x - first_start_x
+    first_dy = first_end_y - first_start_y
+    first_dz = first_end_z - first_start_z
+    second_dx = second_end_x - second_start_x
+    second_dy = second_end_y - second_start_y
+    second_dz = second_end_z - second_start_z
+    third_dx = third_end_x - third_start_x
+    third_dy = third_end_y - third_start_y
+    third_dz = third_end_z - third_start_z
+    differences = to_rational_differences(
+            (first_dx, first_dy, first_dz, second_dx, second_dy, second_dz,
+             third_dx, third_dy, third_dz), first_end_x, first_start_x,
+            first_end_y, first_start_y, first_end_z, first_start_z,
+            second_end_x, second_start_x, second_end_y, second_start_y,
+            second_end_z, second_start_z, third_end_x, third_start_x,
+            third_end_y, third_start_y, third_end_z, third_start_z)
+    if differences is not None:
+        (first_dx, first_dy, first_dz, second_dx, second_dy, second_dz,
+         third_dx, third_dy, third_dz) = differences
+    first_dx_second_dy = first_dx * second_dy
+    second_dx_first_dy = second_dx * first_dy
+    first_dx_third_dy = first_dx * third_dy
+    third_dx_first_dy = third_dx * first_dy
+    second_dx_third_dy = second_dx * third_dy
+    third_dx_second_dy = third_dx * second_dy
+    result = (first_dz * (second_dx_third_dy - third_dx_second_dy)
+              + second_dz * (third_dx_first_dy - first_dx_third_dy)
+              + third_dz * (first_dx_second_dy - second_dx_first_dy))
+    if differences is not None:
+        return result
+    upper_bound = ((abs(second_dx_third_dy) + abs(third_dx_second_dy))
+                   * abs(first_dz)
+                   + (abs(third_dx_first_dy) + abs(first_dx_third_dy))
+                   * abs(second_dz)
+                   + (abs(first_dx_second_dy) + abs(second_dx_first_dy))
+                   * abs(third_dz))
+    error_bound = bounds.to_signed_volume_first_error(upper_bound)
+    if result > error_bound or -result > error_bound:
+        return result
+    return _adjusted_signed_volume(first_start_x, first_start_y,
+                                   first_start_z, first_end_x, first_end_y,
+                                   first_end_z, second_start_x, second_start_y,
+                                   second_start_z, second_end_x, second_end_y,
+                                   second_end_z, third_start_x, third_start_y,
+                                   third_start_z, third_end_x, third_end_y,
+                                   third_end_z, upper_bound)
+
+
+def _adjusted_signed_volume(first_start_x: Real,
+                            first_start_y: Real,
+                            first_start_z: Real,
+                            first_end_x: Real,
+                            first_end_y: Real,
+                            first_end_z: Real,
+                            second_start_x: Real,
+                            second_start_y: Real,
+                            second_start_z: Real,
+                            second_end_x: Real,
+                            second_end_y: Real,
+                            second_end_z: Real,
+                            third_start_x: Real,
+                            third_start_y: Real,
+                            third_start_z: Real,
+                            third_end_x: Real,
+                            third_end_y: Real,
+                            third_end_z: Real,
+                            upper_bound: Real) -> Real:
+    first_dx = first_end_x - first_start_x
+    first_dy = first_end_y - first_start_y
+    first_dz = first_end_z - first_start_z
+    second_dx = second_end_x - second_start_x
+    second_dy = second_end_y - second_start_y
+    second_dz = second_end_z - second_start_z
+    third_dx = third_end_x - third_start_x
+    third_dy = third_end_y - third_start_y
+    third_dz = third_end_z - third_start_z
+    second_third_cross_product = to_cross_product(second_dx, third_dy,
+                                                  third_dx, second_dy)
+    third_first_cross_product = to_cross_product(third_dx, first_dy,
+                                                 first_dx, third_dy)
+    first_second_cross_product = to_cross_product(first_dx, second_dy,
+                                                  second_dx, first_dy)
+    result_expansion = sum_expansions(
+            sum_expansions(scale_expansion(second_third_cross_product,
+                                           first_dz),
+                           scale_expansion(third_first_cross_product,
+                                           second_dz)),
+            scale_expansion(first_second_cross_product, third_dz))
+    result = sum(result_expansion)
+    error_bound = bounds.to_signed_volume_second_error(upper_bound)
+    if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('parallelepiped.signed_volume',
+                                  Stage.SECOND_BOUND)
+        return result
+    right_virtual = first_end_x - first_dx
+    left_virtual = first_dx + right_virtual
+    first_dx_tail = ((first_end_x - left_virtual)
+                     + (right_virtual - first_start_x))
+    right_virtual = first_end_y - first_dy
+    left_virtual = first_dy + right_virtual
+    first_dy_tail = ((first_end_y - left_virtual)
+                     + (right_virtual - first_start_y))
+    right_virtual = first_end_z - first_dz
+    left_virtual = first_dz + right_virtual
+    first_dz_tail = ((first_end_z - left_virtual)
+                     + (right_virtual - first_start_z))
+    right_virtual = second_end_x - second_dx
+    left_virtual = second_dx + right_virtual
+    second_dx_tail = ((second_end_x - left_virtual)
+                      + (right_virtual - second_start_x))
+    right_virtual = second_end_y - second_dy
+    left_virtual = second_dy + right_virtual
+    second_dy_tail = ((second_end_y - left_virtual)
+                      + (right_virtual - second_start_y))
+    right_virtual = second_end_z - second_dz
+    left_virtual = second_dz + right_virtual
+    second_dz_tail = ((second_end_z - left_virtual)
+                      + (right_virtual - second_start_z))
+    right_virtual = third_end_x - third_dx
+    left_virtual = third_dx + right_virtual
+    third_dx_tail = ((third_end_x - left_virtual)
+                     + (right_virtual - third_start_x))
+    right_virtual = third_end_y - third_dy
+    left_virtual = third_dy + right_virtual
+    third_dy_tail = ((third_end_y - left_virtual)
+                     + (right_virtual - third_start_y))
+    right_virtual = third_end_z - third_dz
+    left_virtual = third_dz + right_virtual
+    third_dz_tail = ((third_end_z - left_virtual)
+                     + (right_virtual - third_start_z))
+    if (not first_dx_tail and not first_dy_tail and not first_dz_tail
+            and not second_dx_tail and not second_dy_tail
+            and not second_dz_tail
+            and not third_dx_tail and not third_dy_tail
+            and not third_dz_tail):
+        if profiling.enabled:
+            profiling.record_exit('parallelepiped.signed_volume',
+                                  Stage.TAIL_FREE)
+        return result
+    error_bound = (bounds.to_signed_volume_third_error(upper_bound)
+                   + bounds.to_determinant_error(result))
+    result += ((first_dz * ((second_dx * third_dy_tail
+                             + third_dy * second_dx_tail)
+                            - (second_dy * third_dx_tail
+                               + third_dx * second_dy_tail))
+                + first_dz_tail * (second_dx * third_dy
+                                   - second_dy * third_dx))
+               + (second_dz * ((third_dx * first_dy_tail
+                                + first_dy * third_dx_tail)
+                               - (third_dy * first_dx_tail
+                                  + first_dx * third_dy_tail))
+                  + second_dz_tail * (third_dx * first_dy
+                                      - third_dy * first_dx))
+               + (third_dz * ((first_dx * second_dy_tail
+                               + second_dy * first_dx_tail)
+                              - (first_dy * second_dx_tail
+                                 + second_dx * first_dy_tail))
+                  + third_dz_tail * (first_dx * second_dy
+                                     - first_dy * second_dx)))
+    if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('parallelepiped.signed_volume',
+                                  Stage.THIRD_BOUND)
+        return result
+    result_expansion = sum_expansions(
+            sum_expansions(
+                    multiply_expansions(
+                            to_cross_product_with_tails(
+                                    second_dx, second_dx_tail, third_dy,
+                                    third_dy_tail, third_dx, third_dx_tail,
+                                    second_dy, second_dy_tail),
+                            (first_dz_tail, first_dz)),
+                    multiply_expansions(
+                            to_cross_product_with_tails(
+                                    third_dx, third_dx_tail, first_dy,
+                                    first_dy_tail, first_dx, first_dx_tail,
+                                    third_dy, third_dy_tail),
+                            (second_dz_tail, second_dz))),
+            multiply_expansions(
+                    to_cross_product_with_tails(
+                            first_dx, first_dx_tail, second_dy,
+                            second_dy_tail, second_dx, second_dx_tail,
+                            first_dy, first_dy_tail),
+                    (third_dz_tail, third_dz)))
+    if profiling.enabled:
+        profiling.record_exit('parallelepiped.signed_volume',
+                              Stage.EXPANSION)
+    return result_expansion[-1]
+
+
+profiling.register('parallelepiped.signed_volume', signed_volume)
@@ -1,11 +1,18 @@
 from numbers import Real
 
-from . import bounds
+from . import (bounds,
+               profiling)
 from .hints import Point
-from .utils import (sum_expansions,
+from .profiling import Stage
+from .utils import (accelerated,
+                    dominates,
+                    sum_expansions,
                     to_cross_product,
+                    to_rational_differences,
+                    to_sign,
                     two_diff_tail,
                     two_product,
+                    two_product_presplit,
                     two_two_diff)
 
 
@@ -31,9 +38,58 @@ def signed_area(first_start: Point,
     first_end_x, first_end_y = first_end
     second_start_x, second_start_y = second_start
     second_end_x, second_end_y = second_end
-    minuend = (first_end_x - first_start_x) * (second_end_y - second_start_y)
-    subtrahend = ((first_end_y - first_start_y)
-                  * (second_end_x - second_start_x))
+    return _signed_area(first_start_x, first_start_y, first_end_x, first_end_y,
+                        second_start_x, second_start_y, second_end_x,
+                        second_end_y, False)
+
+
+def signed_area_sign(first_start: Point,
+                     first_end: Point,
+                     second_start: Point,
+                     second_end: Point) -> int:
+    """
+    Calculates sign of signed area of parallelogram built on segments' vectors.
+
+    Same as ``to_sign(signed_area(...))``,
+    but stops exact evaluation as soon as the sign is known.
+
+    >>> signed_area_sign((0, 0), (1, 0), (0, 0), (1, 0))
+    0
+    >>> signed_area_sign((0, 0), (1, 0), (0, 0), (0, 1))
+    1
+    >>> signed_area_sign((0, 0), (1, 0), (0, 1), (0, 0))
+    -1
+    """
+    first_start_x, first_start_y = first_start
+    first_end_x, first_end_y = first_end
+    second_start_x, second_start_y = second_start
+    second_end_x, second_end_y = second_end
+    return to_sign(_signed_area(first_start_x, first_start_y, first_end_x,
+                                first_end_y, second_start_x, second_start_y,
+                                second_end_x, second_end_y, True))
+
+
+def _signed_area(first_start_x: Real,
+                 first_start_y: Real,
+                 first_end_x: Real,
+                 first_end_y: Real,
+                 second_start_x: Real,
+                 second_start_y: Real,
+                 second_end_x: Real,
+                 second_end_y: Real,
+                 sign_only: bool) -> Real:
+    first_dx = first_end_x - first_start_x
+    first_dy = first_end_y - first_start_y
+    second_dx = second_end_x - second_start_x
+    second_dy = second_end_y - second_start_y
+    if type(first_dx) is not float:
+        differences = to_rational_differences(
+                (first_dx, first_dy, second_dx, second_dy), first_end_x,
+                first_start_x, first_end_y, first_start_y, second_end_x,
+                second_start_x, second_end_y, second_start_y)
+        if differences is not None:
+            return _exact_signed_area(*differences)
+    minuend, subtrahend = first_dx * second_dy, first_dy * second_dx
     result = minuend - subtrahend
     if minuend > 0:
         if subtrahend <= 0:
@@ -52,18 +108,34 @@ def signed_area(first_start: Point,
         return result
     return _adjusted_signed_area(first_start_x, first_start_y, first_end_x,
                                  first_end_y, second_start_x, second_start_y,
-                                 second_end_x, second_end_y, upper_bound)
-
-
-def _adjusted_signed_area(first_start_x: Real,
-                          first_start_y: Real,
-                          first_end_x: Real,
-                          first_end_y: Real,
-                          second_start_x: Real,
-                          second_start_y: Real,
-                          second_end_x: Real,
-                          second_end_y: Real,
-                          upper_bound: Real) -> Real:
+                                 second_end_x, second_end_y, upper_bound,
+                                 sign_only)
+
+
+def _exact_signed_area(first_dx: Real,
+                       first_dy: Real,
+                       second_dx: Real,
+                       second_dy: Real) -> Real:
+    return first_dx * second_dy - first_dy * second_dx
+
+
+def _composed_adjusted_signed_area(first_start_x: Real,
+                                   first_start_y: Real,
+                                   first_end_x: Real,
+                                   first_end_y: Real,
+                                   second_start_x: Real,
+                                   second_start_y: Real,
+                                   second_end_x: Real,
+                                   second_end_y: Real,
+                                   upper_bound: Real,
+                                   sign_only: bool = False) -> Real:
+    """
+    Evaluates signed area with adaptive stages after the filter.
+
+    With ``sign_only`` flag the last stage stops
+    as soon as the sign of the result is known,
+    so only the sign of returned value is guaranteed to be exact.
+    """
     minuend_multiplier_x = first_end_x - first_start_x
     minuend_multiplier_y = second_end_y - second_start_y
     subtrahend_multiplier_x = second_end_x - second_start_x
@@ -77,6 +149,9 @@ def _adjusted_signed_area(first_start_x: Real,
     result = sum(result_expansion)
     error_bound = bounds.to_signed_measure_second_error(upper_bound)
     if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('parallelogram.signed_area',
+                                  Stage.SECOND_BOUND)
         return result
     minuend_multiplier_x_tail = two_diff_tail(first_end_x, first_start_x,
                                               minuend_multiplier_x)
@@ -90,6 +165,8 @@ def _adjusted_signed_area(first_start_x: Real,
             and not minuend_multiplier_y_tail
             and not subtrahend_multiplier_x_tail
             and not subtrahend_multiplier_y_tail):
+        if profiling.enabled:
+            profiling.record_exit('parallelogram.signed_area', Stage.TAIL_FREE)
         return result
     error_bound = (bounds.to_signed_measure_third_error(upper_bound)
                    + bounds.to_determinant_error(result))
@@ -98,7 +175,12 @@ def _adjusted_signed_area(first_start_x: Real,
                - (subtrahend_multiplier_y * subtrahend_multiplier_x_tail
                   + subtrahend_multiplier_x * subtrahend_multiplier_y_tail))
     if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('parallelogram.signed_area',
+                                  Stage.THIRD_BOUND)
         return result
+    if profiling.enabled:
+        profiling.record_exit('parallelogram.signed_area', Stage.EXPANSION)
     result_expansion = sum_expansions(
             result_expansion, to_cross_product(minuend_multiplier_x_tail,
                                                minuend_multiplier_y,
@@ -109,9 +191,239 @@ def _adjusted_signed_area(first_start_x: Real,
                                                minuend_multiplier_y_tail,
                                                subtrahend_multiplier_x_tail,
                                                subtrahend_multiplier_y))
+    if sign_only and dominates(
+            result_expansion,
+            abs(minuend_multiplier_x_tail * minuend_multiplier_y_tail)
+            + abs(subtrahend_multiplier_x_tail
+                  * subtrahend_multiplier_y_tail)):
+        return result_expansion[-1]
+    result_expansion = sum_expansions(
+            result_expansion, to_cross_product(minuend_multiplier_x_tail,
+                                               minuend_multiplier_y_tail,
+                                               subtrahend_multiplier_x_tail,
+                                               subtrahend_multiplier_y_tail))
+    return result_expansion[-1]
+
+
+def _inlined_adjusted_signed_area(first_start_x: Real,
+                                  first_start_y: Real,
+                                  first_end_x: Real,
+                                  first_end_y: Real,
+                                  second_start_x: Real,
+                                  second_start_y: Real,
+                                  second_end_x: Real,
+                                  second_end_y: Real,
+                                  upper_bound: Real,
+                                  sign_only: bool = False,
+                                  *,
+                                  splitter: Real = bounds.splitter) -> Real:
+    """
+    Same as ``_composed_adjusted_signed_area``,
+    but with error-free transformations of all stages except the last one
+    inlined by hand into straight-line code,
+    so any change of either version should be mirrored in the other one.
+    """
+    minuend_multiplier_x = first_end_x - first_start_x
+    minuend_multiplier_y = second_end_y - second_start_y
+    subtrahend_multiplier_x = second_end_x - second_start_x
+    subtrahend_multiplier_y = first_end_y - first_start_y
+    minuend_head = minuend_multiplier_x * minuend_multiplier_y
+    base = splitter * minuend_multiplier_x
+    minuend_multiplier_x_high = base - (base - minuend_multiplier_x)
+    minuend_multiplier_x_low = minuend_multiplier_x - minuend_multiplier_x_high
+    base = splitter * minuend_multiplier_y
+    minuend_multiplier_y_high = base - (base - minuend_multiplier_y)
+    minuend_multiplier_y_low = minuend_multiplier_y - minuend_multiplier_y_high
+    minuend_tail = (minuend_multiplier_x_low * minuend_multiplier_y_low
+                    - (((minuend_head - minuend_multiplier_x_high
+                         * minuend_multiplier_y_high)
+                        - minuend_multiplier_x_low * minuend_multiplier_y_high)
+                       - minuend_multiplier_x_high * minuend_multiplier_y_low))
+    subtrahend_head = subtrahend_multiplier_y * subtrahend_multiplier_x
+    base = splitter * subtrahend_multiplier_y
+    subtrahend_multiplier_y_high = base - (base - subtrahend_multiplier_y)
+    subtrahend_multiplier_y_low = (subtrahend_multiplier_y
+                                   - subtrahend_multiplier_y_high)
+    base = splitter * subtrahend_multiplier_x
+    subtrahend_multiplier_x_high = base - (base - subtrahend_multiplier_x)
+    subtrahend_multiplier_x_low = (subtrahend_multiplier_x
+                                   - subtrahend_multiplier_x_high)
+    subtrahend_tail = (
+            subtrahend_multiplier_y_low * subtrahend_multiplier_x_low
+            - (((subtrahend_head - subtrahend_multiplier_y_high
+                 * subtrahend_multiplier_x_high)
+                - subtrahend_multiplier_y_low * subtrahend_multiplier_x_high)
+               - subtrahend_multiplier_y_high * subtrahend_multiplier_x_low))
+    mid_head = minuend_tail - subtrahend_tail
+    right_virtual = minuend_tail - mid_head
+    left_virtual = mid_head + right_virtual
+    third_tail = ((minuend_tail - left_virtual)
+                  + (right_virtual - subtrahend_tail))
+    interim_head = minuend_head + mid_head
+    right_virtual = interim_head - minuend_head
+    left_virtual = interim_head - right_virtual
+    interim_tail = ((minuend_head - left_virtual)
+                    + (mid_head - right_virtual))
+    mid_head = interim_tail - subtrahend_head
+    right_virtual = interim_tail - mid_head
+    left_virtual = mid_head + right_virtual
+    second_tail = ((interim_tail - left_virtual)
+                   + (right_virtual - subtrahend_head))
+    head = interim_head + mid_head
+    right_virtual = head - interim_head
+    left_virtual = head - right_virtual
+    first_tail = (interim_head - left_virtual) + (mid_head - right_virtual)
+    result = third_tail + second_tail + first_tail + head
+    error_bound = bounds.to_signed_measure_second_error(upper_bound)
+    if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('parallelogram.signed_area',
+                                  Stage.SECOND_BOUND)
+        return result
+    right_virtual = first_end_x - minuend_multiplier_x
+    left_virtual = minuend_multiplier_x + right_virtual
+    minuend_multiplier_x_tail = ((first_end_x - left_virtual)
+                                 + (right_virtual - first_start_x))
+    right_virtual = second_end_x - subtrahend_multiplier_x
+    left_virtual = subtrahend_multiplier_x + right_virtual
+    subtrahend_multiplier_x_tail = ((second_end_x - left_virtual)
+                                    + (right_virtual - second_start_x))
+    right_virtual = first_end_y - subtrahend_multiplier_y
+    left_virtual = subtrahend_multiplier_y + right_virtual
+    subtrahend_multiplier_y_tail = ((first_end_y - left_virtual)
+                                    + (right_virtual - first_start_y))
+    right_virtual = second_end_y - minuend_multiplier_y
+    left_virtual = minuend_multiplier_y + right_virtual
+    minuend_multiplier_y_tail = ((second_end_y - left_virtual)
+                                 + (right_virtual - second_start_y))
+    if (not minuend_multiplier_x_tail
+            and not minuend_multiplier_y_tail
+            and not subtrahend_multiplier_x_tail
+            and not subtrahend_multiplier_y_tail):
+        if profiling.enabled:
+            profiling.record_exit('parallelogram.signed_area', Stage.TAIL_FREE)
+        return result
+    error_bound = (bounds.to_signed_measure_third_error(upper_bound)
+                   + bounds.to_determinant_error(result))
+    result += ((minuend_multiplier_x * minuend_multiplier_y_tail
+                + minuend_multiplier_y * minuend_multiplier_x_tail)
+               - (subtrahend_multiplier_y * subtrahend_multiplier_x_tail
+                  + subtrahend_multiplier_x * subtrahend_multiplier_y_tail))
+    if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('parallelogram.signed_area',
+                                  Stage.THIRD_BOUND)
+        return result
+    if profiling.enabled:
+        profiling.record_exit('parallelogram.signed_area', Stage.EXPANSION)
+    result_expansion = sum_expansions(
+            (third_tail, second_tail, first_tail, head),
+            to_cross_product(minuend_multiplier_x_tail, minuend_multiplier_y,
+                             subtrahend_multiplier_x,
+                             subtrahend_multiplier_y_tail))
+    result_expansion = sum_expansions(
+            result_expansion, to_cross_product(minuend_multiplier_x,
+                                               minuend_multiplier_y_tail,
+                                               subtrahend_multiplier_x_tail,
+                                               subtrahend_multiplier_y))
+    if sign_only and dominates(
+            result_expansion,
+            abs(minuend_multiplier_x_tail * minuend_multiplier_y_tail)
+            + abs(subtrahend_multiplier_x_tail
+                  * subtrahend_multiplier_y_tail)):
+        return result_expansion[-1]
     result_expansion = sum_expansions(
             result_expansion, to_cross_product(minuend_multiplier_x_tail,
                                                minuend_multiplier_y_tail,
                                                subtrahend_multiplier_x_tail,
                                                subtrahend_multiplier_y_tail))
     return result_expansion[-1]
+
+
+def _adjusted_prepared_signed_area_sign(start_x: Real,
+                                        start_y: Real,
+                                        delta_x: Real,
+                                        delta_x_tail: Real,
+                                        delta_x_low: Real,
+                                        delta_x_high: Real,
+                                        delta_y: Real,
+                                        delta_y_tail: Real,
+                                        delta_y_low: Real,
+                                        delta_y_high: Real,
+                                        point_x: Real,
+                                        point_y: Real,
+                                        upper_bound: Real) -> int:
+    """
+    Same as ``to_sign(_adjusted_signed_area(..., sign_only=True))``
+    for vectors from the start
+    to the end and to the point,
+    but with coordinates' differences of the first vector given
+    along with their tails and splits.
+    """
+    minuend_multiplier_y = point_y - start_y
+    subtrahend_multiplier_x = point_x - start_x
+    minuend_tail, minuend_head = two_product_presplit(
+            minuend_multiplier_y, delta_x, delta_x_low, delta_x_high)
+    subtrahend_tail, subtrahend_head = two_product_presplit(
+            subtrahend_multiplier_x, delta_y, delta_y_low, delta_y_high)
+    result_expansion = two_two_diff(minuend_tail, minuend_head,
+                                    subtrahend_tail, subtrahend_head)
+    result = sum(result_expansion)
+    error_bound = bounds.to_signed_measure_second_error(upper_bound)
+    if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('parallelogram.signed_area',
+                                  Stage.SECOND_BOUND)
+        return to_sign(result)
+    minuend_multiplier_y_tail = two_diff_tail(point_y, start_y,
+                                              minuend_multiplier_y)
+    subtrahend_multiplier_x_tail = two_diff_tail(point_x, start_x,
+                                                 subtrahend_multiplier_x)
+    if (not delta_x_tail
+            and not minuend_multiplier_y_tail
+            and not subtrahend_multiplier_x_tail
+            and not delta_y_tail):
+        if profiling.enabled:
+            profiling.record_exit('parallelogram.signed_area', Stage.TAIL_FREE)
+        return to_sign(result)
+    error_bound = (bounds.to_signed_measure_third_error(upper_bound)
+                   + bounds.to_determinant_error(result))
+    result += ((delta_x * minuend_multiplier_y_tail
+                + minuend_multiplier_y * delta_x_tail)
+               - (delta_y * subtrahend_multiplier_x_tail
+                  + subtrahend_multiplier_x * delta_y_tail))
+    if result >= error_bound or -result >= error_bound:
+        if profiling.enabled:
+            profiling.record_exit('parallelogram.signed_area',
+                                  Stage.THIRD_BOUND)
+        return to_sign(result)
+    if profiling.enabled:
+        profiling.record_exit('parallelogram.signed_area', Stage.EXPANSION)
+    result_expansion = sum_expansions(
+            result_expansion, to_cross_product(delta_x_tail,
+                                               minuend_multiplier_y,
+                                               subtrahend_multiplier_x,
+                                               delta_y_tail))
+    result_expansion = sum_expansions(
+            result_expansion, to_cross_product(delta_x,
+                                               minuend_multiplier_y_tail,
+                                               subtrahend_multiplier_x_tail,
+                                               delta_y))
+    if dominates(result_expansion,
+                 abs(delta_x_tail * minuend_multiplier_y_tail)
+                 + abs(subtrahend_multiplier_x_tail * delta_y_tail)):
+        return to_sign(result_expansion[-1])
+    result_expansion = sum_expansions(
+            result_expansion, to_cross_product(delta_x_tail,
+                                               minuend_multiplier_y_tail,
+                                               subtrahend_multiplier_x_tail,
+                                               delta_y_tail))
+    return to_sign(result_expansion[-1])
+
+
+_adjusted_signed_area = (_composed_adjusted_signed_area
+                         if accelerated
+                         else _inlined_adjusted_signed_area)
+
+profiling.register('parallelogram.signed_area', signed_area)
+profiling.register('parallelogram.signed_area_sign', signed_area_sign)
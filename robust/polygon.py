@@ -0,0 +1,214 @@
+from fractions import Fraction
+from itertools import chain
+from numbers import (Integral,
+                     Rational,
+                     Real)
+from typing import (Iterable,
+                    Sequence,
+                    Tuple)
+
+from . import (bounds,
+               profiling)
+from .angular import Orientation
+from .hints import Point
+from .profiling import Stage
+from .summation import (LARGE_VALUE,
+                        MAX_UNCOMPRESSED_LENGTH,
+                        _to_float)
+from .utils import (compress_expansion,
+                    sum_expansions,
+                    to_cross_product,
+                    to_exact,
+                    to_sign)
+
+#: magnitude of product below which its tail can underflow
+SMALL_PRODUCT = 2. ** -960
+
+
+def polygon_signed_area(vertices: Iterable[Point]) -> Real:
+    """
+    Calculates signed area of polygon given by its vertices
+    (e.g. a sequence of pairs, an iterator over them
+    or ``numpy`` array with shape ``(N, 2)``).
+
+    Positive sign of result means that vertices are in counterclockwise order,
+    negative -- clockwise,
+    zero -- polygon is degenerate.
+
+    Floating point estimate is returned if its sign is certain,
+    otherwise cross products of edges are summed exactly
+    and rounded once (to infinity if it overflows).
+    Vertices which are not a sequence are buffered
+    to be iterated once more for the exact sum.
+
+    Time complexity:
+        ``O(n)``
+
+    where ``n`` is the number of vertices.
+
+    >>> polygon_signed_area([(0, 0), (2, 0), (2, 2), (0, 2)])
+    4
+    >>> polygon_signed_area([(0, 0), (0, 2), (2, 2), (2, 0)])
+    -4
+    >>> polygon_signed_area([(0, 0), (1, 0), (0, 1)])
+    Fraction(1, 2)
+    >>> polygon_signed_area([(0., 0.), (1., 1.), (3., 3.)])
+    0.0
+    >>> polygon_signed_area(iter([(0., 0.), (1., 0.), (0., 1.)]))
+    0.5
+    >>> polygon_signed_area([(-1e308, -1e308), (1e308, -1e308), (0., 1e308)])
+    inf
+    >>> polygon_signed_area([(0., 0.), (3e-162, 0.), (0., 1e-162)])
+    0.0
+    """
+    doubled_area, exact = _to_doubled_area(vertices)
+    return _halve(doubled_area) if exact else _to_float(doubled_area / 2)
+
+
+def polygon_orientation(vertices: Iterable[Point]) -> Orientation:
+    """
+    Returns orientation of polygon given by its vertices.
+
+    >>> (polygon_orientation([(0, 0), (2, 0), (2, 2), (0, 2)])
+    ...  is Orientation.COUNTERCLOCKWISE)
+    True
+    >>> (polygon_orientation([(0, 0), (0, 2), (2, 2), (2, 0)])
+    ...  is Orientation.CLOCKWISE)
+    True
+    >>> (polygon_orientation([(0, 0), (1, 1), (2, 2)])
+    ...  is Orientation.COLLINEAR)
+    True
+    >>> (polygon_orientation([(0., 0.), (3e-162, 0.), (0., 1e-162)])
+    ...  is Orientation.COUNTERCLOCKWISE)
+    True
+    """
+    doubled_area, _ = _to_doubled_area(vertices)
+    return Orientation(to_sign(doubled_area))
+
+
+def _halve(value: Real) -> Real:
+    if isinstance(value, Integral):
+        value = int(value)
+        return Fraction(value, 2) if value % 2 else value // 2
+    else:
+        return value / 2
+
+
+def _to_exact_cross_product(minuend_multiplier_x: Rational,
+                            minuend_multiplier_y: Rational,
+                            subtrahend_multiplier_x: Rational,
+                            subtrahend_multiplier_y: Rational) -> Rational:
+    return (minuend_multiplier_x * minuend_multiplier_y
+            - subtrahend_multiplier_x * subtrahend_multiplier_y)
+
+
+def _to_doubled_area(vertices: Iterable[Point]) -> Tuple[Real, bool]:
+    """
+    Returns doubled signed area of polygon
+    (floating point estimate with certain sign or exact value)
+    with flag of whether all coordinates are exact.
+    """
+    if hasattr(vertices, 'tolist'):
+        vertices = vertices.tolist()
+    elif not isinstance(vertices, Sequence):
+        vertices = list(vertices)
+    vertices_iterator = iter(vertices)
+    try:
+        first_x, first_y = next(vertices_iterator)
+    except StopIteration:
+        return 0, True
+    start_dx, start_dy = first_x - first_x, first_y - first_y
+    result = upper_bound = vertices_count = 0
+    for end_x, end_y in vertices_iterator:
+        end_dx, end_dy = end_x - first_x, end_y - first_y
+        minuend, subtrahend = start_dx * end_dy, end_dx * start_dy
+        result += minuend - subtrahend
+        upper_bound += abs(minuend) + abs(subtrahend)
+        start_dx, start_dy = end_dx, end_dy
+        vertices_count += 1
+    if isinstance(result, Rational):
+        return ((result, True)
+                if isinstance(result, (int, Fraction))
+                else _to_exact_doubled_area(vertices))
+    error_bound = bounds.to_polygon_signed_area_error(upper_bound,
+                                                      vertices_count)
+    if result > error_bound or -result > error_bound:
+        return result, False
+    if profiling.enabled:
+        profiling.record_exit('polygon.signed_area', Stage.EXPANSION)
+    return _to_exact_doubled_area(vertices)
+
+
+def _to_exact_doubled_area(vertices: Sequence[Point]) -> Tuple[Real, bool]:
+    vertices = iter(vertices)
+    first_vertex = start_x, start_y = next(vertices)
+    expansion, rest, special = [0.], 0, 0.
+    inexact = False
+    for end_x, end_y in chain(vertices, (first_vertex,)):
+        if (type(start_x) is type(start_y) is type(end_x) is type(end_y)
+                is float):
+            inexact = True
+            if (_is_exact_product(start_x, end_y)
+                    and _is_exact_product(end_x, start_y)):
+                expansion = sum_expansions(
+                        expansion, to_cross_product(start_x, end_y, end_x,
+                                                    start_y))
+                if len(expansion) > MAX_UNCOMPRESSED_LENGTH:
+                    expansion = compress_expansion(expansion)
+            else:
+                exact, non_finite = _to_inexact_cross_product(
+                        start_x, end_y, end_x, start_y)
+                rest += exact
+                special += non_finite
+        else:
+            coordinates = to_exact(start_x, end_y, end_x, start_y)
+            if coordinates is None:
+                inexact = True
+                exact, non_finite = _to_inexact_cross_product(
+                        start_x, end_y, end_x, start_y)
+                rest += exact
+                special += non_finite
+            else:
+                rest += _to_exact_cross_product(*coordinates)
+        start_x, start_y = end_x, end_y
+    if not inexact:
+        return rest, True
+    elif special:
+        return special, False
+    return sum(map(Fraction, expansion)) + rest, False
+
+
+def _is_exact_product(left: float, right: float) -> bool:
+    """
+    Checks if product of floating point numbers with its tail
+    neither overflows nor underflows.
+    """
+    if not (-LARGE_VALUE < left < LARGE_VALUE
+            and -LARGE_VALUE < right < LARGE_VALUE):
+        return False
+    product = abs(left * right)
+    return SMALL_PRODUCT <= product < LARGE_VALUE or not (left and right)
+
+
+def _to_inexact_cross_product(minuend_multiplier_x: Real,
+                              minuend_multiplier_y: Real,
+                              subtrahend_multiplier_x: Real,
+                              subtrahend_multiplier_y: Real
+                              ) -> Tuple[Rational, Real]:
+    """
+    Returns cross product calculated exactly with zero
+    or zero with cross product calculated in floating point
+    if some of multipliers are infinite or NaN.
+    """
+    try:
+        return _to_exact_cross_product(Fraction(minuend_multiplier_x),
+                                       Fraction(minuend_multiplier_y),
+                                       Fraction(subtrahend_multiplier_x),
+                                       Fraction(subtrahend_multiplier_y)), 0.
+    except (OverflowError, ValueError):
+        return 0, (minuend_multiplier_x * minuend_multiplier_y
+                   - subtrahend_multiplier_x * subtrahend_multiplier_y)
+
+
+profiling.register('polygon.orientation', polygon_orientation)
+profiling.register('polygon.signed_area', polygon_signed_area)
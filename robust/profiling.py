@@ -0,0 +1,215 @@
+"""
+Opt-in counters of adaptive stages at which predicates' evaluations end.
+
+Nothing is counted by default and predicates' fast paths are not affected,
+calls of registered predicates are counted by a profile function
+which is installed only while counting is enabled
+(for all running threads on Python 3.12+,
+otherwise for the current thread and threads started afterwards)
+and which calls the profile function installed before it.
+Each call is counted under the name of its registered predicate
+and ends at exactly one stage: the last one reached during the call
+or ``Stage.FILTER`` if no later stage was reached.
+Batched predicates count rows resolved by their vectorized filters
+as calls of the corresponding registered predicate which end at
+``Stage.FILTER`` (e.g. ``'parallelogram.signed_area_sign'``
+for ``robust.vectorized.orientation_many``)
+and evaluate the rest of rows by calling that predicate.
+Counters are updated under a lock, so counts from concurrent threads
+are not lost on free-threaded builds either.
+
+>>> from robust.parallelogram import signed_area
+>>> stats.reset()
+>>> enable()
+>>> signed_area((0., 0.), (1., 1.), (0., 0.), (1., 0.))
+-1.0
+>>> signed_area((0., 0.), (3., 3.), (0., 0.), (1., 1.))
+0.0
+>>> disable()
+>>> stats.calls('parallelogram.signed_area')
+2
+>>> stats['parallelogram.signed_area'][Stage.FILTER]
+1
+>>> stats['parallelogram.signed_area'][Stage.TAIL_FREE]
+1
+"""
+import sys
+import threading
+from collections import (Counter,
+                         defaultdict)
+from enum import (IntEnum,
+                  unique)
+from types import FrameType
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Iterator)
+
+
+@unique
+class Stage(IntEnum):
+    """
+    Represents stages of adaptive evaluation of predicates.
+    """
+    #: floating point estimate is within the first error bound
+    FILTER = 0
+    #: exactly evaluated heads are within the second error bound
+    SECOND_BOUND = 1
+    #: coordinates' differences are exact, so heads give the exact result
+    TAIL_FREE = 2
+    #: first order tails' corrections are within the third error bound
+    THIRD_BOUND = 3
+    #: full expansion is evaluated
+    EXPANSION = 4
+
+
+class Stats:
+    """
+    Counters of stages at which predicates' evaluations end.
+    """
+
+    def __init__(self) -> None:
+        self._calls = Counter()
+        self._exits = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def __getitem__(self, predicate: str) -> Dict[Stage, int]:
+        """
+        Returns counts of evaluations of the predicate
+        which ended at each stage.
+        """
+        exits = self._exits[predicate]
+        return {stage: exits[stage] for stage in Stage}
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Returns iterator over names of predicates which were called.
+        """
+        return iter(self._calls)
+
+    def calls(self, predicate: str) -> int:
+        """
+        Returns number of calls of the predicate.
+        """
+        return self._calls[predicate]
+
+    def record_calls(self, predicate: str, count: int = 1) -> None:
+        with self._lock:
+            self._calls[predicate] += count
+
+    def record_exit(self,
+                    predicate: str,
+                    stage: Stage,
+                    count: int = 1) -> None:
+        with self._lock:
+            self._exits[predicate][stage] += count
+
+    def reset(self) -> None:
+        """
+        Resets all counters.
+        """
+        with self._lock:
+            self._calls.clear()
+            self._exits.clear()
+
+
+#: counters of registered predicates
+stats = Stats()
+#: whether counting is enabled,
+#: predicates' adaptive stages check it before recording their exits
+enabled = False
+_predicates_names = {}
+_previous_profile = None
+_previous_threading_profile = None
+_set_all_threads_profile = getattr(threading, 'setprofile_all_threads', None)
+#: per-thread stacks of ``[code, name, stage]`` of running predicates
+_evaluations = threading.local()
+
+
+def register(name: str, predicate: Callable[..., Any]) -> None:
+    """
+    Registers predicate under given name for counting of its calls.
+    """
+    _predicates_names[predicate.__code__] = name
+
+
+def record_calls(predicate: str, count: int) -> None:
+    """
+    Records calls of the predicate which were evaluated
+    without calling its registered function (e.g. in batches).
+    """
+    stats.record_calls(predicate, count)
+
+
+def record_exit(predicate: str, stage: Stage, count: int = 1) -> None:
+    """
+    Records that evaluation of the predicate ended at given stage.
+
+    Inside a call of a registered predicate the stage is attributed
+    to that call instead.
+    """
+    evaluations = getattr(_evaluations, 'stack', None)
+    if evaluations:
+        evaluation = evaluations[-1]
+        evaluation[2] = max(evaluation[2], stage)
+    else:
+        stats.record_exit(predicate, stage, count)
+
+
+def enable() -> None:
+    """
+    Enables counting.
+    """
+    global _previous_profile, _previous_threading_profile, enabled
+    if enabled:
+        return
+    _previous_profile = sys.getprofile()
+    _evaluations.stack = []
+    if _set_all_threads_profile is None:
+        _previous_threading_profile = getattr(threading, '_profile_hook',
+                                              None)
+        sys.setprofile(_count_call)
+        threading.setprofile(_count_call)
+    else:
+        _set_all_threads_profile(_count_call)
+    enabled = True
+
+
+def disable() -> None:
+    """
+    Disables counting and restores previously installed profile function.
+    """
+    global _previous_profile, _previous_threading_profile, enabled
+    if not enabled:
+        return
+    enabled = False
+    if _set_all_threads_profile is None:
+        threading.setprofile(_previous_threading_profile)
+        sys.setprofile(_previous_profile)
+    else:
+        _set_all_threads_profile(_previous_profile)
+    _previous_profile = _previous_threading_profile = None
+
+
+def _count_call(frame: FrameType, event: str, arg: Any) -> None:
+    previous_profile = _previous_profile
+    if callable(previous_profile):
+        previous_profile(frame, event, arg)
+    if event == 'call':
+        try:
+            name = _predicates_names[frame.f_code]
+        except KeyError:
+            return
+        stats.record_calls(name)
+        try:
+            evaluations = _evaluations.stack
+        except AttributeError:
+            evaluations = _evaluations.stack = []
+        evaluations.append([frame.f_code, name, Stage.FILTER])
+    elif event == 'return':
+        evaluations = getattr(_evaluations, 'stack', None)
+        if evaluations and evaluations[-1][0] is frame.f_code:
+            _, name, stage = evaluations.pop()
+            stats.record_exit(name, stage)
+            if evaluations:
+                evaluations[-1][2] = max(evaluations[-1][2], stage)
@@ -0,0 +1,202 @@
+"""
+Exact summation of floating point numbers.
+
+Finite values are accumulated exactly in expansions,
+values with magnitude not less than ``LARGE_VALUE``
+are accumulated separately scaled down by ``SCALE``,
+so intermediate sums never overflow
+and the exact sum is rounded only once.
+Infinities and NaNs are combined as in plain floating point addition.
+
+>>> exact_sum([1e100, 1., -1e100])
+1.0
+>>> exact_sum([1e308, 1e308, -1e308])
+1e+308
+>>> left, right = ExactAccumulator([1e100, 0.1]), ExactAccumulator([-1e100])
+>>> left.merge(right)
+>>> float(left)
+0.1
+"""
+from fractions import Fraction
+from math import (fsum,
+                  inf,
+                  isfinite)
+from typing import (Iterable,
+                    List)
+
+from .hints import Expansion
+from .utils import (compress_expansion,
+                    sum_expansions)
+
+#: length of expansion after which it gets compressed
+MAX_UNCOMPRESSED_LENGTH = 16
+#: magnitude from which values are accumulated scaled down
+LARGE_VALUE = 2. ** 960
+#: exponent of power of two by which large values are scaled down
+SCALE_EXPONENT = 512
+SCALE = 2. ** -SCALE_EXPONENT
+
+
+def exact_sum(values: Iterable[float]) -> float:
+    """
+    Sums floating point numbers exactly
+    and returns correctly rounded result
+    (infinite if it overflows).
+
+    Same as ``float(ExactAccumulator(values))``.
+
+    >>> exact_sum([0.1] * 10)
+    1.0
+    >>> exact_sum(value for value in (1e16, 1., 1., -1e16))
+    2.0
+    >>> exact_sum([1e308, 1e308])
+    inf
+    >>> exact_sum([float('inf'), 1.])
+    inf
+    """
+    return float(ExactAccumulator(values))
+
+
+class ExactAccumulator:
+    """
+    Accumulates sum of floating point numbers exactly
+    in compressed expansions.
+
+    Iterables are streamed with bounded memory.
+
+    >>> accumulator = ExactAccumulator([1e100, 1.])
+    >>> accumulator.add(-1e100)
+    >>> float(accumulator)
+    1.0
+    >>> accumulator.expansion
+    (1.0,)
+    """
+    __slots__ = '_expansion', '_large_expansion', '_special'
+
+    def __init__(self, values: Iterable[float] = ()) -> None:
+        self._expansion = self._large_expansion = [0.]
+        self._special = 0.
+        self.extend(values)
+
+    @property
+    def expansion(self) -> Expansion:
+        """
+        Returns components of the exact sum
+        in order of increasing magnitude
+        (single infinity or NaN if the sum is not finite
+        or its rounding overflows).
+
+        >>> ExactAccumulator([1., 1e-100]).expansion
+        (1e-100, 1.0)
+        >>> ExactAccumulator([1e308, 1e308]).expansion
+        (inf,)
+        """
+        if self._special:
+            return self._special,
+        elif not any(self._large_expansion):
+            return tuple(self._expansion)
+        return tuple(_to_expansion(self._to_exact()))
+
+    def add(self, value: float) -> None:
+        """
+        Adds value to the sum.
+
+        >>> accumulator = ExactAccumulator()
+        >>> accumulator.add(0.5)
+        >>> float(accumulator)
+        0.5
+        """
+        if -LARGE_VALUE < value < LARGE_VALUE:
+            self._expansion = _add(self._expansion, value)
+        elif isfinite(value):
+            self._large_expansion = _add(self._large_expansion,
+                                         value * SCALE)
+        else:
+            self._special += value
+
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Adds values to the sum.
+
+        >>> accumulator = ExactAccumulator()
+        >>> accumulator.extend(iter([1., 2., 3.]))
+        >>> float(accumulator)
+        6.0
+        """
+        expansion, large_expansion = self._expansion, self._large_expansion
+        special = self._special
+        for value in values:
+            if -LARGE_VALUE < value < LARGE_VALUE:
+                expansion = _add(expansion, value)
+            elif isfinite(value):
+                large_expansion = _add(large_expansion, value * SCALE)
+            else:
+                special += value
+        self._expansion, self._large_expansion = expansion, large_expansion
+        self._special = special
+
+    def merge(self, other: 'ExactAccumulator') -> None:
+        """
+        Adds sum of other accumulator to the sum.
+
+        >>> accumulator = ExactAccumulator([1., 2.])
+        >>> accumulator.merge(ExactAccumulator([3., 4.]))
+        >>> float(accumulator)
+        10.0
+        """
+        self._expansion = compress_expansion(
+                sum_expansions(self._expansion, other._expansion))
+        self._large_expansion = compress_expansion(
+                sum_expansions(self._large_expansion, other._large_expansion))
+        self._special += other._special
+
+    def __float__(self) -> float:
+        """
+        Returns correctly rounded sum.
+
+        >>> float(ExactAccumulator([0.1, 0.2]))
+        0.30000000000000004
+        >>> float(ExactAccumulator([1e308, 1e308, -1e308]))
+        1e+308
+        """
+        if self._special:
+            return self._special
+        elif not any(self._large_expansion):
+            return fsum(self._expansion)
+        return _to_float(self._to_exact())
+
+    def _to_exact(self) -> Fraction:
+        return (sum(map(Fraction, self._expansion))
+                + sum(map(Fraction, self._large_expansion))
+                * 2 ** SCALE_EXPONENT)
+
+
+def _add(expansion: Expansion, value: float) -> Expansion:
+    result = sum_expansions(expansion, [value])
+    return (compress_expansion(result)
+            if len(result) > MAX_UNCOMPRESSED_LENGTH
+            else result)
+
+
+def _to_expansion(value: Fraction) -> List[float]:
+    """
+    Returns expansion of value in order of increasing magnitude
+    by subtracting correctly rounded values until the rest is zero
+    or single infinity if value's rounding overflows.
+    """
+    result = []
+    while value:
+        head = _to_float(value)
+        if not isfinite(head):
+            return [head]
+        result.append(head)
+        value -= Fraction(head)
+    result.reverse()
+    return result or [0.]
+
+
+def _to_float(value: Fraction) -> float:
+    try:
+        return float(value)
+    except OverflowError:
+        return inf if value > 0 else -inf
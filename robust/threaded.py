@@ -0,0 +1,62 @@
+"""
+Batched versions of predicates evaluated in parallel by a pool of threads.
+
+Each thread evaluates a chunk of rows with the serial batched predicate
+and writes results into its own slice of preallocated output,
+so results are identical to the serial call.
+
+Predicates have no mutable module-level state
+(profiling counters are updated under a lock),
+so on free-threaded CPython builds chunks are evaluated in parallel,
+while with the GIL only ``numpy`` array operations overlap.
+
+Requires ``numpy`` to be installed, e.g. with ``robust[vectorized]`` extra.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import (Callable,
+                    Optional,
+                    Tuple)
+
+import numpy as np
+
+from .chunked import ChunkedPredicates
+from .vectorized import PointsArray
+
+#: default number of rows evaluated by a thread at once
+CHUNK_SIZE = 16384
+
+
+def _evaluate_chunks(function: Callable[..., np.ndarray],
+                     points_arrays: Tuple[PointsArray, ...],
+                     result_dtype: np.dtype,
+                     chunk_size: int,
+                     max_workers: Optional[int]) -> np.ndarray:
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    rows_count = len(points_arrays[0])
+    result = np.empty(rows_count,
+                      dtype=result_dtype)
+
+    def evaluate_chunk(start: int) -> None:
+        stop = start + chunk_size
+        result[start:stop] = function(*[points_array[start:stop]
+                                        for points_array in points_arrays])
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        for _ in executor.map(evaluate_chunk,
+                              range(0, rows_count, chunk_size)):
+            pass
+    return result
+
+
+_predicates = ChunkedPredicates(_evaluate_chunks, CHUNK_SIZE)
+#: same as ``robust.chunked.ChunkedPredicates.determinant_many``
+#: with threads as workers (number of processors by default)
+determinant_many = _predicates.determinant_many
+#: same as ``robust.chunked.ChunkedPredicates.orientation_many``
+#: with threads as workers (number of processors by default)
+orientation_many = _predicates.orientation_many
+#: same as ``robust.chunked.ChunkedPredicates.segments_relationship_many``
+#: with threads as workers (number of processors by default)
+segments_relationship_many = _predicates.segments_relationship_many
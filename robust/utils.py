@@ -1,5 +1,12 @@
-from numbers import Real
-from typing import Tuple
+import os
+from fractions import Fraction
+from numbers import (Integral,
+                     Rational,
+                     Real)
+from typing import (List,
+                    Optional,
+                    Sequence,
+                    Tuple)
 
 from . import bounds
 from .hints import (Expansion,
@@ -190,10 +197,73 @@ def scale_expansion(expansion: Expansion, scalar: Real) -> Expansion:
     return result
 
 
-def to_cross_product(minuend_multiplier_x: Real,
-                     minuend_multiplier_y: Real,
-                     subtrahend_multiplier_x: Real,
-                     subtrahend_multiplier_y: Real) -> Expansion:
+def compress_expansion(expansion: Expansion) -> Expansion:
+    """
+    Compresses an expansion into an equal one
+    with possibly fewer and non-adjacent components.
+
+    Empty expansion is compressed into zero one.
+    """
+    if not expansion:
+        return [0.]
+    bottom = len(expansion) - 1
+    accumulator = expansion[bottom]
+    result = list(expansion)
+    for index in range(bottom - 1, -1, -1):
+        element = expansion[index]
+        head = accumulator + element
+        tail = element - (head - accumulator)
+        if tail:
+            result[bottom] = head
+            bottom -= 1
+            accumulator = tail
+        else:
+            accumulator = head
+    top = 0
+    for index in range(bottom + 1, len(result)):
+        element = result[index]
+        head = element + accumulator
+        tail = accumulator - (head - element)
+        if tail:
+            result[top] = tail
+            top += 1
+        accumulator = head
+    result[top] = accumulator
+    del result[top + 1:]
+    return result
+
+
+def multiply_expansions(left: Expansion, right: Expansion) -> Expansion:
+    """
+    Multiplies two expansions with zero components elimination.
+    """
+    left = compress_expansion(left)
+    right = iter(right)
+    result = scale_expansion(left, next(right))
+    for component in right:
+        if component:
+            result = sum_expansions(result, scale_expansion(left, component))
+    return result
+
+
+def dominates(expansion: Expansion, rest_upper_bound: Real) -> bool:
+    """
+    Checks if an expansion is greater in absolute value
+    than the rest of a sum with given upper bound of its absolute value
+    (evaluated in floating point with relative error up to ``4 * epsilon``),
+    so the sign of the sum is the sign of the expansion's head.
+    """
+    head = expansion[-1]
+    head_lower_bound = (abs(head) - 2 * abs(expansion[-2])
+                        if len(expansion) > 1
+                        else abs(head))
+    return head_lower_bound > (1 + 8 * bounds.epsilon) * rest_upper_bound
+
+
+def _composed_to_cross_product(minuend_multiplier_x: Real,
+                               minuend_multiplier_y: Real,
+                               subtrahend_multiplier_x: Real,
+                               subtrahend_multiplier_y: Real) -> Expansion:
     """
     Returns expansion of vectors' planar cross product.
     """
@@ -205,10 +275,201 @@ def to_cross_product(minuend_multiplier_x: Real,
                         subtrahend_head)
 
 
+def _inlined_to_cross_product(minuend_multiplier_x: Real,
+                              minuend_multiplier_y: Real,
+                              subtrahend_multiplier_x: Real,
+                              subtrahend_multiplier_y: Real,
+                              *,
+                              splitter: Real = bounds.splitter) -> Expansion:
+    """
+    Same as ``_composed_to_cross_product``,
+    but with error-free transformations inlined by hand
+    into straight-line code,
+    so any change of either version should be mirrored in the other one.
+    """
+    minuend_head = minuend_multiplier_x * minuend_multiplier_y
+    base = splitter * minuend_multiplier_x
+    minuend_multiplier_x_high = base - (base - minuend_multiplier_x)
+    minuend_multiplier_x_low = minuend_multiplier_x - minuend_multiplier_x_high
+    base = splitter * minuend_multiplier_y
+    minuend_multiplier_y_high = base - (base - minuend_multiplier_y)
+    minuend_multiplier_y_low = minuend_multiplier_y - minuend_multiplier_y_high
+    minuend_tail = (minuend_multiplier_x_low * minuend_multiplier_y_low
+                    - (((minuend_head - minuend_multiplier_x_high
+                         * minuend_multiplier_y_high)
+                        - minuend_multiplier_x_low * minuend_multiplier_y_high)
+                       - minuend_multiplier_x_high * minuend_multiplier_y_low))
+    subtrahend_head = subtrahend_multiplier_y * subtrahend_multiplier_x
+    base = splitter * subtrahend_multiplier_y
+    subtrahend_multiplier_y_high = base - (base - subtrahend_multiplier_y)
+    subtrahend_multiplier_y_low = (subtrahend_multiplier_y
+                                   - subtrahend_multiplier_y_high)
+    base = splitter * subtrahend_multiplier_x
+    subtrahend_multiplier_x_high = base - (base - subtrahend_multiplier_x)
+    subtrahend_multiplier_x_low = (subtrahend_multiplier_x
+                                   - subtrahend_multiplier_x_high)
+    subtrahend_tail = (
+            subtrahend_multiplier_y_low * subtrahend_multiplier_x_low
+            - (((subtrahend_head - subtrahend_multiplier_y_high
+                 * subtrahend_multiplier_x_high)
+                - subtrahend_multiplier_y_low * subtrahend_multiplier_x_high)
+               - subtrahend_multiplier_y_high * subtrahend_multiplier_x_low))
+    mid_head = minuend_tail - subtrahend_tail
+    right_virtual = minuend_tail - mid_head
+    left_virtual = mid_head + right_virtual
+    third_tail = ((minuend_tail - left_virtual)
+                  + (right_virtual - subtrahend_tail))
+    interim_head = minuend_head + mid_head
+    right_virtual = interim_head - minuend_head
+    left_virtual = interim_head - right_virtual
+    interim_tail = ((minuend_head - left_virtual)
+                    + (mid_head - right_virtual))
+    mid_head = interim_tail - subtrahend_head
+    right_virtual = interim_tail - mid_head
+    left_virtual = mid_head + right_virtual
+    second_tail = ((interim_tail - left_virtual)
+                   + (right_virtual - subtrahend_head))
+    head = interim_head + mid_head
+    right_virtual = head - interim_head
+    left_virtual = head - right_virtual
+    first_tail = (interim_head - left_virtual) + (mid_head - right_virtual)
+    return third_tail, second_tail, first_tail, head
+
+
+def to_cross_product_with_tails(minuend_multiplier_x: Real,
+                                minuend_multiplier_x_tail: Real,
+                                minuend_multiplier_y: Real,
+                                minuend_multiplier_y_tail: Real,
+                                subtrahend_multiplier_x: Real,
+                                subtrahend_multiplier_x_tail: Real,
+                                subtrahend_multiplier_y: Real,
+                                subtrahend_multiplier_y_tail: Real
+                                ) -> Expansion:
+    """
+    Returns expansion of vectors' planar cross product
+    with coordinates given as heads with tails.
+    """
+    result = to_cross_product(minuend_multiplier_x, minuend_multiplier_y,
+                              subtrahend_multiplier_x, subtrahend_multiplier_y)
+    has_x_tails = minuend_multiplier_x_tail or subtrahend_multiplier_x_tail
+    has_y_tails = minuend_multiplier_y_tail or subtrahend_multiplier_y_tail
+    if has_x_tails:
+        result = sum_expansions(
+                result, to_cross_product(minuend_multiplier_x_tail,
+                                         minuend_multiplier_y,
+                                         subtrahend_multiplier_x_tail,
+                                         subtrahend_multiplier_y))
+    if has_y_tails:
+        result = sum_expansions(
+                result, to_cross_product(minuend_multiplier_x,
+                                         minuend_multiplier_y_tail,
+                                         subtrahend_multiplier_x,
+                                         subtrahend_multiplier_y_tail))
+    if has_x_tails and has_y_tails:
+        result = sum_expansions(
+                result, to_cross_product(minuend_multiplier_x_tail,
+                                         minuend_multiplier_y_tail,
+                                         subtrahend_multiplier_x_tail,
+                                         subtrahend_multiplier_y_tail))
+    return result
+
+
 def to_perpendicular_point(point: Point) -> Point:
     x, y = point
     return -y, x
 
 
+def to_exact(*values: Real) -> Optional[List[Rational]]:
+    """
+    Returns values with exact arithmetic
+    (integers, including subclasses of ``int`` and ``numpy`` ones,
+    converted to plain ``int``s, other rationals kept as they are)
+    or ``None`` if some of values are not rational.
+
+    >>> to_exact(1, Fraction(1, 2))
+    [1, Fraction(1, 2)]
+    >>> to_exact(True, 2)
+    [1, 2]
+    >>> to_exact(1, 0.5) is None
+    True
+    """
+    result = []
+    for value in values:
+        if type(value) is int or type(value) is Fraction:
+            result.append(value)
+        elif isinstance(value, Integral):
+            result.append(int(value))
+        elif isinstance(value, Rational):
+            result.append(value)
+        else:
+            return None
+    return result
+
+
+def to_exact_differences(*values: Real) -> Optional[List[Rational]]:
+    """
+    Returns differences of consecutive pairs of values
+    (``values[0] - values[1]``, ``values[2] - values[3]`` and so on)
+    evaluated with exact arithmetic
+    or ``None`` if some of values are not rational.
+
+    >>> to_exact_differences(3, 1, Fraction(1, 2), 1)
+    [2, Fraction(-1, 2)]
+    >>> to_exact_differences(3, 1., 2, 1) is None
+    True
+    """
+    values = to_exact(*values)
+    return (None
+            if values is None
+            else [minuend - subtrahend
+                  for minuend, subtrahend in zip(values[::2], values[1::2])])
+
+
+def to_rational_differences(differences: Sequence[Real],
+                            *values: Real) -> Optional[Sequence[Rational]]:
+    """
+    Returns given differences of consecutive pairs of values
+    if all of them are plain ``int``s,
+    differences evaluated with exact arithmetic if all values are rational
+    or ``None`` if some of them are not
+    (checked by type of the first difference at first,
+    so floating point values fall through to filters cheaply).
+
+    >>> to_rational_differences((2, -1), 3, 1, 0, 1)
+    (2, -1)
+    >>> to_rational_differences((2., -1.), 3., 1., 0., 1.) is None
+    True
+    >>> to_rational_differences((Fraction(1, 2),), Fraction(1, 2), 0)
+    [Fraction(1, 2)]
+    """
+    if type(differences[0]) is float:
+        return None
+    for difference in differences:
+        if type(difference) is not int:
+            return to_exact_differences(*values)
+    return differences
+
+
 def to_sign(value: Real) -> int:
     return (1 if value > 0 else -1) if value else 0
+
+
+accelerated = False
+if not os.environ.get('ROBUST_PURE_PYTHON'):
+    try:
+        from ._cutils import accelerate as _accelerate
+    except ImportError:
+        pass
+    else:
+        accelerated = True
+        compress_expansion = _accelerate(compress_expansion)
+        scale_expansion = _accelerate(scale_expansion)
+        split = _accelerate(split)
+        sum_expansions = _accelerate(sum_expansions)
+        two_product = _accelerate(two_product)
+        two_product_presplit = _accelerate(two_product_presplit)
+        two_sum = _accelerate(two_sum)
+        two_two_diff = _accelerate(two_two_diff)
+to_cross_product = (_composed_to_cross_product
+                    if accelerated
+                    else _inlined_to_cross_product)
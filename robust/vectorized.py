@@ -0,0 +1,232 @@
+"""
+Batched versions of predicates over ``numpy`` arrays of points.
+
+Requires ``numpy`` to be installed, e.g. with ``robust[vectorized]`` extra.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from . import (bounds,
+               profiling)
+from .cocircular import (PreparedCircle,
+                         determinant)
+from .linear import (PreparedLine,
+                     segments_relationship)
+from .parallelogram import signed_area_sign
+
+PointsArray = np.ndarray
+SegmentsArray = np.ndarray
+SignsArray = np.ndarray
+ValuesArray = np.ndarray
+
+
+def determinant_many(first_points: PointsArray,
+                     second_points: PointsArray,
+                     third_points: PointsArray,
+                     fourth_points: PointsArray) -> ValuesArray:
+    """
+    Calculates determinants for checking if points lie on the same circle
+    for given ``(N, 2)`` arrays of points
+    with the same meaning as ``robust.cocircular.determinant`` values.
+
+    >>> determinant_many(np.array([[0., 0.], [0., 0.], [0., 0.]]),
+    ...                  np.array([[2., 0.], [2., 0.], [2., 0.]]),
+    ...                  np.array([[2., 2.], [2., 2.], [2., 2.]]),
+    ...                  np.array([[0., 2.], [0., 3.], [0., 1.]]))
+    array([  0., -12.,   4.])
+    """
+    first_points, second_points, third_points, fourth_points = (
+        _to_points_arrays(first_points, second_points, third_points,
+                          fourth_points))
+    first_dx = first_points[:, 0] - fourth_points[:, 0]
+    first_dy = first_points[:, 1] - fourth_points[:, 1]
+    second_dx = second_points[:, 0] - fourth_points[:, 0]
+    second_dy = second_points[:, 1] - fourth_points[:, 1]
+    third_dx = third_points[:, 0] - fourth_points[:, 0]
+    third_dy = third_points[:, 1] - fourth_points[:, 1]
+    first_squared_distance = first_dx * first_dx + first_dy * first_dy
+    second_squared_distance = second_dx * second_dx + second_dy * second_dy
+    third_squared_distance = third_dx * third_dx + third_dy * third_dy
+    first_dx_second_dy = first_dx * second_dy
+    first_dx_third_dy = first_dx * third_dy
+    second_dx_first_dy = second_dx * first_dy
+    second_dx_third_dy = second_dx * third_dy
+    third_dx_first_dy = third_dx * first_dy
+    third_dx_second_dy = third_dx * second_dy
+    result = (first_squared_distance
+              * (second_dx_third_dy - third_dx_second_dy)
+              + second_squared_distance
+              * (third_dx_first_dy - first_dx_third_dy)
+              + third_squared_distance
+              * (first_dx_second_dy - second_dx_first_dy))
+    upper_bound = (first_squared_distance
+                   * (np.abs(second_dx_third_dy) + np.abs(third_dx_second_dy))
+                   + second_squared_distance
+                   * (np.abs(third_dx_first_dy) + np.abs(first_dx_third_dy))
+                   + third_squared_distance
+                   * (np.abs(first_dx_second_dy)
+                      + np.abs(second_dx_first_dy)))
+    error_bound = bounds.to_cocircular_first_error(upper_bound)
+    ambiguous_indices, = np.nonzero(np.abs(result) <= error_bound)
+    if profiling.enabled:
+        _record_filtered('cocircular.determinant',
+                         len(result) - len(ambiguous_indices))
+    for index in ambiguous_indices.tolist():
+        result[index] = determinant(tuple(first_points[index].tolist()),
+                                    tuple(second_points[index].tolist()),
+                                    tuple(third_points[index].tolist()),
+                                    tuple(fourth_points[index].tolist()))
+    return result
+
+
+def orientation_many(first_ray_points: PointsArray,
+                     vertices: PointsArray,
+                     second_ray_points: PointsArray) -> SignsArray:
+    """
+    Returns orientations of angles built on given ``(N, 2)`` arrays of points
+    as an array of signs with the same meaning as values of
+    ``robust.angular.Orientation``.
+
+    >>> orientation_many(np.array([[1., 0.], [1., 0.], [0., 1.]]),
+    ...                  np.zeros((3, 2)),
+    ...                  np.array([[1., 0.], [0., 1.], [1., 0.]]))
+    array([ 0,  1, -1], dtype=int8)
+    """
+    first_ray_points, vertices, second_ray_points = _to_points_arrays(
+            first_ray_points, vertices, second_ray_points)
+    vertices_x, vertices_y = vertices[:, 0], vertices[:, 1]
+    first_ray_points_x = first_ray_points[:, 0]
+    first_ray_points_y = first_ray_points[:, 1]
+    second_ray_points_x = second_ray_points[:, 0]
+    second_ray_points_y = second_ray_points[:, 1]
+    minuend = ((first_ray_points_x - vertices_x)
+               * (second_ray_points_y - vertices_y))
+    subtrahend = ((first_ray_points_y - vertices_y)
+                  * (second_ray_points_x - vertices_x))
+    result = minuend - subtrahend
+    upper_bound = np.abs(minuend) + np.abs(subtrahend)
+    error_bound = bounds.to_signed_measure_first_error(upper_bound)
+    ambiguous_indices, = np.nonzero(
+            (((minuend > 0) & (subtrahend > 0))
+             | ((minuend < 0) & (subtrahend < 0)))
+            & (np.abs(result) < error_bound))
+    signs = np.sign(result).astype(np.int8)
+    if profiling.enabled:
+        _record_filtered('parallelogram.signed_area_sign',
+                         len(result) - len(ambiguous_indices))
+    for index in ambiguous_indices.tolist():
+        vertex = tuple(vertices[index].tolist())
+        signs[index] = signed_area_sign(
+                vertex, tuple(first_ray_points[index].tolist()),
+                vertex, tuple(second_ray_points[index].tolist()))
+    return signs
+
+
+def _segments_relationship_many(left_starts: PointsArray,
+                                left_ends: PointsArray,
+                                right_starts: PointsArray,
+                                right_ends: PointsArray) -> SignsArray:
+    left_starts, left_ends, right_starts, right_ends = _to_points_arrays(
+            left_starts, left_ends, right_starts, right_ends)
+    return np.array([segments_relationship(
+            (tuple(left_start), tuple(left_end)),
+            (tuple(right_start), tuple(right_end)))
+        for left_start, left_end, right_start, right_end in zip(
+                left_starts.tolist(), left_ends.tolist(),
+                right_starts.tolist(), right_ends.tolist())],
+            dtype=np.int8)
+
+
+def _to_circle_signs(circle: PreparedCircle,
+                     points: PointsArray) -> SignsArray:
+    points = _to_points_array(points)
+    (origin_x, origin_y), (x_coefficient, y_coefficient,
+                           squared_distance_coefficient) = (
+        circle.origin, circle.coefficients)
+    if not all(type(value) is float
+               for value in (origin_x, origin_y, x_coefficient, y_coefficient,
+                             squared_distance_coefficient)):
+        return np.array([circle.sign(point) for point in points.tolist()],
+                        dtype=np.int8)
+    dx = points[:, 0] - origin_x
+    dy = points[:, 1] - origin_y
+    x_term = x_coefficient * dx
+    y_term = y_coefficient * dy
+    squared_distance_term = squared_distance_coefficient * (dx * dx + dy * dy)
+    result = x_term + y_term + squared_distance_term
+    upper_bound = (np.abs(x_term) + np.abs(y_term)
+                   + np.abs(squared_distance_term))
+    error_bound = bounds.to_prepared_cocircular_error(upper_bound)
+    ambiguous_indices, = np.nonzero(np.abs(result) <= error_bound)
+    signs = np.sign(result).astype(np.int8)
+    if profiling.enabled:
+        _record_filtered('cocircular.PreparedCircle.sign',
+                         len(result) - len(ambiguous_indices))
+    signs[ambiguous_indices] = [
+        circle.sign(point)
+        for point in map(tuple, points[ambiguous_indices].tolist())]
+    return signs
+
+
+def _to_line_signs(line: PreparedLine, points: PointsArray) -> SignsArray:
+    points = _to_points_array(points)
+    (start_x, start_y), (end_x, end_y) = line.start, line.end
+    if not all(type(coordinate) is float
+               for coordinate in (start_x, start_y, end_x, end_y)):
+        return np.array([line.sign(point) for point in points.tolist()],
+                        dtype=np.int8)
+    minuend = (end_x - start_x) * (points[:, 1] - start_y)
+    subtrahend = (end_y - start_y) * (points[:, 0] - start_x)
+    result = minuend - subtrahend
+    upper_bound = np.abs(minuend) + np.abs(subtrahend)
+    error_bound = bounds.to_signed_measure_first_error(upper_bound)
+    ambiguous_indices, = np.nonzero(
+            (((minuend > 0) & (subtrahend > 0))
+             | ((minuend < 0) & (subtrahend < 0)))
+            & (np.abs(result) < error_bound))
+    signs = np.sign(result).astype(np.int8)
+    if profiling.enabled:
+        _record_filtered('linear.PreparedLine.sign',
+                         len(result) - len(ambiguous_indices))
+    signs[ambiguous_indices] = [
+        line.sign(point)
+        for point in map(tuple, points[ambiguous_indices].tolist())]
+    return signs
+
+
+def _record_filtered(predicate: str, count: int) -> None:
+    profiling.record_calls(predicate, count)
+    profiling.record_exit(predicate, profiling.Stage.FILTER, count)
+
+
+def _to_points_array(points: PointsArray) -> PointsArray:
+    result = np.asarray(points,
+                        dtype=np.float64)
+    if result.ndim != 2 or result.shape[1] != 2:
+        raise ValueError('Points should be given by array '
+                         'with shape (N, 2), but found: {shape}.'
+                         .format(shape=result.shape))
+    return result
+
+
+def _to_points_arrays(*points_arrays: PointsArray
+                      ) -> Tuple[PointsArray, ...]:
+    result = tuple(map(_to_points_array, points_arrays))
+    rows_count = len(result[0])
+    if any(len(points_array) != rows_count for points_array in result):
+        raise ValueError('Arrays should contain the same number of rows, '
+                         'but found: {counts}.'
+                         .format(counts=[len(points_array)
+                                         for points_array in result]))
+    return result
+
+
+def _to_segments_array(segments: SegmentsArray) -> SegmentsArray:
+    result = np.asarray(segments,
+                        dtype=np.float64)
+    if result.ndim != 3 or result.shape[1:] != (2, 2):
+        raise ValueError('Segments should be given by array '
+                         'with shape (N, 2, 2), but found: {shape}.'
+                         .format(shape=result.shape))
+    return result
@@ -1,11 +1,22 @@
+import platform
+import sys
 from pathlib import Path
 
-from setuptools import (find_packages,
+from setuptools import (Extension,
+                        find_packages,
                         setup)
 
 import robust
 
 project_base_url = 'https://github.com/lycantropos/robust/'
+ext_modules = ([Extension('robust._cutils', ['robust/_cutils.c'],
+                          extra_compile_args=([]
+                                              if sys.platform == 'win32'
+                                              else ['-ffp-contract=off']),
+                          optional=True)]
+               if (platform.python_implementation() == 'CPython'
+                   and sys.version_info >= (3, 7))
+               else [])
 
 setup(name=robust.__name__,
       packages=find_packages(exclude=('tests', 'tests.*')),
@@ -28,4 +39,6 @@ setup(name=robust.__name__,
       license='MIT License',
       url=project_base_url,
       download_url=project_base_url + 'archive/master.zip',
-      python_requires='>=3.5')
+      ext_modules=ext_modules,
+      python_requires='>=3.5',
+      extras_require={'vectorized': ['numpy>=1.13']})
@@ -1,7 +1,30 @@
+from functools import partial
+
+from hypothesis import strategies
+
 from tests.strategies import numbers_strategies
+from tests.strategies.literals import to_floats
 from tests.utils import (to_pairs,
                          to_triplets)
 
 points_strategies = numbers_strategies.map(to_pairs)
 points_pairs = points_strategies.flatmap(to_pairs)
 points_triplets = points_strategies.flatmap(to_triplets)
+points_lists_with_indices_triplets = points_strategies.flatmap(
+        partial(strategies.lists,
+                min_size=1)).flatmap(
+        lambda points: strategies.tuples(
+                strategies.just(points),
+                to_triplets(strategies.integers(0, len(points) - 1))))
+int64_points_lists_with_indices_triplets = strategies.lists(
+        to_pairs(strategies.integers(-2 ** 62, 2 ** 62)),
+        min_size=1).flatmap(
+        lambda points: strategies.tuples(
+                strategies.just(points),
+                to_triplets(strategies.integers(0, len(points) - 1))))
+floats_points_lists_with_indices_triplets = strategies.lists(
+        to_pairs(to_floats()),
+        min_size=1).flatmap(
+        lambda points: strategies.tuples(
+                strategies.just(points),
+                to_triplets(strategies.integers(0, len(points) - 1))))
@@ -0,0 +1,75 @@
+from array import array
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+from hypothesis import given
+
+from robust.angular import (Orientation,
+                            orientation,
+                            orientation_at)
+from robust.hints import Point
+from . import strategies
+
+
+@given(strategies.points_lists_with_indices_triplets)
+def test_basic(points_with_indices: Tuple[List[Point],
+                                          Tuple[int, int, int]]) -> None:
+    points, (first_ray_index, vertex_index,
+             second_ray_index) = points_with_indices
+    coordinates = [coordinate for point in points for coordinate in point]
+
+    result = orientation_at(coordinates, first_ray_index, vertex_index,
+                            second_ray_index)
+
+    assert isinstance(result, Orientation)
+
+
+@given(strategies.points_lists_with_indices_triplets)
+def test_orientation(points_with_indices: Tuple[List[Point],
+                                                Tuple[int, int, int]]
+                     ) -> None:
+    points, (first_ray_index, vertex_index,
+             second_ray_index) = points_with_indices
+    coordinates = [coordinate for point in points for coordinate in point]
+
+    result = orientation_at(coordinates, first_ray_index, vertex_index,
+                            second_ray_index)
+
+    assert result is orientation(points[first_ray_index],
+                                 points[vertex_index],
+                                 points[second_ray_index])
+
+
+@given(strategies.floats_points_lists_with_indices_triplets)
+def test_buffer(points_with_indices: Tuple[List[Point],
+                                           Tuple[int, int, int]]) -> None:
+    points, (first_ray_index, vertex_index,
+             second_ray_index) = points_with_indices
+    coordinates = memoryview(array('d', [coordinate
+                                         for point in points
+                                         for coordinate in point]))
+
+    result = orientation_at(coordinates, first_ray_index, vertex_index,
+                            second_ray_index)
+
+    assert result is orientation(points[first_ray_index],
+                                 points[vertex_index],
+                                 points[second_ray_index])
+
+
+@given(strategies.int64_points_lists_with_indices_triplets)
+def test_numpy_integers(points_with_indices: Tuple[List[Point],
+                                                   Tuple[int, int, int]]
+                        ) -> None:
+    points, (first_ray_index, vertex_index,
+             second_ray_index) = points_with_indices
+    coordinates = np.array(points,
+                           dtype=np.int64).ravel()
+
+    result = orientation_at(coordinates, first_ray_index, vertex_index,
+                            second_ray_index)
+
+    assert result is orientation(points[first_ray_index],
+                                 points[vertex_index],
+                                 points[second_ray_index])
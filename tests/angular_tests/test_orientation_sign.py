@@ -0,0 +1,27 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from robust.angular import (orientation,
+                            orientation_sign)
+from robust.hints import Point
+from . import strategies
+
+
+@given(strategies.points_triplets)
+def test_basic(points_triplet: Tuple[Point, Point, Point]) -> None:
+    first_ray_point, vertex, second_ray_point = points_triplet
+
+    result = orientation_sign(first_ray_point, vertex, second_ray_point)
+
+    assert type(result) is int
+    assert result in (-1, 0, 1)
+
+
+@given(strategies.points_triplets)
+def test_orientation(points_triplet: Tuple[Point, Point, Point]) -> None:
+    first_ray_point, vertex, second_ray_point = points_triplet
+
+    result = orientation_sign(first_ray_point, vertex, second_ray_point)
+
+    assert result == orientation(first_ray_point, vertex, second_ray_point)
@@ -0,0 +1,28 @@
+from hypothesis import strategies
+
+from robust import (parallel,
+                    threaded)
+from tests.strategies.literals import to_floats
+from tests.utils import (to_pairs,
+                         to_quadruples,
+                         to_triplets)
+
+floats = to_floats(min_value=-1e10,
+                   max_value=1e10)
+small_integers = strategies.integers(-3, 3).map(float)
+points = to_pairs(floats) | to_pairs(small_integers)
+points_triplets_lists = strategies.lists(to_triplets(points))
+points_quadruples_lists = strategies.lists(to_quadruples(points))
+segments = to_pairs(points)
+segments_pairs_lists = strategies.lists(to_pairs(segments))
+chunks_sizes = strategies.integers(1, 5)
+workers_counts = strategies.none() | strategies.integers(1, 2)
+backends = strategies.sampled_from([parallel, threaded])
+unequal_rows_counts_pairs = (strategies.tuples(strategies.integers(0, 10),
+                                               strategies.integers(0, 10))
+                             .filter(lambda counts: counts[0] != counts[1]))
+invalid_segments_shapes = (strategies.lists(strategies.integers(0, 3),
+                                            max_size=4)
+                           .map(tuple)
+                           .filter(lambda shape: len(shape) != 3
+                                   or shape[1:] != (2, 2)))
@@ -0,0 +1,49 @@
+from types import ModuleType
+from typing import (List,
+                    Optional,
+                    Tuple)
+
+import numpy as np
+from hypothesis import given
+
+from robust import vectorized
+from robust.hints import Point
+from . import strategies
+
+
+@given(strategies.backends, strategies.points_quadruples_lists,
+       strategies.chunks_sizes, strategies.workers_counts)
+def test_basic(backend: ModuleType,
+               points_quadruples: List[Tuple[Point, Point, Point, Point]],
+               chunk_size: int,
+               max_workers: Optional[int]) -> None:
+    result = backend.determinant_many(*_to_arrays(points_quadruples),
+                                      chunk_size=chunk_size,
+                                      max_workers=max_workers)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.float64
+    assert result.shape == (len(points_quadruples),)
+
+
+@given(strategies.backends, strategies.points_quadruples_lists,
+       strategies.chunks_sizes, strategies.workers_counts)
+def test_serial_equivalence(backend: ModuleType,
+                            points_quadruples: List[Tuple[Point, Point, Point,
+                                                          Point]],
+                            chunk_size: int,
+                            max_workers: Optional[int]) -> None:
+    points_arrays = _to_arrays(points_quadruples)
+
+    result = backend.determinant_many(*points_arrays,
+                                      chunk_size=chunk_size,
+                                      max_workers=max_workers)
+
+    assert np.array_equal(result, vectorized.determinant_many(*points_arrays))
+
+
+def _to_arrays(points_quadruples: List[Tuple[Point, Point, Point, Point]]
+               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    return tuple(np.array(points, dtype=np.float64).reshape(-1, 2)
+                 for points in (tuple(zip(*points_quadruples))
+                                or ((), (), (), ())))
@@ -0,0 +1,70 @@
+from types import ModuleType
+from typing import (List,
+                    Optional,
+                    Tuple)
+
+import numpy as np
+import pytest
+from hypothesis import given
+
+from robust import vectorized
+from robust.hints import Point
+from . import strategies
+
+
+@given(strategies.backends, strategies.points_triplets_lists,
+       strategies.chunks_sizes, strategies.workers_counts)
+def test_basic(backend: ModuleType,
+               points_triplets: List[Tuple[Point, Point, Point]],
+               chunk_size: int,
+               max_workers: Optional[int]) -> None:
+    first_ray_points, vertices, second_ray_points = _to_arrays(points_triplets)
+
+    result = backend.orientation_many(first_ray_points, vertices,
+                                      second_ray_points,
+                                      chunk_size=chunk_size,
+                                      max_workers=max_workers)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.int8
+    assert result.shape == (len(points_triplets),)
+
+
+@given(strategies.backends, strategies.points_triplets_lists,
+       strategies.chunks_sizes, strategies.workers_counts)
+def test_serial_equivalence(backend: ModuleType,
+                            points_triplets: List[Tuple[Point, Point, Point]],
+                            chunk_size: int,
+                            max_workers: Optional[int]) -> None:
+    first_ray_points, vertices, second_ray_points = _to_arrays(points_triplets)
+
+    result = backend.orientation_many(first_ray_points, vertices,
+                                      second_ray_points,
+                                      chunk_size=chunk_size,
+                                      max_workers=max_workers)
+
+    assert np.array_equal(result,
+                          vectorized.orientation_many(first_ray_points,
+                                                      vertices,
+                                                      second_ray_points))
+
+
+@given(strategies.backends, strategies.unequal_rows_counts_pairs,
+       strategies.chunks_sizes)
+def test_unequal_rows_counts(backend: ModuleType,
+                             rows_counts: Tuple[int, int],
+                             chunk_size: int) -> None:
+    first_rows_count, second_rows_count = rows_counts
+
+    with pytest.raises(ValueError):
+        backend.orientation_many(np.zeros((first_rows_count, 2)),
+                                 np.zeros((second_rows_count, 2)),
+                                 np.zeros((first_rows_count, 2)),
+                                 chunk_size=chunk_size)
+
+
+def _to_arrays(points_triplets: List[Tuple[Point, Point, Point]]
+               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return tuple(np.array(points, dtype=np.float64).reshape(-1, 2)
+                 for points in (tuple(zip(*points_triplets))
+                                or ((), (), ())))
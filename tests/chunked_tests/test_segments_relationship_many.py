@@ -0,0 +1,81 @@
+from types import ModuleType
+from typing import (List,
+                    Optional,
+                    Tuple)
+
+import numpy as np
+import pytest
+from hypothesis import given
+
+from robust.hints import Segment
+from robust.linear import segments_relationship
+from . import strategies
+
+
+@given(strategies.backends, strategies.segments_pairs_lists,
+       strategies.chunks_sizes, strategies.workers_counts)
+def test_basic(backend: ModuleType,
+               segments_pairs: List[Tuple[Segment, Segment]],
+               chunk_size: int,
+               max_workers: Optional[int]) -> None:
+    left_segments, right_segments = _to_arrays(segments_pairs)
+
+    result = backend.segments_relationship_many(left_segments,
+                                                right_segments,
+                                                chunk_size=chunk_size,
+                                                max_workers=max_workers)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.int8
+    assert result.shape == (len(segments_pairs),)
+
+
+@given(strategies.backends, strategies.segments_pairs_lists,
+       strategies.chunks_sizes, strategies.workers_counts)
+def test_serial_equivalence(backend: ModuleType,
+                            segments_pairs: List[Tuple[Segment, Segment]],
+                            chunk_size: int,
+                            max_workers: Optional[int]) -> None:
+    left_segments, right_segments = _to_arrays(segments_pairs)
+
+    result = backend.segments_relationship_many(left_segments,
+                                                right_segments,
+                                                chunk_size=chunk_size,
+                                                max_workers=max_workers)
+
+    assert result.tolist() == [segments_relationship(*segments_pair)
+                               for segments_pair in segments_pairs]
+
+
+@given(strategies.backends)
+def test_invalid_chunk_size(backend: ModuleType) -> None:
+    with pytest.raises(ValueError):
+        backend.segments_relationship_many(np.zeros((2, 2, 2)),
+                                           np.zeros((2, 2, 2)),
+                                           chunk_size=0)
+
+
+@given(strategies.backends, strategies.unequal_rows_counts_pairs,
+       strategies.chunks_sizes)
+def test_unequal_rows_counts(backend: ModuleType,
+                             rows_counts: Tuple[int, int],
+                             chunk_size: int) -> None:
+    left_rows_count, right_rows_count = rows_counts
+
+    with pytest.raises(ValueError):
+        backend.segments_relationship_many(
+                np.zeros((left_rows_count, 2, 2)),
+                np.zeros((right_rows_count, 2, 2)),
+                chunk_size=chunk_size)
+
+
+@given(strategies.backends, strategies.invalid_segments_shapes)
+def test_invalid_shape(backend: ModuleType, shape: Tuple[int, ...]) -> None:
+    with pytest.raises(ValueError):
+        backend.segments_relationship_many(np.zeros(shape), np.zeros(shape))
+
+
+def _to_arrays(segments_pairs: List[Tuple[Segment, Segment]]
+               ) -> Tuple[np.ndarray, np.ndarray]:
+    return tuple(np.array(segments, dtype=np.float64).reshape(-1, 2, 2)
+                 for segments in (tuple(zip(*segments_pairs)) or ((), ())))
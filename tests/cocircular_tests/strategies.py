@@ -1,4 +1,9 @@
+from functools import partial
+
+from hypothesis import strategies
+
 from tests.strategies import numbers_strategies
+from tests.strategies.literals import to_floats
 from tests.utils import (to_pairs,
                          to_quadruples,
                          to_triplets)
@@ -6,3 +11,26 @@ from tests.utils import (to_pairs,
 points_strategies = numbers_strategies.map(to_pairs)
 points_triplets = points_strategies.flatmap(to_triplets)
 points_quadruples = points_strategies.flatmap(to_quadruples)
+points_triplets_with_points_lists = points_strategies.flatmap(
+        lambda points: strategies.tuples(to_triplets(points),
+                                         strategies.lists(points,
+                                                          max_size=10)))
+exact_numbers_strategies = strategies.sampled_from(
+        [strategies.integers(), strategies.integers(-10 ** 400, 10 ** 400),
+         strategies.fractions(), strategies.booleans()])
+exact_points_quadruples = (exact_numbers_strategies.map(to_pairs)
+                           .flatmap(to_quadruples))
+int64_points_quadruples = to_quadruples(to_pairs(
+        strategies.integers(-2 ** 62, 2 ** 62)))
+points_lists_with_indices_quadruples = points_strategies.flatmap(
+        partial(strategies.lists,
+                min_size=1)).flatmap(
+        lambda points: strategies.tuples(
+                strategies.just(points),
+                to_quadruples(strategies.integers(0, len(points) - 1))))
+floats_points_lists_with_indices_quadruples = strategies.lists(
+        to_pairs(to_floats()),
+        min_size=1).flatmap(
+        lambda points: strategies.tuples(
+                strategies.just(points),
+                to_quadruples(strategies.integers(0, len(points) - 1))))
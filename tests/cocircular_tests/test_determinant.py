@@ -1,6 +1,7 @@
 from itertools import permutations
 from typing import Tuple
 
+import numpy as np
 from hypothesis import given
 
 from robust.cocircular import determinant
@@ -20,6 +21,37 @@ def test_basic(points_quadruple: Tuple[Point, Point, Point, Point]) -> None:
     assert isinstance(result, type(first_point[0]))
 
 
+@given(strategies.exact_points_quadruples)
+def test_exact(points_quadruple: Tuple[Point, Point, Point, Point]) -> None:
+    first_point, second_point, third_point, fourth_point = points_quadruple
+
+    result = determinant(first_point, second_point, third_point, fourth_point)
+
+    fourth_x, fourth_y = fourth_point
+    (first_dx, first_dy), (second_dx, second_dy), (third_dx, third_dy) = [
+        (x - fourth_x, y - fourth_y)
+        for x, y in (first_point, second_point, third_point)]
+    assert result == ((first_dx * first_dx + first_dy * first_dy)
+                      * (second_dx * third_dy - third_dx * second_dy)
+                      - (second_dx * second_dx + second_dy * second_dy)
+                      * (first_dx * third_dy - third_dx * first_dy)
+                      + (third_dx * third_dx + third_dy * third_dy)
+                      * (first_dx * second_dy - second_dx * first_dy))
+
+
+@given(strategies.int64_points_quadruples)
+def test_numpy_integers(points_quadruple: Tuple[Point, Point, Point, Point]
+                        ) -> None:
+    first_point, second_point, third_point, fourth_point = points_quadruple
+
+    result = determinant(*[(np.int64(x), np.int64(y))
+                           for x, y in points_quadruple])
+
+    assert type(result) is int
+    assert result == determinant(first_point, second_point, third_point,
+                                 fourth_point)
+
+
 @given(strategies.points_triplets)
 def test_degenerate_cases(points_triplet: Tuple[Point, Point, Point]) -> None:
     first_point, second_point, third_point = points_triplet
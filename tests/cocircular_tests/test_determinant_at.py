@@ -0,0 +1,42 @@
+from array import array
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from robust.cocircular import (determinant,
+                               determinant_at)
+from robust.hints import Point
+from . import strategies
+
+
+@given(strategies.points_lists_with_indices_quadruples)
+def test_determinant(points_with_indices: Tuple[List[Point],
+                                                Tuple[int, int, int, int]]
+                     ) -> None:
+    points, (first_index, second_index, third_index,
+             fourth_index) = points_with_indices
+    coordinates = [coordinate for point in points for coordinate in point]
+
+    result = determinant_at(coordinates, first_index, second_index,
+                            third_index, fourth_index)
+
+    assert result == determinant(points[first_index], points[second_index],
+                                 points[third_index], points[fourth_index])
+
+
+@given(strategies.floats_points_lists_with_indices_quadruples)
+def test_buffer(points_with_indices: Tuple[List[Point],
+                                           Tuple[int, int, int, int]]
+                ) -> None:
+    points, (first_index, second_index, third_index,
+             fourth_index) = points_with_indices
+    coordinates = memoryview(array('d', [coordinate
+                                         for point in points
+                                         for coordinate in point]))
+
+    result = determinant_at(coordinates, first_index, second_index,
+                            third_index, fourth_index)
+
+    assert result == determinant(points[first_index], points[second_index],
+                                 points[third_index], points[fourth_index])
@@ -0,0 +1,32 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from robust.cocircular import (determinant,
+                               determinant_sign)
+from robust.hints import Point
+from robust.utils import to_sign
+from . import strategies
+
+
+@given(strategies.points_quadruples)
+def test_basic(points_quadruple: Tuple[Point, Point, Point, Point]) -> None:
+    first_point, second_point, third_point, fourth_point = points_quadruple
+
+    result = determinant_sign(first_point, second_point, third_point,
+                              fourth_point)
+
+    assert type(result) is int
+    assert result in (-1, 0, 1)
+
+
+@given(strategies.points_quadruples)
+def test_determinant(points_quadruple: Tuple[Point, Point, Point, Point]
+                     ) -> None:
+    first_point, second_point, third_point, fourth_point = points_quadruple
+
+    result = determinant_sign(first_point, second_point, third_point,
+                              fourth_point)
+
+    assert result == to_sign(determinant(first_point, second_point,
+                                         third_point, fourth_point))
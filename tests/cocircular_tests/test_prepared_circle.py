@@ -0,0 +1,90 @@
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+from hypothesis import given
+
+from robust.cocircular import (PreparedCircle,
+                               determinant_sign)
+from robust.hints import Point
+from robust.utils import to_sign
+from . import strategies
+
+
+@given(strategies.points_triplets)
+def test_points(points_triplet: Tuple[Point, Point, Point]) -> None:
+    result = PreparedCircle(*points_triplet)
+
+    assert result.points == points_triplet
+
+
+@given(strategies.points_triplets)
+def test_origin(points_triplet: Tuple[Point, Point, Point]) -> None:
+    result = PreparedCircle(*points_triplet)
+
+    assert result.origin == points_triplet[0]
+
+
+@given(strategies.exact_points_quadruples)
+def test_coefficients(points_quadruple: Tuple[Point, Point, Point, Point]
+                      ) -> None:
+    first_point, second_point, third_point, fourth_point = points_quadruple
+    circle = PreparedCircle(first_point, second_point, third_point)
+
+    x_coefficient, y_coefficient, squared_distance_coefficient = (
+        circle.coefficients)
+
+    (origin_x, origin_y), (point_x, point_y) = circle.origin, fourth_point
+    dx, dy = point_x - origin_x, point_y - origin_y
+    assert to_sign(x_coefficient * dx + y_coefficient * dy
+                   + squared_distance_coefficient * (dx * dx + dy * dy)) == (
+               determinant_sign(first_point, second_point, third_point,
+                                fourth_point))
+
+
+@given(strategies.points_quadruples)
+def test_sign(points_quadruple: Tuple[Point, Point, Point, Point]) -> None:
+    first_point, second_point, third_point, fourth_point = points_quadruple
+
+    result = PreparedCircle(first_point, second_point,
+                            third_point).sign(fourth_point)
+
+    assert result == determinant_sign(first_point, second_point, third_point,
+                                      fourth_point)
+
+
+@given(strategies.exact_points_quadruples)
+def test_exact_sign(points_quadruple: Tuple[Point, Point, Point, Point]
+                    ) -> None:
+    first_point, second_point, third_point, fourth_point = points_quadruple
+
+    result = PreparedCircle(first_point, second_point,
+                            third_point).sign(fourth_point)
+
+    assert result == determinant_sign(first_point, second_point, third_point,
+                                      fourth_point)
+
+
+@given(strategies.int64_points_quadruples)
+def test_numpy_integers_sign(points_quadruple: Tuple[Point, Point, Point,
+                                                     Point]) -> None:
+    first_point, second_point, third_point, fourth_point = points_quadruple
+
+    result = PreparedCircle(*[(np.int64(x), np.int64(y))
+                              for x, y in points_quadruple[:3]]).sign(
+            (np.int64(fourth_point[0]), np.int64(fourth_point[1])))
+
+    assert result == determinant_sign(first_point, second_point, third_point,
+                                      fourth_point)
+
+
+@given(strategies.points_triplets_with_points_lists)
+def test_classify(points_triplet_with_points: Tuple[Tuple[Point, Point,
+                                                          Point],
+                                                    List[Point]]) -> None:
+    points_triplet, points = points_triplet_with_points
+    circle = PreparedCircle(*points_triplet)
+
+    result = circle.classify(iter(points))
+
+    assert result == [circle.sign(point) for point in points]
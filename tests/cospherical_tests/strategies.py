@@ -0,0 +1,39 @@
+from functools import partial
+from typing import (Sequence,
+                    Tuple)
+
+from hypothesis import strategies
+
+from robust.hints import Point3D
+from tests.strategies import numbers_strategies
+from tests.strategies.literals import to_floats
+from tests.utils import (to_quadruples,
+                         to_triplets,
+                         to_tuples)
+
+points_strategies = numbers_strategies.map(to_triplets)
+points_quadruples = points_strategies.flatmap(to_quadruples)
+points_quintuples = points_strategies.flatmap(partial(to_tuples,
+                                                      size=5))
+sphere_points = ((3, 0, 0), (0, 3, 0), (0, 0, 3), (-3, 0, 0), (0, -3, 0),
+                 (0, 0, -3), (1, 2, 2), (2, 1, -2), (-2, 2, 1), (2, -2, 1))
+
+
+def to_near_cospherical_quintuple(
+        points_with_scale_and_offset: Tuple[Sequence[Point3D], float,
+                                            Point3D]
+) -> Tuple[Point3D, Point3D, Point3D, Point3D, Point3D]:
+    points, scale, offset = points_with_scale_and_offset
+    return tuple(tuple(scale * coordinate + offset_coordinate
+                       for coordinate, offset_coordinate in zip(point, offset))
+                 for point in points)
+
+
+near_cospherical_points_quintuples = (
+    strategies.tuples(strategies.permutations(sphere_points)
+                      .map(lambda points: points[:5]),
+                      to_floats(min_value=1e-5,
+                                max_value=1e5),
+                      to_triplets(to_floats(min_value=-1e5,
+                                            max_value=1e5)))
+    .map(to_near_cospherical_quintuple))
@@ -0,0 +1,46 @@
+from fractions import Fraction
+from itertools import permutations
+from typing import Tuple
+
+from hypothesis import given
+
+from robust.cospherical import determinant
+from robust.hints import Point3D
+from robust.utils import to_sign
+from tests.utils import (is_even_permutation,
+                         permute)
+from . import strategies
+
+
+@given(strategies.points_quintuples)
+def test_basic(points_quintuple: Tuple[Point3D, ...]) -> None:
+    result = determinant(*points_quintuple)
+
+    assert isinstance(result, type(points_quintuple[0][0]))
+
+
+@given(strategies.points_quadruples)
+def test_degenerate_cases(points_quadruple: Tuple[Point3D, Point3D,
+                                                  Point3D, Point3D]) -> None:
+    assert all(not determinant(*points_quadruple, point)
+               for point in points_quadruple)
+
+
+@given(strategies.points_quintuples)
+def test_permutations(points_quintuple: Tuple[Point3D, ...]) -> None:
+    result = determinant(*points_quintuple)
+
+    result_sign = to_sign(result)
+    assert all(to_sign(determinant(*permute(points_quintuple, permutation)))
+               == (result_sign
+                   if is_even_permutation(permutation)
+                   else -result_sign)
+               for permutation in permutations(range(len(points_quintuple))))
+
+
+@given(strategies.near_cospherical_points_quintuples)
+def test_near_cospherical(points_quintuple: Tuple[Point3D, ...]) -> None:
+    result = determinant(*points_quintuple)
+
+    assert to_sign(result) == to_sign(determinant(
+            *[tuple(map(Fraction, point)) for point in points_quintuple]))
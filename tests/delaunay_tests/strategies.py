@@ -0,0 +1,29 @@
+import sys
+from functools import partial
+
+from hypothesis import strategies
+
+from tests.strategies import numbers_strategies
+from tests.strategies.literals import to_floats
+from tests.utils import to_pairs
+
+MAX_FLOAT = sys.float_info.max
+
+points_strategies = ((numbers_strategies
+                      | strategies.just(strategies.integers(-3, 3)))
+                     .map(to_pairs))
+points_lists = points_strategies.flatmap(partial(strategies.lists,
+                                                 max_size=20))
+points_lists_with_points = points_strategies.flatmap(
+        lambda points: strategies.tuples(strategies.lists(points,
+                                                          max_size=20),
+                                         points))
+large_coordinates = to_floats() | strategies.sampled_from([MAX_FLOAT,
+                                                           -MAX_FLOAT,
+                                                           1e308, -1e308,
+                                                           2. ** 960,
+                                                           -2. ** 960])
+large_points_lists = strategies.lists(strategies.tuples(large_coordinates,
+                                                        large_coordinates),
+                                      max_size=100)
+seeds = strategies.integers()
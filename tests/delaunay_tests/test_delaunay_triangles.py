@@ -0,0 +1,67 @@
+from fractions import Fraction
+from typing import List
+
+from hypothesis import given
+
+from robust.angular import (Orientation,
+                            orientation)
+from robust.cocircular import determinant_sign
+from robust.delaunay import delaunay_triangles
+from robust.hints import Point
+from robust.hull import convex_hull
+from . import strategies
+
+
+@given(strategies.points_lists)
+def test_basic(points: List[Point]) -> None:
+    result = delaunay_triangles(points)
+
+    assert isinstance(result, list)
+    assert all(isinstance(triangle, tuple) and len(triangle) == 3
+               for triangle in result)
+    assert all(0 <= vertex < len(points)
+               for triangle in result
+               for vertex in triangle)
+
+
+@given(strategies.points_lists)
+def test_orientation(points: List[Point]) -> None:
+    result = delaunay_triangles(points)
+
+    assert all(orientation(points[second], points[first], points[third])
+               is Orientation.COUNTERCLOCKWISE
+               for first, second, third in result)
+
+
+@given(strategies.points_lists)
+def test_empty_circles(points: List[Point]) -> None:
+    result = delaunay_triangles(points)
+
+    assert all(determinant_sign(points[first], points[second], points[third],
+                                point) <= 0
+               for first, second, third in result
+               for point in points)
+
+
+@given(strategies.points_lists)
+def test_vertices(points: List[Point]) -> None:
+    result = delaunay_triangles(points)
+
+    assert ({points[vertex] for triangle in result for vertex in triangle}
+            == (set(points) if len(convex_hull(points)) > 2 else set()))
+
+
+@given(strategies.points_lists)
+def test_area(points: List[Point]) -> None:
+    result = delaunay_triangles(points)
+
+    assert (sum(to_exact_signed_area([points[vertex] for vertex in triangle])
+                for triangle in result)
+            == to_exact_signed_area(convex_hull(points)))
+
+
+def to_exact_signed_area(vertices: List[Point]) -> Fraction:
+    return sum((Fraction(start_x) * Fraction(end_y)
+                - Fraction(end_x) * Fraction(start_y))
+               for (start_x, start_y), (end_x, end_y)
+               in zip(vertices, vertices[1:] + vertices[:1])) / 2
@@ -0,0 +1,22 @@
+from random import Random
+from typing import List
+
+from hypothesis import given
+
+from robust.delaunay import _to_insertion_order
+from robust.hints import Point
+from . import strategies
+
+
+@given(strategies.points_lists, strategies.seeds)
+def test_basic(points: List[Point], seed: int) -> None:
+    result = _to_insertion_order(points, Random(seed))
+
+    assert sorted(result) == list(range(len(points)))
+
+
+@given(strategies.large_points_lists, strategies.seeds)
+def test_large_coordinates(points: List[Point], seed: int) -> None:
+    result = _to_insertion_order(points, Random(seed))
+
+    assert sorted(result) == list(range(len(points)))
@@ -0,0 +1,48 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from robust.angular import orientation_sign
+from robust.delaunay import (Triangulation,
+                             delaunay_triangles)
+from robust.hints import Point
+from robust.hull import convex_hull
+from robust.linear import segment_contains
+from . import strategies
+
+
+@given(strategies.points_lists)
+def test_points(points: List[Point]) -> None:
+    result = Triangulation(points)
+
+    assert result.points == points
+
+
+@given(strategies.points_lists)
+def test_triangles(points: List[Point]) -> None:
+    result = Triangulation(points)
+
+    assert result.triangles == delaunay_triangles(points)
+
+
+@given(strategies.points_lists_with_points)
+def test_locate(points_with_point: Tuple[List[Point], Point]) -> None:
+    points, point = points_with_point
+    triangulation = Triangulation(points)
+
+    result = triangulation.locate(point)
+
+    assert ((result is None) is not is_inside_hull(convex_hull(points),
+                                                   point)
+            if len(convex_hull(points)) > 2
+            else result is None)
+    assert (result is None
+            or all(orientation_sign(points[end], points[start], point) >= 0
+                   for start, end in zip(result, result[1:] + result[:1])))
+
+
+def is_inside_hull(hull: List[Point], point: Point) -> bool:
+    return all(orientation_sign(end, start, point) > 0
+               or segment_contains((start, end), point)
+               for start, end in zip(hull, hull[1:] + hull[:1]))
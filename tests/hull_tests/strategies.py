@@ -0,0 +1,14 @@
+from functools import partial
+
+from hypothesis import strategies
+
+from tests.strategies import numbers_strategies
+from tests.strategies.literals import to_floats
+from tests.utils import to_pairs
+
+points_strategies = numbers_strategies.map(to_pairs)
+points_lists = points_strategies.flatmap(partial(strategies.lists,
+                                                 max_size=50))
+floats_points_lists = strategies.lists(to_pairs(to_floats()),
+                                       min_size=1,
+                                       max_size=50)
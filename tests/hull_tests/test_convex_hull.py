@@ -0,0 +1,74 @@
+from typing import (List,
+                    Sequence)
+
+import numpy as np
+from hypothesis import given
+
+from robust.angular import (Orientation,
+                            orientation)
+from robust.hints import Point
+from robust.hull import convex_hull
+from tests.utils import is_point
+from . import strategies
+
+
+@given(strategies.points_lists)
+def test_basic(points: List[Point]) -> None:
+    result = convex_hull(points)
+
+    assert isinstance(result, list)
+    assert all(is_point(vertex) for vertex in result)
+
+
+@given(strategies.points_lists)
+def test_vertices(points: List[Point]) -> None:
+    result = convex_hull(points)
+
+    assert len(result) == len(set(result))
+    assert set(result) <= set(points)
+    assert (min(points) == result[0]) if points else not result
+
+
+@given(strategies.points_lists)
+def test_convexity(points: List[Point]) -> None:
+    result = convex_hull(points)
+
+    assert len(result) < 3 or all(
+            orientation(result[index - 1], result[index - 2],
+                        result[index])
+            is Orientation.COUNTERCLOCKWISE
+            for index in range(len(result)))
+
+
+@given(strategies.points_lists)
+def test_containment(points: List[Point]) -> None:
+    result = convex_hull(points)
+
+    assert all(_contains(result, point) for point in points)
+
+
+@given(strategies.floats_points_lists)
+def test_array(points: List[Point]) -> None:
+    result = convex_hull(np.array(points))
+
+    assert result == convex_hull(points)
+
+
+@given(strategies.points_lists)
+def test_permutations(points: List[Point]) -> None:
+    result = convex_hull(points)
+
+    assert result == convex_hull(points[::-1])
+    assert result == convex_hull(sorted(points))
+
+
+def _contains(vertices: Sequence[Point], point: Point) -> bool:
+    if len(vertices) < 3:
+        return (point in vertices
+                or len(vertices) == 2
+                and orientation(vertices[0], point, vertices[1])
+                is Orientation.COLLINEAR
+                and min(vertices) <= point <= max(vertices))
+    return all(orientation(vertices[index], vertices[index - 1], point)
+               is not Orientation.CLOCKWISE
+               for index in range(len(vertices)))
@@ -1,4 +1,5 @@
 from functools import partial
+from itertools import chain
 from numbers import Real
 from operator import ne
 from typing import (Callable,
@@ -117,3 +118,30 @@ segments = segments_strategies.flatmap(identity)
 segments_pairs = (
         segments_strategies.flatmap(to_pairs)
         | segments_strategies.flatmap(to_maybe_intersecting_segments))
+segments_lists = (segments_strategies.flatmap(partial(strategies.lists,
+                                                      max_size=20))
+                  | (strategies.lists(segments_pairs,
+                                      max_size=10)
+                     .map(chain.from_iterable)
+                     .map(list)))
+grid_coordinates_strategies = strategies.sampled_from(
+        [strategies.integers(0, 4),
+         strategies.sampled_from([0., 0.5, 1., 1.5, 1. / 3, 2. / 3])])
+grid_segments_lists = grid_coordinates_strategies.flatmap(
+        lambda coordinates: strategies.lists(
+                coordinates_to_segments(coordinates),
+                max_size=30))
+segments_with_points = (
+        numbers_strategies.flatmap(
+                lambda coordinates: strategies.tuples(
+                        coordinates_to_segments(coordinates),
+                        coordinates_to_points(coordinates)))
+        | segments.flatmap(lambda segment: strategies.tuples(
+                strategies.just(segment), strategies.sampled_from(segment))))
+lines_with_points_lists = numbers_strategies.flatmap(
+        lambda coordinates: strategies.tuples(
+                coordinates_to_segments(coordinates),
+                strategies.lists(coordinates_to_points(coordinates),
+                                 max_size=10)))
+int64_points_triplets = strategies.tuples(
+        *[to_pairs(strategies.integers(-2 ** 62, 2 ** 62))] * 3)
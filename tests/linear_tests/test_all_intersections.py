@@ -0,0 +1,36 @@
+from typing import List
+
+from hypothesis import given
+
+from robust.hints import Segment
+from robust.linear import (all_intersections,
+                           segments_intersections,
+                           segments_relationships)
+from . import strategies
+
+
+@given(strategies.segments_lists)
+def test_basic(segments: List[Segment]) -> None:
+    result = all_intersections(segments)
+
+    assert isinstance(result, dict)
+    assert all(isinstance(intersections, tuple)
+               for intersections in result.values())
+
+
+@given(strategies.segments_lists)
+def test_relationships(segments: List[Segment]) -> None:
+    result = all_intersections(segments)
+
+    assert result.keys() == segments_relationships(segments).keys()
+
+
+@given(strategies.segments_lists)
+def test_pairwise(segments: List[Segment]) -> None:
+    result = all_intersections(segments)
+
+    assert all(intersections
+               == segments_intersections(segments[first_index],
+                                         segments[second_index])
+               for (first_index, second_index),
+               intersections in result.items())
@@ -0,0 +1,61 @@
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+from hypothesis import given
+
+from robust.angular import orientation_sign
+from robust.hints import (Point,
+                          Segment)
+from robust.linear import PreparedLine
+from . import strategies
+
+
+@given(strategies.segments)
+def test_endpoints(segment: Segment) -> None:
+    start, end = segment
+
+    result = PreparedLine(start, end)
+
+    assert result.start is start
+    assert result.end is end
+
+
+@given(strategies.segments_with_points)
+def test_sign(segment_with_point: Tuple[Segment, Point]) -> None:
+    (start, end), point = segment_with_point
+
+    result = PreparedLine(start, end).sign(point)
+
+    assert result == orientation_sign(end, start, point)
+
+
+@given(strategies.int64_points_triplets)
+def test_numpy_integers_sign(points_triplet: Tuple[Point, Point, Point]
+                             ) -> None:
+    start, end, point = points_triplet
+
+    result = PreparedLine(*[(np.int64(x), np.int64(y))
+                            for x, y in (start, end)]).sign(
+            (np.int64(point[0]), np.int64(point[1])))
+
+    assert result == orientation_sign(end, start, point)
+
+
+@given(strategies.segments_with_points)
+def test_sign_reversed(segment_with_point: Tuple[Segment, Point]) -> None:
+    (start, end), point = segment_with_point
+
+    result = PreparedLine(start, end).sign(point)
+
+    assert result == -PreparedLine(end, start).sign(point)
+
+
+@given(strategies.lines_with_points_lists)
+def test_classify(line_with_points: Tuple[Segment, List[Point]]) -> None:
+    (start, end), points = line_with_points
+    line = PreparedLine(start, end)
+
+    result = line.classify(iter(points))
+
+    assert result == [line.sign(point) for point in points]
@@ -0,0 +1,59 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from robust.hints import (Point,
+                          Segment)
+from robust.linear import (PreparedSegment,
+                           SegmentsRelationship,
+                           segment_contains,
+                           segments_intersections,
+                           segments_relationship)
+from tests.utils import reverse_segment
+from . import strategies
+
+
+@given(strategies.segments)
+def test_segment(segment: Segment) -> None:
+    result = PreparedSegment(segment)
+
+    assert result.segment is segment
+
+
+@given(strategies.segments_pairs)
+def test_relationship(segments_pair: Tuple[Segment, Segment]) -> None:
+    left_segment, right_segment = segments_pair
+
+    result = PreparedSegment(left_segment).relationship(right_segment)
+
+    assert isinstance(result, SegmentsRelationship)
+    assert result is segments_relationship(left_segment, right_segment)
+
+
+@given(strategies.segments_pairs)
+def test_relationship_reversed(segments_pair: Tuple[Segment, Segment]
+                               ) -> None:
+    left_segment, right_segment = segments_pair
+
+    result = PreparedSegment(left_segment).relationship(right_segment)
+
+    assert result is PreparedSegment(
+            reverse_segment(left_segment)).relationship(right_segment)
+
+
+@given(strategies.segments_pairs)
+def test_intersections(segments_pair: Tuple[Segment, Segment]) -> None:
+    left_segment, right_segment = segments_pair
+
+    result = PreparedSegment(left_segment).intersections(right_segment)
+
+    assert result == segments_intersections(left_segment, right_segment)
+
+
+@given(strategies.segments_with_points)
+def test_contains(segment_with_point: Tuple[Segment, Point]) -> None:
+    segment, point = segment_with_point
+
+    result = PreparedSegment(segment).contains(point)
+
+    assert result is segment_contains(segment, point)
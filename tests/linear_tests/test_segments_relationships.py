@@ -0,0 +1,54 @@
+from itertools import combinations
+from typing import (Dict,
+                    List,
+                    Tuple)
+
+from hypothesis import given
+
+from robust.hints import Segment
+from robust.linear import (SegmentsRelationship,
+                           segments_relationship,
+                           segments_relationships)
+from . import strategies
+
+
+@given(strategies.segments_lists)
+def test_basic(segments: List[Segment]) -> None:
+    result = segments_relationships(segments)
+
+    assert isinstance(result, dict)
+    assert all(isinstance(first_index, int)
+               and isinstance(second_index, int)
+               and 0 <= first_index < second_index < len(segments)
+               for first_index, second_index in result.keys())
+    assert all(isinstance(relationship, SegmentsRelationship)
+               and relationship is not SegmentsRelationship.NONE
+               for relationship in result.values())
+
+
+@given(strategies.segments_lists)
+def test_pairwise(segments: List[Segment]) -> None:
+    result = segments_relationships(segments)
+
+    assert result == to_pairwise_relationships(segments)
+
+
+@given(strategies.grid_segments_lists)
+def test_degenerate(segments: List[Segment]) -> None:
+    result = segments_relationships(segments)
+
+    assert result == to_pairwise_relationships(segments)
+
+
+def to_pairwise_relationships(segments: List[Segment]
+                              ) -> Dict[Tuple[int, int],
+                                        SegmentsRelationship]:
+    return {
+        (first_index, second_index): relationship
+        for (first_index, second_index), relationship in (
+            ((first_index, second_index),
+             segments_relationship(segments[first_index],
+                                   segments[second_index]))
+            for first_index, second_index in combinations(
+                    range(len(segments)), 2))
+        if relationship is not SegmentsRelationship.NONE}
@@ -0,0 +1,17 @@
+from hypothesis import strategies
+
+from tests.strategies.literals import to_floats
+from tests.utils import (to_pairs,
+                         to_quadruples,
+                         to_triplets)
+
+floats = to_floats(min_value=-1e10,
+                   max_value=1e10)
+small_integers = strategies.integers(-3, 3).map(float)
+points = to_pairs(floats) | to_pairs(small_integers)
+points_triplets_lists = strategies.lists(to_triplets(points))
+points_quadruples_lists = strategies.lists(to_quadruples(points))
+segments = to_pairs(points)
+segments_pairs_lists = strategies.lists(to_pairs(segments))
+windows_sizes = strategies.integers(1, 5)
+suffixes = strategies.sampled_from(['', '.npy'])
@@ -0,0 +1,52 @@
+import os
+import tempfile
+from typing import (List,
+                    Sequence,
+                    Tuple)
+
+import numpy as np
+from hypothesis import given
+
+from robust.hints import Point
+from robust.mapped import (determinant_file,
+                           map_points)
+from robust.vectorized import determinant_many
+from . import strategies
+
+
+@given(strategies.points_quadruples_lists, strategies.windows_sizes,
+       strategies.suffixes)
+def test_serial_equivalence(points_quadruples: List[Tuple[Point, Point, Point,
+                                                          Point]],
+                            window_size: int,
+                            suffix: str) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [_write_points(directory, name, points, suffix)
+                 for name, points in zip(['first', 'second', 'third',
+                                          'fourth'],
+                                         tuple(zip(*points_quadruples))
+                                         or ((), (), (), ()))]
+        output_path = os.path.join(directory, 'result' + suffix)
+
+        result = determinant_file(*paths, output_path,
+                                  window_size=window_size).tolist()
+
+        assert result == determinant_many(
+                *[map_points(path) for path in paths]).tolist()
+        assert result == (np.load(output_path)
+                          if suffix
+                          else np.fromfile(output_path,
+                                           dtype=np.float64)).tolist()
+
+
+def _write_points(directory: str,
+                  name: str,
+                  points: Sequence[Point],
+                  suffix: str) -> str:
+    result = os.path.join(directory, name + suffix)
+    array = np.array(points, dtype=np.float64).reshape(-1, 2)
+    if suffix:
+        np.save(result, array)
+    else:
+        array.tofile(result)
+    return result
@@ -0,0 +1,72 @@
+import os
+import tempfile
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+import pytest
+from hypothesis import given
+
+from robust.hints import Point
+from robust.mapped import (map_points,
+                           map_segments)
+from . import strategies
+
+
+@given(strategies.points_triplets_lists, strategies.suffixes)
+def test_basic(points_triplets: List[Tuple[Point, Point, Point]],
+               suffix: str) -> None:
+    points = [point for triplet in points_triplets for point in triplet]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'points' + suffix)
+        array = np.array(points, dtype=np.float64).reshape(-1, 2)
+        if suffix:
+            np.save(path, array)
+        else:
+            array.tofile(path)
+
+        result = map_points(path)
+
+        assert result.shape == (len(points), 2)
+        assert result.tolist() == array.tolist()
+        del result
+
+
+@pytest.mark.parametrize('shape', [(4,), (2, 3), (1, 2, 2)])
+def test_invalid_npy_shape(shape: Tuple[int, ...]) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'points.npy')
+        np.save(path, np.zeros(shape))
+
+        with pytest.raises(ValueError):
+            map_points(path)
+
+
+@pytest.mark.parametrize('shape', [(4,), (2, 2), (1, 4, 2)])
+def test_invalid_segments_npy_shape(shape: Tuple[int, ...]) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'segments.npy')
+        np.save(path, np.zeros(shape))
+
+        with pytest.raises(ValueError):
+            map_segments(path)
+
+
+@pytest.mark.parametrize('values_count', [1, 3, 5])
+def test_odd_raw_size(values_count: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'points')
+        np.zeros(values_count).tofile(path)
+
+        with pytest.raises(ValueError):
+            map_points(path)
+
+
+@pytest.mark.parametrize('values_count', [2, 6])
+def test_incomplete_raw_segments(values_count: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'segments')
+        np.zeros(values_count).tofile(path)
+
+        with pytest.raises(ValueError):
+            map_segments(path)
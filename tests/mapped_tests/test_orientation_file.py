@@ -0,0 +1,86 @@
+import os
+import tempfile
+from typing import (List,
+                    Sequence,
+                    Tuple)
+
+import numpy as np
+import pytest
+from hypothesis import given
+
+from robust.hints import Point
+from robust.mapped import (map_points,
+                           orientation_file)
+from robust.vectorized import orientation_many
+from . import strategies
+
+
+@given(strategies.points_triplets_lists, strategies.windows_sizes,
+       strategies.suffixes)
+def test_basic(points_triplets: List[Tuple[Point, Point, Point]],
+               window_size: int,
+               suffix: str) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_points_triplets(directory, points_triplets, suffix)
+        output_path = os.path.join(directory, 'result' + suffix)
+
+        result = orientation_file(*paths, output_path,
+                                  window_size=window_size)
+
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.int8
+        assert result.shape == (len(points_triplets),)
+        del result
+
+
+@given(strategies.points_triplets_lists, strategies.windows_sizes,
+       strategies.suffixes)
+def test_serial_equivalence(points_triplets: List[Tuple[Point, Point, Point]],
+                            window_size: int,
+                            suffix: str) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_points_triplets(directory, points_triplets, suffix)
+        output_path = os.path.join(directory, 'result' + suffix)
+
+        result = orientation_file(*paths, output_path,
+                                  window_size=window_size).tolist()
+
+        assert result == orientation_many(
+                *[map_points(path) for path in paths]).tolist()
+        assert result == (np.load(output_path)
+                          if suffix
+                          else np.fromfile(output_path,
+                                           dtype=np.int8)).tolist()
+
+
+def test_rows_counts_mismatch() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [_write_points(directory, name, points, '')
+                 for name, points in [('first', [(0., 0.)]),
+                                      ('vertices', [(0., 0.), (1., 1.)]),
+                                      ('second', [(0., 0.)])]]
+
+        with pytest.raises(ValueError):
+            orientation_file(*paths, os.path.join(directory, 'result'))
+
+
+def _write_points_triplets(directory: str,
+                           points_triplets: List[Tuple[Point, Point, Point]],
+                           suffix: str) -> List[str]:
+    return [_write_points(directory, name, points, suffix)
+            for name, points in zip(['first', 'vertices', 'second'],
+                                    tuple(zip(*points_triplets))
+                                    or ((), (), ()))]
+
+
+def _write_points(directory: str,
+                  name: str,
+                  points: Sequence[Point],
+                  suffix: str) -> str:
+    result = os.path.join(directory, name + suffix)
+    array = np.array(points, dtype=np.float64).reshape(-1, 2)
+    if suffix:
+        np.save(result, array)
+    else:
+        array.tofile(result)
+    return result
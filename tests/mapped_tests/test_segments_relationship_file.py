@@ -0,0 +1,45 @@
+import os
+import tempfile
+from typing import (List,
+                    Sequence,
+                    Tuple)
+
+import numpy as np
+from hypothesis import given
+
+from robust.hints import Segment
+from robust.linear import segments_relationship
+from robust.mapped import segments_relationship_file
+from . import strategies
+
+
+@given(strategies.segments_pairs_lists, strategies.windows_sizes,
+       strategies.suffixes)
+def test_serial_equivalence(segments_pairs: List[Tuple[Segment, Segment]],
+                            window_size: int,
+                            suffix: str) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [_write_segments(directory, name, segments, suffix)
+                 for name, segments in zip(['left', 'right'],
+                                           tuple(zip(*segments_pairs))
+                                           or ((), ()))]
+        output_path = os.path.join(directory, 'result' + suffix)
+
+        result = segments_relationship_file(*paths, output_path,
+                                            window_size=window_size).tolist()
+
+        assert result == [segments_relationship(*segments_pair)
+                          for segments_pair in segments_pairs]
+
+
+def _write_segments(directory: str,
+                    name: str,
+                    segments: Sequence[Segment],
+                    suffix: str) -> str:
+    result = os.path.join(directory, name + suffix)
+    array = np.array(segments, dtype=np.float64).reshape(-1, 2, 2)
+    if suffix:
+        np.save(result, array)
+    else:
+        array.tofile(result)
+    return result
@@ -0,0 +1,40 @@
+from functools import partial
+from typing import Tuple
+
+from hypothesis import strategies
+
+from robust.hints import Point3D
+from tests.strategies import numbers_strategies
+from tests.strategies.literals import to_floats
+from tests.utils import (to_pairs,
+                         to_quadruples,
+                         to_triplets,
+                         to_tuples)
+
+points_strategies = numbers_strategies.map(to_triplets)
+points_quadruples = points_strategies.flatmap(to_quadruples)
+points_sextuples = points_strategies.flatmap(partial(to_tuples,
+                                                     size=6))
+floats_points = to_triplets(to_floats(min_value=-1e10,
+                                      max_value=1e10))
+
+
+def to_near_coplanar_quadruple(
+        points_triplet_with_scales: Tuple[Tuple[Point3D, Point3D, Point3D],
+                                          Tuple[float, float]]
+) -> Tuple[Point3D, Point3D, Point3D, Point3D]:
+    (origin, first_point, second_point), (first_scale, second_scale) = (
+        points_triplet_with_scales)
+    return (origin, first_point, second_point,
+            tuple(origin_coordinate
+                  + first_scale * (first_coordinate - origin_coordinate)
+                  + second_scale * (second_coordinate - origin_coordinate)
+                  for origin_coordinate, first_coordinate, second_coordinate
+                  in zip(origin, first_point, second_point)))
+
+
+near_coplanar_points_quadruples = (
+    strategies.tuples(to_triplets(floats_points),
+                      to_pairs(to_floats(min_value=-10,
+                                         max_value=10)))
+    .map(to_near_coplanar_quadruple))
@@ -0,0 +1,54 @@
+from fractions import Fraction
+from typing import Tuple
+
+from hypothesis import given
+
+from robust.hints import Point3D
+from robust.parallelepiped import signed_volume
+from robust.utils import to_sign
+from . import strategies
+
+
+@given(strategies.points_sextuples)
+def test_basic(points_sextuple: Tuple[Point3D, ...]) -> None:
+    result = signed_volume(*points_sextuple)
+
+    assert isinstance(result, type(points_sextuple[0][0]))
+
+
+@given(strategies.points_quadruples)
+def test_same_segments(points_quadruple: Tuple[Point3D, Point3D,
+                                               Point3D, Point3D]) -> None:
+    first_start, first_end, second_start, second_end = points_quadruple
+
+    assert not signed_volume(first_start, first_end, first_start, first_end,
+                             second_start, second_end)
+
+
+@given(strategies.points_sextuples)
+def test_segments_permutation(points_sextuple: Tuple[Point3D, ...]) -> None:
+    (first_start, first_end, second_start, second_end, third_start,
+     third_end) = points_sextuple
+
+    result = signed_volume(first_start, first_end, second_start, second_end,
+                           third_start, third_end)
+
+    assert result == -signed_volume(second_start, second_end, first_start,
+                                    first_end, third_start, third_end)
+    assert to_sign(result) == to_sign(signed_volume(
+            second_start, second_end, third_start, third_end, first_start,
+            first_end))
+
+
+@given(strategies.near_coplanar_points_quadruples)
+def test_near_coplanar(points_quadruple: Tuple[Point3D, Point3D,
+                                               Point3D, Point3D]) -> None:
+    first_point, second_point, third_point, fourth_point = points_quadruple
+
+    result = signed_volume(fourth_point, first_point, fourth_point,
+                           second_point, fourth_point, third_point)
+
+    assert to_sign(result) == to_sign(signed_volume(
+            *[tuple(map(Fraction, point))
+              for point in (fourth_point, first_point, fourth_point,
+                            second_point, fourth_point, third_point)]))
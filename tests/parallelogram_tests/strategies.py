@@ -1,7 +1,43 @@
+from typing import Tuple
+
+from hypothesis import strategies
+
+from robust.hints import Point
 from tests.strategies import numbers_strategies
+from tests.strategies.literals import to_floats
 from tests.utils import (to_pairs,
                          to_quadruples)
 
 points_strategies = numbers_strategies.map(to_pairs)
 points_pairs = points_strategies.flatmap(to_pairs)
 points_quadruples = points_strategies.flatmap(to_quadruples)
+exact_numbers_strategies = strategies.sampled_from(
+        [strategies.integers(), strategies.integers(-10 ** 400, 10 ** 400),
+         strategies.fractions(), strategies.booleans()])
+exact_points_quadruples = (exact_numbers_strategies.map(to_pairs)
+                           .flatmap(to_quadruples))
+int64_points_quadruples = to_quadruples(to_pairs(
+        strategies.integers(-2 ** 62, 2 ** 62)))
+floats = to_floats(min_value=-1e3,
+                   max_value=1e3)
+scales = to_floats(min_value=-10,
+                   max_value=10)
+
+
+def to_near_collinear_points_quadruple(start_x: float,
+                                       start_y: float,
+                                       end_x: float,
+                                       end_y: float,
+                                       first_scale: float,
+                                       second_scale: float
+                                       ) -> Tuple[Point, Point, Point, Point]:
+    delta_x, delta_y = end_x - start_x, end_y - start_y
+    return ((start_x, start_y), (end_x, end_y),
+            (start_x + first_scale * delta_x, start_y + first_scale * delta_y),
+            (start_x + second_scale * delta_x,
+             start_y + second_scale * delta_y))
+
+
+near_collinear_points_quadruples = strategies.builds(
+        to_near_collinear_points_quadruple, floats, floats, floats, floats,
+        scales, scales)
@@ -0,0 +1,49 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from robust.hints import Point
+from robust.parallelogram import (_composed_adjusted_signed_area,
+                                  _inlined_adjusted_signed_area)
+from robust.utils import to_sign
+from . import strategies
+
+
+def to_arguments(points_quadruple: Tuple[Point, Point, Point, Point]
+                 ) -> Tuple[float, ...]:
+    first_start, first_end, second_start, second_end = points_quadruple
+    (first_start_x, first_start_y), (first_end_x, first_end_y) = (first_start,
+                                                                  first_end)
+    (second_start_x, second_start_y), (second_end_x, second_end_y) = (
+        second_start, second_end)
+    upper_bound = (abs((first_end_x - first_start_x)
+                       * (second_end_y - second_start_y))
+                   + abs((first_end_y - first_start_y)
+                         * (second_end_x - second_start_x)))
+    return (first_start_x, first_start_y, first_end_x, first_end_y,
+            second_start_x, second_start_y, second_end_x, second_end_y,
+            upper_bound)
+
+
+@given(strategies.points_quadruples
+       | strategies.near_collinear_points_quadruples)
+def test_implementations(points_quadruple: Tuple[Point, Point, Point, Point]
+                         ) -> None:
+    arguments = to_arguments(points_quadruple)
+
+    result = _inlined_adjusted_signed_area(*arguments)
+
+    assert result == _composed_adjusted_signed_area(*arguments)
+
+
+@given(strategies.points_quadruples
+       | strategies.near_collinear_points_quadruples)
+def test_sign_only(points_quadruple: Tuple[Point, Point, Point, Point]
+                   ) -> None:
+    arguments = to_arguments(points_quadruple)
+
+    result = _inlined_adjusted_signed_area(*arguments, True)
+
+    assert (to_sign(result)
+            == to_sign(_composed_adjusted_signed_area(*arguments, True))
+            == to_sign(_composed_adjusted_signed_area(*arguments)))
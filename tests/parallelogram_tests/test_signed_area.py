@@ -2,6 +2,7 @@ from itertools import (permutations,
                        product)
 from typing import Tuple
 
+import numpy as np
 from hypothesis import given
 
 from robust.hints import Point
@@ -22,6 +23,35 @@ def test_basic(points_quadruple: Tuple[Point, Point, Point, Point]) -> None:
     assert isinstance(result, type(first_start[0]))
 
 
+@given(strategies.exact_points_quadruples)
+def test_exact(points_quadruple: Tuple[Point, Point, Point, Point]) -> None:
+    first_start, first_end, second_start, second_end = points_quadruple
+
+    result = signed_area(first_start, first_end, second_start, second_end)
+
+    (first_start_x, first_start_y), (first_end_x, first_end_y) = (first_start,
+                                                                  first_end)
+    (second_start_x, second_start_y), (second_end_x, second_end_y) = (
+        second_start, second_end)
+    assert result == ((first_end_x - first_start_x)
+                      * (second_end_y - second_start_y)
+                      - (first_end_y - first_start_y)
+                      * (second_end_x - second_start_x))
+
+
+@given(strategies.int64_points_quadruples)
+def test_numpy_integers(points_quadruple: Tuple[Point, Point, Point, Point]
+                        ) -> None:
+    first_start, first_end, second_start, second_end = points_quadruple
+
+    result = signed_area(*[(np.int64(x), np.int64(y))
+                           for x, y in points_quadruple])
+
+    assert type(result) is int
+    assert result == signed_area(first_start, first_end, second_start,
+                                 second_end)
+
+
 @given(strategies.points_pairs)
 def test_same_endpoints(points_pair: Tuple[Point, Point]) -> None:
     first_start, first_end = points_pair
@@ -0,0 +1,32 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from robust.hints import Point
+from robust.parallelogram import (signed_area,
+                                  signed_area_sign)
+from robust.utils import to_sign
+from . import strategies
+
+
+@given(strategies.points_quadruples)
+def test_basic(points_quadruple: Tuple[Point, Point, Point, Point]) -> None:
+    first_start, first_end, second_start, second_end = points_quadruple
+
+    result = signed_area_sign(first_start, first_end, second_start,
+                              second_end)
+
+    assert type(result) is int
+    assert result in (-1, 0, 1)
+
+
+@given(strategies.points_quadruples)
+def test_signed_area(points_quadruple: Tuple[Point, Point, Point, Point]
+                     ) -> None:
+    first_start, first_end, second_start, second_end = points_quadruple
+
+    result = signed_area_sign(first_start, first_end, second_start,
+                              second_end)
+
+    assert result == to_sign(signed_area(first_start, first_end,
+                                         second_start, second_end))
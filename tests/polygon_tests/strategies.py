@@ -0,0 +1,29 @@
+import sys
+from functools import partial
+
+from hypothesis import strategies
+
+from tests.strategies import numbers_strategies
+from tests.strategies.literals import to_floats
+from tests.utils import to_pairs
+
+MAX_FLOAT = sys.float_info.max
+MIN_FLOAT = sys.float_info.min
+
+points_strategies = numbers_strategies.map(to_pairs)
+polygons = points_strategies.flatmap(partial(strategies.lists,
+                                             max_size=50))
+large_coordinates = to_floats() | strategies.sampled_from([MAX_FLOAT,
+                                                           -MAX_FLOAT,
+                                                           1e308, -1e308,
+                                                           2. ** 960,
+                                                           -2. ** 960])
+large_polygons = strategies.lists(strategies.tuples(large_coordinates,
+                                                    large_coordinates),
+                                  max_size=50)
+tiny_coordinates = (strategies.floats(-MIN_FLOAT ** 0.5, MIN_FLOAT ** 0.5)
+                    | strategies.sampled_from([3e-162, -3e-162,
+                                               1e-162, -1e-162]))
+tiny_polygons = strategies.lists(strategies.tuples(tiny_coordinates,
+                                                   tiny_coordinates),
+                                 max_size=50)
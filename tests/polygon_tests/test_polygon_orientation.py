@@ -0,0 +1,31 @@
+from typing import List
+
+from hypothesis import given
+
+from robust.angular import Orientation
+from robust.hints import Point
+from robust.polygon import polygon_orientation
+from robust.utils import to_sign
+from tests.utils import to_exact_signed_area
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_basic(vertices: List[Point]) -> None:
+    result = polygon_orientation(vertices)
+
+    assert isinstance(result, Orientation)
+
+
+@given(strategies.polygons)
+def test_signed_area(vertices: List[Point]) -> None:
+    result = polygon_orientation(vertices)
+
+    assert result == to_sign(to_exact_signed_area(vertices))
+
+
+@given(strategies.tiny_polygons)
+def test_tiny_coordinates(vertices: List[Point]) -> None:
+    result = polygon_orientation(vertices)
+
+    assert result == to_sign(to_exact_signed_area(vertices))
@@ -0,0 +1,56 @@
+from math import isnan
+from typing import List
+
+from hypothesis import given
+
+from robust.hints import Point
+from robust.polygon import polygon_signed_area
+from robust.utils import to_sign
+from tests.utils import to_exact_signed_area
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_sign(vertices: List[Point]) -> None:
+    result = polygon_signed_area(vertices)
+
+    assert to_sign(result) == to_sign(to_exact_signed_area(vertices))
+
+
+@given(strategies.polygons)
+def test_reversals(vertices: List[Point]) -> None:
+    result = polygon_signed_area(vertices)
+
+    assert to_sign(result) == -to_sign(polygon_signed_area(vertices[::-1]))
+
+
+@given(strategies.polygons)
+def test_rotations(vertices: List[Point]) -> None:
+    result = polygon_signed_area(vertices)
+
+    assert all(to_sign(result)
+               == to_sign(polygon_signed_area(vertices[index:]
+                                              + vertices[:index]))
+               for index in range(1, len(vertices)))
+
+
+@given(strategies.polygons)
+def test_iterator(vertices: List[Point]) -> None:
+    result = polygon_signed_area(iter(vertices))
+
+    assert result == polygon_signed_area(vertices)
+
+
+@given(strategies.large_polygons)
+def test_large_coordinates(vertices: List[Point]) -> None:
+    result = polygon_signed_area(vertices)
+
+    assert not isnan(result)
+    assert to_sign(result) == to_sign(to_exact_signed_area(vertices))
+
+
+@given(strategies.tiny_polygons)
+def test_tiny_coordinates(vertices: List[Point]) -> None:
+    result = polygon_signed_area(vertices)
+
+    assert to_sign(result) in (0, to_sign(to_exact_signed_area(vertices)))
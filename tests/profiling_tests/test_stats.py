@@ -0,0 +1,139 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import (Any,
+                    List,
+                    Tuple)
+
+from hypothesis import given
+
+from robust import profiling
+from robust.angular import orientation_at
+from robust.cocircular import (PreparedCircle,
+                               determinant,
+                               determinant_at,
+                               determinant_sign)
+from robust.hints import Point
+from robust.linear import PreparedLine
+from robust.parallelogram import (signed_area,
+                                  signed_area_sign)
+from tests.utils import pack
+from . import strategies
+
+
+@given(strategies.points_quadruples)
+def test_signed_area(points_quadruple: Tuple[Point, Point, Point, Point]
+                     ) -> None:
+    profiling.stats.reset()
+
+    profiling.enable()
+    try:
+        signed_area(*points_quadruple)
+    finally:
+        profiling.disable()
+
+    counts = profiling.stats['parallelogram.signed_area']
+    assert profiling.stats.calls('parallelogram.signed_area') == 1
+    assert all(count >= 0 for count in counts.values())
+    assert sum(counts.values()) == 1
+
+
+@given(strategies.points_quadruples)
+def test_determinant(points_quadruple: Tuple[Point, Point, Point, Point]
+                     ) -> None:
+    profiling.stats.reset()
+
+    profiling.enable()
+    try:
+        determinant(*points_quadruple)
+    finally:
+        profiling.disable()
+
+    counts = profiling.stats['cocircular.determinant']
+    assert profiling.stats.calls('cocircular.determinant') == 1
+    assert all(count >= 0 for count in counts.values())
+    assert sum(counts.values()) == 1
+
+
+@given(strategies.points_quadruples)
+def test_disabled(points_quadruple: Tuple[Point, Point, Point, Point]
+                  ) -> None:
+    profiling.stats.reset()
+
+    signed_area(*points_quadruple)
+    determinant(*points_quadruple)
+
+    assert not list(profiling.stats)
+    assert all(not count
+               for count in profiling.stats['cocircular.determinant'].values())
+
+
+@given(strategies.points_quadruples_lists)
+def test_threads(points_quadruples: List[Tuple[Point, Point, Point, Point]]
+                 ) -> None:
+    profiling.stats.reset()
+
+    with ThreadPoolExecutor(4) as executor:
+        profiling.enable()
+        try:
+            for _ in executor.map(pack(signed_area), points_quadruples):
+                pass
+        finally:
+            profiling.disable()
+
+    assert (profiling.stats.calls('parallelogram.signed_area')
+            == len(points_quadruples))
+
+
+@given(strategies.points_quadruples)
+def test_entry_points(points_quadruple: Tuple[Point, Point, Point, Point]
+                      ) -> None:
+    first_point, second_point, third_point, fourth_point = points_quadruple
+    coordinates = [coordinate
+                   for point in points_quadruple
+                   for coordinate in point]
+    profiling.stats.reset()
+
+    profiling.enable()
+    try:
+        signed_area_sign(*points_quadruple)
+        orientation_at(coordinates, 0, 1, 2)
+        determinant_sign(*points_quadruple)
+        determinant_at(coordinates, 0, 1, 2, 3)
+        if first_point != second_point:
+            PreparedLine(first_point, second_point).sign(third_point)
+        PreparedCircle(first_point, second_point,
+                       third_point).sign(fourth_point)
+    finally:
+        profiling.disable()
+
+    for name in ['parallelogram.signed_area_sign', 'angular.orientation_at',
+                 'cocircular.determinant_at',
+                 'cocircular.PreparedCircle.sign']:
+        assert profiling.stats.calls(name) == 1
+    for name in profiling.stats:
+        counts = profiling.stats[name]
+        assert all(count >= 0 for count in counts.values())
+        assert sum(counts.values()) == profiling.stats.calls(name)
+
+
+def test_previous_profile() -> None:
+    events = []
+
+    def profile(frame: Any, event: str, arg: Any) -> None:
+        events.append(event)
+
+    profiling.stats.reset()
+    sys.setprofile(profile)
+    try:
+        profiling.enable()
+        try:
+            signed_area((0., 0.), (1., 1.), (0., 0.), (1., 0.))
+        finally:
+            profiling.disable()
+
+        assert sys.getprofile() is profile
+    finally:
+        sys.setprofile(None)
+
+    assert 'call' in events
+    assert profiling.stats.calls('parallelogram.signed_area') == 1
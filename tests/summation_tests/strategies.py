@@ -0,0 +1,33 @@
+import sys
+
+from hypothesis import strategies
+
+from tests.strategies.literals import to_floats
+
+MAX_FLOAT = sys.float_info.max
+
+floats = (to_floats(min_value=-1e300,
+                    max_value=1e300)
+          | strategies.floats(min_value=-1e300,
+                              max_value=1e300)
+          | strategies.sampled_from([0., -0., 1e-320, 5e-324, 1e300,
+                                     -1e300]))
+floats_lists = strategies.lists(floats,
+                                max_size=50)
+floats_lists_pairs = strategies.tuples(floats_lists, floats_lists)
+large_floats = (strategies.floats(min_value=2. ** 959,
+                                  max_value=MAX_FLOAT)
+                | strategies.floats(min_value=-MAX_FLOAT,
+                                    max_value=-2. ** 959)
+                | strategies.sampled_from([MAX_FLOAT, -MAX_FLOAT, 2. ** 960,
+                                           -2. ** 960, 1e308, -1e308]))
+large_floats_lists = strategies.lists(floats | large_floats,
+                                      max_size=50)
+large_floats_lists_pairs = strategies.tuples(large_floats_lists,
+                                             large_floats_lists)
+special_floats = strategies.sampled_from([float('inf'), -float('inf'),
+                                          float('nan')])
+special_floats_lists = strategies.lists(floats | large_floats
+                                        | special_floats,
+                                        min_size=1,
+                                        max_size=50)
@@ -0,0 +1,109 @@
+from fractions import Fraction
+from math import (isfinite,
+                  isnan)
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from robust.summation import (ExactAccumulator,
+                              exact_sum)
+from tests.utils import (is_non_overlapping_expansion,
+                         is_sorted_by_magnitude_expansion,
+                         to_rounded)
+from . import strategies
+
+
+@given(strategies.floats_lists)
+def test_basic(values: List[float]) -> None:
+    result = ExactAccumulator(values)
+
+    assert is_sorted_by_magnitude_expansion(result.expansion,
+                                            zero_eliminated=True)
+    assert is_non_overlapping_expansion(result.expansion)
+
+
+@given(strategies.floats_lists)
+def test_exactness(values: List[float]) -> None:
+    result = ExactAccumulator(values)
+
+    assert (sum(map(Fraction, result.expansion))
+            == sum(map(Fraction, values)))
+
+
+@given(strategies.floats_lists)
+def test_add(values: List[float]) -> None:
+    result = ExactAccumulator()
+
+    for value in values:
+        result.add(value)
+
+    assert is_sorted_by_magnitude_expansion(result.expansion,
+                                            zero_eliminated=True)
+    assert is_non_overlapping_expansion(result.expansion)
+    assert (sum(map(Fraction, result.expansion))
+            == sum(map(Fraction, values)))
+
+
+@given(strategies.floats_lists)
+def test_iterator(values: List[float]) -> None:
+    result = ExactAccumulator(iter(values))
+
+    assert is_sorted_by_magnitude_expansion(result.expansion,
+                                            zero_eliminated=True)
+    assert is_non_overlapping_expansion(result.expansion)
+    assert (sum(map(Fraction, result.expansion))
+            == sum(map(Fraction, values)))
+
+
+@given(strategies.large_floats_lists)
+def test_large_values(values: List[float]) -> None:
+    result = ExactAccumulator()
+
+    for value in values:
+        result.add(value)
+
+    exact = sum(map(Fraction, values))
+    assert float(result) == to_rounded(exact)
+    assert (sum(map(Fraction, result.expansion)) == exact
+            if isfinite(to_rounded(exact))
+            else result.expansion == (to_rounded(exact),))
+
+
+@given(strategies.special_floats_lists)
+def test_special_values(values: List[float]) -> None:
+    result = ExactAccumulator()
+
+    for value in values:
+        result.add(value)
+
+    expected = exact_sum(values)
+    assert (isnan(float(result))
+            if isnan(expected)
+            else float(result) == expected)
+
+
+@given(strategies.floats_lists_pairs)
+def test_merge(values_pair: Tuple[List[float], List[float]]) -> None:
+    left_values, right_values = values_pair
+    result = ExactAccumulator(left_values)
+
+    result.merge(ExactAccumulator(right_values))
+
+    assert is_sorted_by_magnitude_expansion(result.expansion,
+                                            zero_eliminated=True)
+    assert is_non_overlapping_expansion(result.expansion)
+    assert float(result) == float(ExactAccumulator(left_values
+                                                   + right_values))
+
+
+@given(strategies.large_floats_lists_pairs)
+def test_merge_large_values(values_pair: Tuple[List[float], List[float]]
+                            ) -> None:
+    left_values, right_values = values_pair
+    result = ExactAccumulator(left_values)
+
+    result.merge(ExactAccumulator(right_values))
+
+    assert float(result) == to_rounded(sum(map(Fraction,
+                                               left_values + right_values)))
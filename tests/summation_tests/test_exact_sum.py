@@ -0,0 +1,64 @@
+from fractions import Fraction
+from math import (isfinite,
+                  isnan)
+from typing import List
+
+from hypothesis import given
+
+from robust.summation import (ExactAccumulator,
+                              exact_sum)
+from tests.utils import to_rounded
+from . import strategies
+
+
+@given(strategies.floats_lists)
+def test_basic(values: List[float]) -> None:
+    result = exact_sum(values)
+
+    assert isinstance(result, float)
+
+
+@given(strategies.floats_lists)
+def test_correct_rounding(values: List[float]) -> None:
+    result = exact_sum(values)
+
+    assert result == float(sum(map(Fraction, values)))
+
+
+@given(strategies.large_floats_lists)
+def test_large_values(values: List[float]) -> None:
+    result = exact_sum(values)
+
+    assert result == to_rounded(sum(map(Fraction, values)))
+
+
+@given(strategies.special_floats_lists)
+def test_special_values(values: List[float]) -> None:
+    result = exact_sum(values)
+
+    special = sum(value for value in values if not isfinite(value))
+    expected = special or to_rounded(sum(Fraction(value)
+                                         for value in values
+                                         if isfinite(value)))
+    assert isnan(result) if isnan(expected) else result == expected
+
+
+@given(strategies.floats_lists)
+def test_streaming(values: List[float]) -> None:
+    result = exact_sum(iter(values))
+
+    assert result == exact_sum(values)
+
+
+@given(strategies.floats_lists)
+def test_permutation(values: List[float]) -> None:
+    result = exact_sum(values)
+
+    assert result == exact_sum(values[::-1])
+
+
+@given(strategies.large_floats_lists)
+def test_accumulator_equivalence(values: List[float]) -> None:
+    result = exact_sum(values)
+
+    assert result == float(ExactAccumulator(values))
@@ -1,6 +1,8 @@
+from fractions import Fraction
 from functools import partial
 from itertools import (combinations,
                        repeat)
+from math import inf
 from numbers import Real
 from operator import itemgetter
 from types import MappingProxyType
@@ -8,6 +10,7 @@ from typing import (Any,
                     Callable,
                     Dict,
                     Iterable,
+                    List,
                     Sequence,
                     Tuple,
                     TypeVar)
@@ -245,3 +248,17 @@ def is_point(object_: Any) -> bool:
             and len(object_) == 2
             and all(isinstance(coordinate, Real)
                     for coordinate in object_))
+
+
+def to_rounded(value: Fraction) -> float:
+    try:
+        return float(value)
+    except OverflowError:
+        return inf if value > 0 else -inf
+
+
+def to_exact_signed_area(vertices: List[Point]) -> Fraction:
+    return sum((Fraction(start_x) * Fraction(end_y)
+                - Fraction(end_x) * Fraction(start_y))
+               for (start_x, start_y), (end_x, end_y)
+               in zip(vertices, vertices[1:] + vertices[:1])) / 2
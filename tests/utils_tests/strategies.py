@@ -11,6 +11,7 @@ from robust.utils import (split,
                           two_sum)
 from tests.strategies import (numbers_strategies,
                               numbers_strategies_factories)
+from tests.strategies.literals import to_floats
 from tests.utils import (Domain,
                          cleave_in_tuples,
                          combine,
@@ -72,3 +73,16 @@ expansions_pairs = strategies.one_of(
         [numbers_strategies.flatmap(cleave_in_tuples(builder, other_builder))
          for builder, other_builder in product(expansions_builders,
                                                repeat=2)])
+exact_numbers_lists = strategies.lists(strategies.integers()
+                                       | strategies.fractions()
+                                       | strategies.booleans())
+int64s_lists = strategies.lists(strategies.integers(-2 ** 63, 2 ** 63 - 1))
+floats = to_floats()
+exact_numbers_pairs_lists = strategies.lists(
+        strategies.tuples(strategies.integers() | strategies.fractions(),
+                          strategies.integers() | strategies.fractions()),
+        min_size=1)
+int64s_pairs_lists = strategies.lists(
+        strategies.tuples(strategies.integers(-2 ** 62, 2 ** 62 - 1),
+                          strategies.integers(-2 ** 62, 2 ** 62 - 1)),
+        min_size=1)
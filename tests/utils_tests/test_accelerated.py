@@ -0,0 +1,94 @@
+from numbers import Real
+from typing import Tuple
+
+import pytest
+from hypothesis import given
+
+from robust import utils
+from robust.hints import Expansion
+from . import strategies
+
+pytest.importorskip('robust._cutils')
+if not hasattr(utils.two_sum, '__self__'):
+    pytest.skip('pure Python backend is forced',
+                allow_module_level=True)
+
+
+@given(strategies.numbers)
+def test_split(number: Real) -> None:
+    assert utils.split(number) == utils.split.__self__(number)
+
+
+@given(strategies.numbers_pairs)
+def test_two_sum(numbers_pair: Tuple[Real, Real]) -> None:
+    assert (utils.two_sum(*numbers_pair)
+            == utils.two_sum.__self__(*numbers_pair))
+
+
+@given(strategies.numbers_pairs)
+def test_two_product(numbers_pair: Tuple[Real, Real]) -> None:
+    assert (utils.two_product(*numbers_pair)
+            == utils.two_product.__self__(*numbers_pair))
+
+
+@given(strategies.numbers_quadruples)
+def test_two_two_diff(numbers_quadruple: Tuple[Real, Real, Real, Real]
+                      ) -> None:
+    assert (utils.two_two_diff(*numbers_quadruple)
+            == utils.two_two_diff.__self__(*numbers_quadruple))
+
+
+@given(strategies.expansions_pairs)
+def test_sum_expansions(expansions_pair: Tuple[Expansion, Expansion]) -> None:
+    left, right = expansions_pair
+
+    assert (utils.sum_expansions(left, right)
+            == utils.sum_expansions.__self__(left, right))
+
+
+@given(strategies.expansions_pairs)
+def test_compress_expansion(expansions_pair: Tuple[Expansion, Expansion]
+                            ) -> None:
+    expansion = utils.sum_expansions(*expansions_pair)
+
+    assert (utils.compress_expansion(expansion)
+            == utils.compress_expansion.__self__(expansion))
+
+
+@given(strategies.expansions_with_scales)
+def test_scale_expansion(expansion_with_scale: Tuple[Expansion, Real]
+                         ) -> None:
+    expansion, scale = expansion_with_scale
+
+    assert (utils.scale_expansion(expansion, scale)
+            == utils.scale_expansion.__self__(expansion, scale))
+
+
+@given(strategies.numbers_pairs)
+def test_two_product_presplit(numbers_pair: Tuple[Real, Real]) -> None:
+    left, right = numbers_pair
+    right_low, right_high = utils.split(right)
+
+    assert (utils.two_product_presplit(left, right, right_low, right_high)
+            == utils.two_product_presplit.__self__(left, right, right_low,
+                                                   right_high))
+
+
+@given(strategies.numbers_pairs)
+def test_keyword_arguments(numbers_pair: Tuple[Real, Real]) -> None:
+    left, right = numbers_pair
+
+    assert (utils.two_sum(left=left, right=right)
+            == utils.two_sum.__self__(left, right))
+    assert (utils.two_product(left, right=right)
+            == utils.two_product.__self__(left, right))
+    assert (utils.sum_expansions(left=[left], right=[right])
+            == utils.sum_expansions.__self__([left], [right]))
+
+
+def test_documented() -> None:
+    for function in [utils.compress_expansion, utils.scale_expansion,
+                     utils.split, utils.sum_expansions, utils.two_product,
+                     utils.two_product_presplit, utils.two_sum,
+                     utils.two_two_diff]:
+        assert function.__doc__
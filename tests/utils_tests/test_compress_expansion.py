@@ -0,0 +1,40 @@
+from fractions import Fraction
+from typing import Tuple
+
+from hypothesis import given
+
+from robust.hints import Expansion
+from robust.utils import (compress_expansion,
+                          sum_expansions)
+from tests.utils import (is_non_overlapping_expansion,
+                         is_sorted_by_magnitude_expansion)
+from . import strategies
+
+
+@given(strategies.expansions_pairs)
+def test_basic(expansions_pair: Tuple[Expansion, Expansion]) -> None:
+    expansion = sum_expansions(*expansions_pair)
+
+    result = compress_expansion(expansion)
+
+    assert isinstance(result, list)
+    assert result
+    assert all(isinstance(element, type(expansion[0]))
+               for element in result)
+
+
+@given(strategies.expansions_pairs)
+def test_properties(expansions_pair: Tuple[Expansion, Expansion]) -> None:
+    expansion = sum_expansions(*expansions_pair)
+
+    result = compress_expansion(expansion)
+
+    assert len(result) <= len(expansion)
+    assert sum(map(Fraction, result)) == sum(map(Fraction, expansion))
+    assert is_sorted_by_magnitude_expansion(result,
+                                            zero_eliminated=True)
+    assert is_non_overlapping_expansion(result)
+
+
+def test_empty() -> None:
+    assert compress_expansion([]) == [0.]
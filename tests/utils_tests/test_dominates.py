@@ -0,0 +1,33 @@
+from fractions import Fraction
+from numbers import Real
+from typing import Tuple
+
+from hypothesis import given
+
+from robust.hints import Expansion
+from robust.utils import (dominates,
+                          sum_expansions,
+                          to_sign)
+from . import strategies
+
+
+@given(strategies.expansions_pairs, strategies.numbers)
+def test_basic(expansions_pair: Tuple[Expansion, Expansion],
+               rest: Real) -> None:
+    expansion = sum_expansions(*expansions_pair)
+
+    result = dominates(expansion, abs(rest))
+
+    assert isinstance(result, bool)
+
+
+@given(strategies.expansions_pairs, strategies.numbers)
+def test_sign(expansions_pair: Tuple[Expansion, Expansion],
+              rest: Real) -> None:
+    expansion = sum_expansions(*expansions_pair)
+
+    result = dominates(expansion, abs(rest))
+
+    assert (not result
+            or (to_sign(sum(map(Fraction, expansion)) + Fraction(rest))
+                == to_sign(expansion[-1])))
@@ -3,7 +3,9 @@ from typing import Tuple
 
 from hypothesis import given
 
-from robust.utils import to_cross_product
+from robust.utils import (_composed_to_cross_product,
+                          _inlined_to_cross_product,
+                          to_cross_product)
 from tests.utils import (is_non_overlapping_expansion,
                          is_sorted_by_magnitude_expansion)
 from . import strategies
@@ -35,3 +37,11 @@ def test_properties(numbers_quadruple: Tuple[Real, Real, Real, Real]
 
     assert is_sorted_by_magnitude_expansion(result)
     assert is_non_overlapping_expansion(result)
+
+
+@given(strategies.numbers_quadruples)
+def test_implementations(numbers_quadruple: Tuple[Real, Real, Real, Real]
+                         ) -> None:
+    result = _inlined_to_cross_product(*numbers_quadruple)
+
+    assert result == _composed_to_cross_product(*numbers_quadruple)
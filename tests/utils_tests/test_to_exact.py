@@ -0,0 +1,34 @@
+from fractions import Fraction
+from typing import List
+
+import numpy as np
+from hypothesis import given
+
+from robust.hints import Real
+from robust.utils import to_exact
+from . import strategies
+
+
+@given(strategies.exact_numbers_lists)
+def test_basic(numbers: List[Real]) -> None:
+    result = to_exact(*numbers)
+
+    assert isinstance(result, list)
+    assert all(type(element) is int or isinstance(element, Fraction)
+               for element in result)
+    assert result == numbers
+
+
+@given(strategies.int64s_lists)
+def test_numpy_integers(numbers: List[int]) -> None:
+    result = to_exact(*map(np.int64, numbers))
+
+    assert all(type(element) is int for element in result)
+    assert result == numbers
+
+
+@given(strategies.exact_numbers_lists, strategies.floats)
+def test_inexact(numbers: List[Real], number: float) -> None:
+    result = to_exact(*numbers, number)
+
+    assert result is None
@@ -0,0 +1,49 @@
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+from hypothesis import given
+
+from robust.hints import Real
+from robust.utils import to_rational_differences
+from . import strategies
+
+
+@given(strategies.exact_numbers_pairs_lists)
+def test_basic(pairs: List[Tuple[Real, Real]]) -> None:
+    differences = [minuend - subtrahend for minuend, subtrahend in pairs]
+
+    result = to_rational_differences(differences,
+                                     *[value
+                                       for pair in pairs
+                                       for value in pair])
+
+    assert list(result) == differences
+
+
+@given(strategies.int64s_pairs_lists)
+def test_numpy_integers(pairs: List[Tuple[int, int]]) -> None:
+    pairs = [(np.int64(minuend), np.int64(subtrahend))
+             for minuend, subtrahend in pairs]
+    differences = [minuend - subtrahend for minuend, subtrahend in pairs]
+
+    result = to_rational_differences(differences,
+                                     *[value
+                                       for pair in pairs
+                                       for value in pair])
+
+    assert all(type(element) is int for element in result)
+    assert result == differences
+
+
+@given(strategies.exact_numbers_pairs_lists, strategies.floats)
+def test_inexact(pairs: List[Tuple[Real, Real]], number: float) -> None:
+    pairs = pairs + [(number, 0)]
+    differences = [minuend - subtrahend for minuend, subtrahend in pairs]
+
+    result = to_rational_differences(differences,
+                                     *[value
+                                       for pair in pairs
+                                       for value in pair])
+
+    assert result is None
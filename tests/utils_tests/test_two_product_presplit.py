@@ -0,0 +1,29 @@
+from numbers import Real
+from typing import Tuple
+
+from hypothesis import given
+
+from robust.utils import (split,
+                          two_product,
+                          two_product_presplit)
+from . import strategies
+
+
+@given(strategies.numbers_pairs)
+def test_basic(numbers_pair: Tuple[Real, Real]) -> None:
+    left, right = numbers_pair
+
+    result = two_product_presplit(left, right, *split(right))
+
+    assert isinstance(result, tuple)
+    assert len(result) == 2
+    assert all(isinstance(element, type(left)) for element in result)
+
+
+@given(strategies.numbers_pairs)
+def test_two_product(numbers_pair: Tuple[Real, Real]) -> None:
+    left, right = numbers_pair
+
+    result = two_product_presplit(left, right, *split(right))
+
+    assert result == two_product(left, right)
@@ -0,0 +1,89 @@
+import math
+from operator import ne
+from typing import (List,
+                    Tuple)
+
+from hypothesis import strategies
+
+from robust.hints import Point
+from tests.strategies.literals import to_floats
+from tests.utils import (pack,
+                         to_pairs,
+                         to_quadruples,
+                         to_triplets)
+
+floats = to_floats(min_value=-1e10,
+                   max_value=1e10)
+points = to_pairs(floats)
+
+
+def to_near_collinear_triplet(points_pair_with_scale: Tuple[Tuple[Point,
+                                                                  Point],
+                                                            float]
+                              ) -> Tuple[Point, Point, Point]:
+    (start, end), scale = points_pair_with_scale
+    (start_x, start_y), (end_x, end_y) = start, end
+    return start, (start_x + scale * (end_x - start_x),
+                   start_y + scale * (end_y - start_y)), end
+
+
+near_collinear_points_triplets = (
+    strategies.tuples(to_pairs(points),
+                      to_floats(min_value=-10,
+                                max_value=10))
+    .map(to_near_collinear_triplet))
+points_triplets_lists = strategies.lists(to_triplets(points)
+                                         | near_collinear_points_triplets)
+
+
+def to_line_with_points(points_pair_with_scales: Tuple[Tuple[Point, Point],
+                                                       List[float]]
+                        ) -> Tuple[Tuple[Point, Point], List[Point]]:
+    (start, end), scales = points_pair_with_scales
+    (start_x, start_y), (end_x, end_y) = start, end
+    return (start, end), [(start_x + scale * (end_x - start_x),
+                           start_y + scale * (end_y - start_y))
+                          for scale in scales]
+
+
+lines = to_pairs(points).filter(pack(ne))
+lines_with_points_lists = (
+    strategies.tuples(lines, strategies.lists(points))
+    | (strategies.tuples(lines, strategies.lists(to_floats(min_value=-10,
+                                                           max_value=10)))
+       .map(to_line_with_points)))
+
+
+def to_near_cocircular_quadruple(
+        circle_with_angles: Tuple[Point, float,
+                                  Tuple[float, float, float, float]]
+) -> Tuple[Point, Point, Point, Point]:
+    (center_x, center_y), radius, angles = circle_with_angles
+    return tuple((center_x + radius * math.cos(angle),
+                  center_y + radius * math.sin(angle))
+                 for angle in angles)
+
+
+near_cocircular_points_quadruples = (
+    strategies.tuples(points,
+                      to_floats(min_value=1e-3,
+                                max_value=1e3),
+                      to_quadruples(to_floats(min_value=-math.pi,
+                                              max_value=math.pi)))
+    .map(to_near_cocircular_quadruple))
+points_quadruples_lists = strategies.lists(to_quadruples(points)
+                                           | near_cocircular_points_quadruples)
+points_triplets_with_points_lists = (
+    strategies.tuples(to_triplets(points), strategies.lists(points))
+    | (strategies.lists(near_cocircular_points_quadruples,
+                        min_size=1)
+       .map(lambda quadruples: (quadruples[0][:3],
+                                [quadruple[3] for quadruple in quadruples]))))
+unequal_rows_counts_pairs = (strategies.tuples(strategies.integers(0, 10),
+                                               strategies.integers(0, 10))
+                             .filter(lambda counts: counts[0] != counts[1]))
+invalid_points_shapes = (strategies.lists(strategies.integers(0, 3),
+                                          max_size=3)
+                         .map(tuple)
+                         .filter(lambda shape: len(shape) != 2
+                                 or shape[1] != 2))
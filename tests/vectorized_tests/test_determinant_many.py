@@ -0,0 +1,64 @@
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+import pytest
+from hypothesis import given
+
+from robust.cocircular import determinant
+from robust.hints import Point
+from robust.vectorized import determinant_many
+from . import strategies
+
+
+@given(strategies.points_quadruples_lists)
+def test_basic(points_quadruples: List[Tuple[Point, Point, Point, Point]]
+               ) -> None:
+    first_points, second_points, third_points, fourth_points = _to_arrays(
+            points_quadruples)
+
+    result = determinant_many(first_points, second_points, third_points,
+                              fourth_points)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.float64
+    assert result.shape == (len(points_quadruples),)
+
+
+@given(strategies.points_quadruples_lists)
+def test_scalar_equivalence(points_quadruples: List[Tuple[Point, Point,
+                                                          Point, Point]]
+                            ) -> None:
+    first_points, second_points, third_points, fourth_points = _to_arrays(
+            points_quadruples)
+
+    result = determinant_many(first_points, second_points, third_points,
+                              fourth_points)
+
+    assert result.tolist() == [determinant(*points_quadruple)
+                               for points_quadruple in points_quadruples]
+
+
+@given(strategies.unequal_rows_counts_pairs)
+def test_unequal_rows_counts(rows_counts: Tuple[int, int]) -> None:
+    first_rows_count, second_rows_count = rows_counts
+
+    with pytest.raises(ValueError):
+        determinant_many(np.zeros((first_rows_count, 2)),
+                         np.zeros((second_rows_count, 2)),
+                         np.zeros((first_rows_count, 2)),
+                         np.zeros((first_rows_count, 2)))
+
+
+@given(strategies.invalid_points_shapes)
+def test_invalid_shape(shape: Tuple[int, ...]) -> None:
+    with pytest.raises(ValueError):
+        determinant_many(np.zeros(shape), np.zeros(shape), np.zeros(shape),
+                         np.zeros(shape))
+
+
+def _to_arrays(points_quadruples: List[Tuple[Point, Point, Point, Point]]
+               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    return tuple(np.array(points, dtype=np.float64).reshape(-1, 2)
+                 for points in (tuple(zip(*points_quadruples))
+                                or ((),) * 4))
@@ -0,0 +1,68 @@
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+import pytest
+from hypothesis import given
+
+from robust.angular import orientation
+from robust.hints import Point
+from robust.vectorized import orientation_many
+from . import strategies
+
+
+@given(strategies.points_triplets_lists)
+def test_basic(points_triplets: List[Tuple[Point, Point, Point]]) -> None:
+    first_ray_points, vertices, second_ray_points = _to_arrays(points_triplets)
+
+    result = orientation_many(first_ray_points, vertices, second_ray_points)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.int8
+    assert result.shape == (len(points_triplets),)
+
+
+@given(strategies.points_triplets_lists)
+def test_scalar_equivalence(points_triplets: List[Tuple[Point, Point, Point]]
+                            ) -> None:
+    first_ray_points, vertices, second_ray_points = _to_arrays(points_triplets)
+
+    result = orientation_many(first_ray_points, vertices, second_ray_points)
+
+    assert result.tolist() == [orientation(*points_triplet)
+                               for points_triplet in points_triplets]
+
+
+@given(strategies.points_triplets_lists)
+def test_permutation(points_triplets: List[Tuple[Point, Point, Point]]
+                     ) -> None:
+    first_ray_points, vertices, second_ray_points = _to_arrays(points_triplets)
+
+    result = orientation_many(first_ray_points, vertices, second_ray_points)
+
+    assert np.array_equal(result, -orientation_many(second_ray_points,
+                                                    vertices,
+                                                    first_ray_points))
+
+
+@given(strategies.unequal_rows_counts_pairs)
+def test_unequal_rows_counts(rows_counts: Tuple[int, int]) -> None:
+    first_rows_count, second_rows_count = rows_counts
+
+    with pytest.raises(ValueError):
+        orientation_many(np.zeros((first_rows_count, 2)),
+                         np.zeros((second_rows_count, 2)),
+                         np.zeros((first_rows_count, 2)))
+
+
+@given(strategies.invalid_points_shapes)
+def test_invalid_shape(shape: Tuple[int, ...]) -> None:
+    with pytest.raises(ValueError):
+        orientation_many(np.zeros(shape), np.zeros(shape), np.zeros(shape))
+
+
+def _to_arrays(points_triplets: List[Tuple[Point, Point, Point]]
+               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return tuple(np.array(points, dtype=np.float64).reshape(-1, 2)
+                 for points in (tuple(zip(*points_triplets))
+                                or ((), (), ())))
@@ -0,0 +1,40 @@
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+from hypothesis import given
+
+from robust.cocircular import PreparedCircle
+from robust.hints import Point
+from . import strategies
+
+
+@given(strategies.points_triplets_with_points_lists)
+def test_basic(points_triplet_with_points: Tuple[Tuple[Point, Point, Point],
+                                                 List[Point]]) -> None:
+    points_triplet, points = points_triplet_with_points
+    circle = PreparedCircle(*points_triplet)
+
+    result = circle.classify(_to_array(points))
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.int8
+    assert result.shape == (len(points),)
+
+
+@given(strategies.points_triplets_with_points_lists)
+def test_scalar_equivalence(points_triplet_with_points: Tuple[Tuple[Point,
+                                                                    Point,
+                                                                    Point],
+                                                              List[Point]]
+                            ) -> None:
+    points_triplet, points = points_triplet_with_points
+    circle = PreparedCircle(*points_triplet)
+
+    result = circle.classify(_to_array(points))
+
+    assert result.tolist() == [circle.sign(point) for point in points]
+
+
+def _to_array(points: List[Point]) -> np.ndarray:
+    return np.array(points, dtype=np.float64).reshape(-1, 2)
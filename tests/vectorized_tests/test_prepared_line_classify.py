@@ -0,0 +1,37 @@
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+from hypothesis import given
+
+from robust.hints import Point
+from robust.linear import PreparedLine
+from . import strategies
+
+
+@given(strategies.lines_with_points_lists)
+def test_basic(line_with_points: Tuple[Tuple[Point, Point], List[Point]]
+               ) -> None:
+    (start, end), points = line_with_points
+    line = PreparedLine(start, end)
+
+    result = line.classify(_to_array(points))
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.int8
+    assert result.shape == (len(points),)
+
+
+@given(strategies.lines_with_points_lists)
+def test_scalar_equivalence(line_with_points: Tuple[Tuple[Point, Point],
+                                                    List[Point]]) -> None:
+    (start, end), points = line_with_points
+    line = PreparedLine(start, end)
+
+    result = line.classify(_to_array(points))
+
+    assert result.tolist() == [line.sign(point) for point in points]
+
+
+def _to_array(points: List[Point]) -> np.ndarray:
+    return np.array(points, dtype=np.float64).reshape(-1, 2)
@@ -0,0 +1,90 @@
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+from hypothesis import given
+
+from robust import profiling
+from robust.cocircular import PreparedCircle
+from robust.hints import Point
+from robust.linear import PreparedLine
+from robust.vectorized import (determinant_many,
+                               orientation_many)
+from . import strategies
+
+
+@given(strategies.points_triplets_lists)
+def test_orientation_many(points_triplets: List[Tuple[Point, Point, Point]]
+                          ) -> None:
+    profiling.stats.reset()
+
+    profiling.enable()
+    try:
+        orientation_many(*_to_arrays(points_triplets, 3))
+    finally:
+        profiling.disable()
+
+    _assert_consistent('parallelogram.signed_area_sign',
+                       len(points_triplets))
+
+
+@given(strategies.points_quadruples_lists)
+def test_determinant_many(points_quadruples: List[Tuple[Point, Point, Point,
+                                                        Point]]) -> None:
+    profiling.stats.reset()
+
+    profiling.enable()
+    try:
+        determinant_many(*_to_arrays(points_quadruples, 4))
+    finally:
+        profiling.disable()
+
+    _assert_consistent('cocircular.determinant', len(points_quadruples))
+
+
+@given(strategies.lines_with_points_lists)
+def test_prepared_line_classify(line_with_points: Tuple[Tuple[Point, Point],
+                                                        List[Point]]) -> None:
+    (start, end), points = line_with_points
+    line = PreparedLine(start, end)
+    profiling.stats.reset()
+
+    profiling.enable()
+    try:
+        line.classify(np.array(points, dtype=np.float64).reshape(-1, 2))
+    finally:
+        profiling.disable()
+
+    _assert_consistent('linear.PreparedLine.sign', len(points))
+
+
+@given(strategies.points_triplets_with_points_lists)
+def test_prepared_circle_classify(
+        points_triplet_with_points: Tuple[Tuple[Point, Point, Point],
+                                          List[Point]]) -> None:
+    points_triplet, points = points_triplet_with_points
+    circle = PreparedCircle(*points_triplet)
+    profiling.stats.reset()
+
+    profiling.enable()
+    try:
+        circle.classify(np.array(points, dtype=np.float64).reshape(-1, 2))
+    finally:
+        profiling.disable()
+
+    _assert_consistent('cocircular.PreparedCircle.sign', len(points))
+
+
+def _assert_consistent(predicate: str, calls_count: int) -> None:
+    assert profiling.stats.calls(predicate) == calls_count
+    for name in profiling.stats:
+        counts = profiling.stats[name]
+        assert all(count >= 0 for count in counts.values())
+        assert sum(counts.values()) == profiling.stats.calls(name)
+
+
+def _to_arrays(points_tuples: List[Tuple[Point, ...]],
+               points_count: int) -> List[np.ndarray]:
+    return [np.array(points, dtype=np.float64).reshape(-1, 2)
+            for points in (tuple(zip(*points_tuples))
+                           or ((),) * points_count)]